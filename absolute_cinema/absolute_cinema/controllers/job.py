@@ -0,0 +1,181 @@
+import os
+import time
+import uuid
+import asyncio
+import logging
+from absolute_cinema.models.movie import Movie
+from absolute_cinema.models.job import ScoreJobRequest
+from absolute_cinema.controllers.movie import MovieController, MAX_COMMENTS
+from absolute_cinema.internals.store import store
+
+logger = logging.getLogger(__name__)
+
+# Número de análises em segundo plano executadas ao mesmo tempo
+JOB_CONCURRENCY = int(os.getenv("JOB_CONCURRENCY", "2"))
+# Número máximo de jobs aguardando na fila
+JOB_QUEUE_MAX = int(os.getenv("JOB_QUEUE_MAX", "100"))
+
+
+class JobQueueFullError(Exception):
+    """Erro quando a fila de jobs atingiu o limite"""
+    pass
+
+
+class JobScheduler:
+    """
+    Executa análises de filmes em segundo plano, dentro do próprio processo
+
+    Os jobs ficam gravados no SQLite: ao reiniciar, os que estavam na fila ou
+    em execução voltam para a fila.
+    """
+
+    def __init__(self, concurrency: int, max_queue: int):
+        """
+        Args:
+            concurrency: Número de workers (análises simultâneas)
+            max_queue: Número máximo de jobs aguardando execução
+        """
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self._queue = asyncio.Queue()
+        self._workers = []
+
+    async def start(self) -> None:
+        """Retoma os jobs pendentes e inicia os workers (startup da aplicação)"""
+        pending = await asyncio.to_thread(store.get_unfinished_jobs)
+        for job in pending:
+            job['status'] = 'queued'
+            job['started_at'] = None
+            await asyncio.to_thread(store.save_job, job)
+            self._queue.put_nowait(job['job_id'])
+        if pending:
+            logger.info("%d jobs pendentes retomados", len(pending))
+
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.concurrency)]
+
+    async def stop(self) -> None:
+        """Interrompe os workers (shutdown da aplicação); jobs em execução são retomados no próximo start"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(self, request: ScoreJobRequest) -> dict:
+        """
+        Enfileira uma análise
+
+        Args:
+            request: Filme e número de comentários a analisar
+
+        Returns:
+            dict: Job criado, no formato do modelo Job
+
+        Raises:
+            JobQueueFullError: Se a fila estiver cheia
+            ValueError: Se o nome do filme estiver vazio
+        """
+        if not request.name or request.name.strip() == "":
+            raise ValueError("Nome do filme não pode estar vazio")
+        if self._queue.qsize() >= self.max_queue:
+            raise JobQueueFullError(f"Fila de análises cheia ({self.max_queue} jobs aguardando)")
+
+        job = {
+            'job_id': uuid.uuid4().hex,
+            'status': 'queued',
+            'movie_name': request.name,
+            'max_comments': request.max_comments,
+            'created_at': time.time()
+        }
+        await asyncio.to_thread(store.save_job, job)
+        self._queue.put_nowait(job['job_id'])
+        return job
+
+    async def get(self, job_id: str) -> dict:
+        """
+        Args:
+            job_id: ID do job
+
+        Returns:
+            dict: Job no formato do modelo Job, ou None se não existir
+        """
+        return await asyncio.to_thread(store.get_job, job_id)
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Tamanho da fila e número de workers
+        """
+        return {
+            "queued": self._queue.qsize(),
+            "max_queue": self.max_queue,
+            "workers": len(self._workers)
+        }
+
+    async def _work(self) -> None:
+        """
+        Loop de um worker: executa os jobs da fila, um por vez
+
+        Um erro fora da análise (ex.: o SQLite travado ao gravar o estado)
+        encerra só aquele job, marcado como falho se possível; o worker
+        continua atendendo a fila.
+        """
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except Exception as e:
+                logger.exception("Erro interno no job %s", job_id, extra={"job_id": job_id, "error": type(e).__name__})
+                await self._fail(job_id, e)
+            finally:
+                self._queue.task_done()
+
+    async def _fail(self, job_id: str, error: Exception) -> None:
+        """Marca um job como falho depois de um erro interno, se o estado puder ser gravado"""
+        try:
+            job = await asyncio.to_thread(store.get_job, job_id)
+            if job is None or job['status'] not in ('queued', 'running'):
+                return
+            job['status'] = 'failed'
+            job['error'] = {"error": type(error).__name__, "message": str(error)}
+            job['finished_at'] = time.time()
+            await asyncio.to_thread(store.save_job, job)
+        except Exception as e:
+            logger.warning(
+                "Não foi possível marcar o job %s como falho: %s", job_id, e,
+                extra={"job_id": job_id, "error": type(e).__name__}
+            )
+
+    async def _run(self, job_id: str) -> None:
+        """Executa um job, gravando seu estado a cada transição"""
+        job = await asyncio.to_thread(store.get_job, job_id)
+        if job is None or job['status'] not in ('queued', 'running'):
+            return
+
+        job['status'] = 'running'
+        job['started_at'] = time.time()
+        await asyncio.to_thread(store.save_job, job)
+        logger.info(
+            "Job %s: %s (%d comentários)", job_id, job['movie_name'], job['max_comments'],
+            extra={"job_id": job_id, "movie": job['movie_name']}
+        )
+
+        movie = Movie(name=job['movie_name'])
+        controller = MovieController()
+        try:
+            if job['max_comments'] == MAX_COMMENTS:
+                # Análise padrão: aproveita os caches do /score
+                result, _ = await controller.get_score(movie)
+            else:
+                result = await controller.calculate_score(movie, max_results=job['max_comments'])
+            job['status'] = 'done'
+            job['result'] = result
+        except Exception as e:
+            logger.warning("Job %s falhou: %s", job_id, e, extra={"job_id": job_id, "error": type(e).__name__})
+            job['status'] = 'failed'
+            job['error'] = {"error": type(e).__name__, "message": str(e)}
+
+        job['finished_at'] = time.time()
+        await asyncio.to_thread(store.save_job, job)
+
+
+job_scheduler = JobScheduler(concurrency=JOB_CONCURRENCY, max_queue=JOB_QUEUE_MAX)
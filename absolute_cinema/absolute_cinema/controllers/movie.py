@@ -1,17 +1,395 @@
+import os
+import math
+import asyncio
+import logging
 from absolute_cinema.models.movie import Movie
 from absolute_cinema.models.score import Score
-from absolute_cinema.services.youtube import search_video, get_comments
-from absolute_cinema.internals.sentimeter import get_sentiment, calculate_score_from_comments
+from absolute_cinema.services.youtube import (
+    search_video,
+    search_videos,
+    iter_comment_pages,
+    prefetch_pages,
+    QuotaExceededError
+)
+from absolute_cinema.internals.sentimeter import analyze_batch_async, ScoreAccumulator
+from absolute_cinema.internals.samples import SampleSelector, SAMPLE_SIZE
+from absolute_cinema.internals.cache import TTLCache, normalize_movie_name
+from absolute_cinema.internals.singleflight import SingleFlight
+from absolute_cinema.internals.titles import TitleIndex, normalize_title
+from absolute_cinema.internals.language import detect_languages, UNDETERMINED
+from absolute_cinema.internals.translator import translate_batch
+from absolute_cinema.internals.dedup import CommentFilter
+from absolute_cinema.internals.comments import CommentBatch
+from absolute_cinema.internals.metrics import STAGE_SECONDS
+from absolute_cinema.internals.store import store
+from absolute_cinema.internals.quota import quota
+
+logger = logging.getLogger(__name__)
+
+# Número de comentários analisados por filme
+MAX_COMMENTS = 150
+
+# Número de trailers analisados por filme (os mais relevantes da busca). Com
+# mais de um, os vídeos são analisados em paralelo e o score é agregado
+TRAILER_COUNT = int(os.getenv("TRAILER_COUNT", "1"))
+
+# Cache de resultados do /score (TTL em segundos; 0 desativa)
+SCORE_CACHE_TTL = float(os.getenv("SCORE_CACHE_TTL", "3600"))
+SCORE_CACHE_MAXSIZE = int(os.getenv("SCORE_CACHE_MAXSIZE", "1024"))
+
+score_cache = TTLCache(maxsize=SCORE_CACHE_MAXSIZE, ttl=SCORE_CACHE_TTL)
+
+# Requisições simultâneas para o mesmo filme compartilham uma única análise
+score_flight = SingleFlight()
+
+# Cache de buscas (título -> trailer), com busca aproximada por trigramas.
+# O trailer de um filme quase nunca muda, então o TTL é longo
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", str(30 * 24 * 3600)))
+SEARCH_CACHE_MAXSIZE = int(os.getenv("SEARCH_CACHE_MAXSIZE", "10000"))
+SEARCH_MATCH_THRESHOLD = float(os.getenv("SEARCH_MATCH_THRESHOLD", "0.6"))
+
+search_index = TitleIndex(maxsize=SEARCH_CACHE_MAXSIZE, ttl=SEARCH_CACHE_TTL, threshold=SEARCH_MATCH_THRESHOLD)
+
+# Validade dos dados persistidos no SQLite, em segundos
+STORE_SEARCH_TTL = float(os.getenv("STORE_SEARCH_TTL", str(SEARCH_CACHE_TTL)))
+STORE_COMMENTS_TTL = float(os.getenv("STORE_COMMENTS_TTL", str(24 * 3600)))
+STORE_SCORE_TTL = float(os.getenv("STORE_SCORE_TTL", str(6 * 3600)))
+
+# Atualização incremental: ao expirar, o score é atualizado apenas com os
+# comentários publicados depois da última análise
+INCREMENTAL_REFRESH = os.getenv("INCREMENTAL_REFRESH", "true").lower() == "true"
+INCREMENTAL_MAX_COMMENTS = int(os.getenv("INCREMENTAL_MAX_COMMENTS", "1000"))
+
+# Traduz para o inglês os comentários em outros idiomas antes da análise
+# (a polaridade do TextBlob só funciona em inglês)
+TRANSLATE_COMMENTS = os.getenv("TRANSLATE_COMMENTS", "false").lower() == "true"
+
+# Remove comentários duplicados e spam copiado antes da análise
+DEDUP_COMMENTS = os.getenv("DEDUP_COMMENTS", "true").lower() == "true"
 
 class MovieController:
     """Controller para gerenciar análise de filmes"""
     
-    def calculate_score(self, movie: Movie) -> dict:
+    async def get_score(self, movie: Movie) -> tuple:
+        """
+        Retorna o score de um filme, usando o cache de resultados quando possível
+        
+        Requisições simultâneas para o mesmo filme (nome normalizado) aguardam
+        a mesma análise e recebem o mesmo resultado ou a mesma exceção.
+        
+        Args:
+            movie: Objeto Movie com o nome do filme
+            
+        Returns:
+            tuple: (resultado da análise, True se veio do cache)
+        """
+        key = normalize_movie_name(movie.name)
+        cached = score_cache.get(key)
+        if cached is not None:
+            logger.info("Cache: %s", movie.name, extra={"movie": movie.name})
+            return self._for_movie(cached, movie), True
+        
+        result, shared = await score_flight.do(key, lambda: self._calculate_and_cache(key, movie))
+        if shared:
+            logger.info("Análise compartilhada: %s", movie.name, extra={"movie": movie.name})
+        return self._for_movie(result, movie), False
+    
+    async def _calculate_and_cache(self, key: str, movie: Movie, emit=None) -> dict:
+        """
+        Busca o resultado persistido ou executa a análise, guardando-o nos caches
+        
+        Com a quota do YouTube baixa ou esgotada, um resultado expirado é
+        servido no lugar de uma nova análise.
+        
+        Args:
+            key: Nome normalizado do filme
+            movie: Objeto Movie com o nome do filme
+            emit: Se informado, recebe (evento, dados) com o progresso de uma
+                análise completa (ver stream_score)
+        """
+        result = await asyncio.to_thread(store.get_score, key, STORE_SCORE_TTL)
+        if result is None:
+            previous = await asyncio.to_thread(store.get_score, key, math.inf)
+            if previous is not None and await asyncio.to_thread(quota.is_low):
+                logger.warning("Quota baixa: servindo resultado expirado de %s", movie.name, extra={"movie": movie.name})
+                score_cache.set(key, previous)
+                return previous
+            try:
+                with STAGE_SECONDS.labels("analysis").time():
+                    if INCREMENTAL_REFRESH and previous is not None and not previous.get('videos'):
+                        result = await self.refresh_score(movie, previous)
+                    elif emit is not None:
+                        result = await self._stream_calculation(movie, emit)
+                    else:
+                        result = await self.calculate_score(movie)
+            except QuotaExceededError:
+                if previous is None:
+                    raise
+                logger.warning("Quota esgotada: servindo resultado expirado de %s", movie.name, extra={"movie": movie.name})
+                score_cache.set(key, previous)
+                return previous
+            await asyncio.to_thread(store.save_score, key, result)
+        score_cache.set(key, result)
+        return result
+    
+    async def stream_score(self, movie: Movie):
+        """
+        Calcula o score de um filme emitindo o progresso de cada etapa
+        
+        Usa os mesmos caches e fallbacks de get_score: um resultado
+        persistido, expirado (com a quota baixa) ou atualizado de forma
+        incremental é emitido como um único evento "result", assim como o
+        de uma análise já em andamento para o mesmo filme. Só uma análise
+        completa emite o progresso.
+        
+        Args:
+            movie: Objeto Movie com o nome do filme
+            
+        Yields:
+            tuple: (evento, dados) com evento "stage", "video", "partial" ou "result"
+        """
+        if not movie.name or movie.name.strip() == "":
+            raise ValueError("Nome do filme não pode estar vazio")
+        
+        key = normalize_movie_name(movie.name)
+        cached = score_cache.get(key)
+        if cached is not None:
+            yield "result", self._for_movie(cached, movie)
+            return
+        
+        # A análise continua se o cliente desconectar: outras requisições
+        # podem estar aguardando o mesmo resultado
+        events = asyncio.Queue()
+        task, shared = score_flight.start(key, lambda: self._calculate_and_cache(key, movie, events.put_nowait))
+        if shared:
+            logger.info("Análise compartilhada: %s", movie.name, extra={"movie": movie.name})
+        else:
+            task.add_done_callback(lambda _: events.put_nowait(None))
+            while (event := await events.get()) is not None:
+                yield event
+        
+        result = await asyncio.shield(task)
+        yield "result", self._for_movie(result, movie)
+    
+    async def _stream_calculation(self, movie: Movie, emit) -> dict:
+        """
+        Calcula o score como calculate_score, enviando a emit o progresso de
+        cada etapa
+        
+        Cada página de comentários é analisada assim que chega, produzindo
+        um score parcial. Com mais de um trailer (TRAILER_COUNT), apenas a
+        etapa é emitida.
+        """
+        if TRAILER_COUNT > 1:
+            emit(("stage", {"stage": "trailers"}))
+            return await self.calculate_score(movie)
+        
+        emit(("stage", {"stage": "search"}))
+        video_info = await self._find_video(movie)
+        video_id = video_info['video_id']
+        emit(("video", {"video_id": video_id, "video_title": video_info['title']}))
+        
+        emit(("stage", {"stage": "comments"}))
+        accumulator = ScoreAccumulator()
+        selector = SampleSelector()
+        comment_filter = self._comment_filter()
+        latest = None
+        page_number = 0
+        pages = self._comment_pages(video_id)
+        async for page in self._analyze_pages(pages, accumulator, selector, comment_filter):
+            latest = self._latest_published(page, latest)
+            page_number += 1
+            emit(("partial", {
+                "page": page_number,
+                **accumulator.result(),
+                "duplicates_removed": self._removed(comment_filter)
+            }))
+        
+        if not accumulator.totals['total']:
+            raise ValueError("Nenhum comentário encontrado para este vídeo")
+        
+        emit(("stage", {"stage": "samples"}))
+        await asyncio.to_thread(store.save_aggregate, video_id, {**accumulator.totals, 'last_published_at': latest})
+        return self._build_result(
+            movie, video_id, video_info['title'], accumulator.result(), selector.result(),
+            self._removed(comment_filter)
+        )
+    
+    async def _find_video(self, movie: Movie) -> dict:
+        """
+        Busca o trailer do filme no cache de buscas, no SQLite ou, se
+        ausente, no YouTube
+        
+        O cache de buscas também resolve variações próximas de títulos já
+        conhecidos. Sem quota para a busca (100 unidades), usa um resultado
+        expirado.
+        """
+        key = normalize_title(movie.name)
+        video_info = search_index.get(key)
+        if video_info is not None:
+            logger.info("Trailer em cache: %s", movie.name, extra={"movie": movie.name})
+            return video_info
+        
+        video_info = await asyncio.to_thread(store.get_search, key, STORE_SEARCH_TTL)
+        if video_info is None:
+            try:
+                video_info = await search_video(movie.name)
+            except QuotaExceededError:
+                video_info = await asyncio.to_thread(store.get_search, key, math.inf)
+                if video_info is None:
+                    raise
+                logger.warning("Quota esgotada: usando busca expirada de %s", movie.name, extra={"movie": movie.name})
+                return video_info
+            await asyncio.to_thread(store.save_search, key, movie.name, video_info)
+        search_index.set(key, video_info)
+        return video_info
+    
+    async def _find_videos(self, movie: Movie, count: int) -> list:
+        """
+        Busca os `count` trailers mais relevantes do filme no SQLite ou, se
+        ausentes, no YouTube (uma única busca)
+        
+        Sem quota para a busca, usa apenas o trailer principal já conhecido.
+        """
+        key = normalize_title(movie.name)
+        videos = await asyncio.to_thread(store.get_search_results, key, count, STORE_SEARCH_TTL)
+        if videos is None:
+            try:
+                videos = await search_videos(movie.name, max_results=count)
+            except QuotaExceededError:
+                return [await self._find_video(movie)]
+            await asyncio.to_thread(store.save_search_results, key, count, videos)
+            await asyncio.to_thread(store.save_search, key, movie.name, videos[0])
+            search_index.set(key, videos[0])
+        return videos
+    
+    async def _comment_pages(self, video_id: str, max_results: int = MAX_COMMENTS):
+        """
+        Busca os comentários do vídeo no SQLite (em uma única página) ou,
+        se ausentes, no YouTube, gravando cada página conforme chega
+        
+        Análises profundas (mais que MAX_COMMENTS) sempre vão ao YouTube.
+        A coleta só passa a valer para as próximas análises quando todas as
+        páginas chegam; se o consumidor parar antes, ela é descartada.
+        """
+        if max_results <= MAX_COMMENTS:
+            comments = await asyncio.to_thread(store.get_comments, video_id, STORE_COMMENTS_TTL, max_results)
+            if comments:
+                yield comments
+                return
+        # Com a quota baixa a coleta é menor, e fica registrada como tal
+        planned = await self._plan_max_results(video_id, max_results)
+        await asyncio.to_thread(store.start_comment_fetch, video_id)
+        async for page in iter_comment_pages(video_id, max_results=planned):
+            await asyncio.to_thread(store.save_comments, video_id, page)
+            yield page
+        await asyncio.to_thread(store.finish_comment_fetch, video_id, planned)
+    
+    async def _new_comment_pages(self, video_id: str, since: str):
+        """
+        Busca no YouTube os comentários publicados depois de `since`, gravando
+        cada página à parte dos da análise completa (que _comment_pages lê)
+        """
+        planned = await self._plan_max_results(video_id, INCREMENTAL_MAX_COMMENTS)
+        pages = iter_comment_pages(video_id, max_results=planned, order="time", since=since)
+        async for page in pages:
+            await asyncio.to_thread(store.save_comments, video_id, page, "time")
+            yield page
+    
+    async def _plan_max_results(self, video_id: str, max_results: int) -> int:
+        """
+        Decide quantos comentários buscar no YouTube: com a quota baixa,
+        menos comentários (menos páginas)
+        """
+        planned = await asyncio.to_thread(quota.plan_max_results, max_results)
+        if planned < max_results:
+            logger.warning("Quota baixa: limitando a %d comentários", planned, extra={"video_id": video_id})
+        return planned
+    
+    async def _analyze_pages(self, pages, accumulator: ScoreAccumulator, selector: SampleSelector,
+                             comment_filter: CommentFilter = None):
+        """
+        Analisa as páginas de comentários conforme chegam, sem acumulá-las
+        
+        A próxima página é buscada enquanto a atual é analisada; apenas os
+        totais e os candidatos a comentário de exemplo ficam em memória.
+        
+        Args:
+            pages: Iterador assíncrono de páginas de comentários
+            accumulator: Totais da análise, atualizados a cada página
+            selector: Seletor de comentários de exemplo, atualizado a cada página
+            comment_filter: Filtro de duplicatas/spam aplicado antes da análise
+            
+        Yields:
+            list: Cada página (completa, inclusive duplicatas), depois de analisada
+        """
+        async for page in prefetch_pages(pages):
+            comments = page
+            if comment_filter:
+                with STAGE_SECONDS.labels("dedup").time():
+                    comments = comment_filter.filter(page)
+            if not comments:
+                yield page
+                continue
+            texts = comments.texts
+            with STAGE_SECONDS.labels("language").time():
+                languages = await asyncio.to_thread(detect_languages, texts)
+            if TRANSLATE_COMMENTS:
+                with STAGE_SECONDS.labels("translation").time():
+                    texts = await self._translate_foreign(texts, languages)
+            with STAGE_SECONDS.labels("sentiment").time():
+                polarities, labels = await analyze_batch_async(texts)
+            accumulator.add(polarities, labels, languages)
+            with STAGE_SECONDS.labels("samples").time():
+                selector.add(comments, labels, polarities)
+            yield page
+    
+    def _comment_filter(self, across_videos: bool = False) -> CommentFilter:
+        """
+        Filtro de duplicatas de uma análise, ou None se desativado
+        
+        Com vários trailers (`across_videos`), o mesmo comentário em vídeos
+        diferentes é sempre contado uma vez; DEDUP_COMMENTS controla só o
+        filtro de spam.
+        """
+        if DEDUP_COMMENTS:
+            return CommentFilter()
+        return CommentFilter(spam=False) if across_videos else None
+    
+    def _removed(self, comment_filter: CommentFilter) -> int:
+        """Número de comentários removidos pelo filtro"""
+        return comment_filter.removed if comment_filter else 0
+    
+    async def _translate_foreign(self, texts: list, languages: list) -> list:
+        """Traduz para o inglês apenas os textos detectados em outro idioma"""
+        foreign = [i for i, language in enumerate(languages) if language not in ('en', UNDETERMINED)]
+        if not foreign:
+            return texts
+        translated = await translate_batch([texts[i] for i in foreign])
+        texts = list(texts)
+        for i, text in zip(foreign, translated):
+            texts[i] = text
+        return texts
+    
+    def _for_movie(self, result: dict, movie: Movie) -> dict:
+        """Adapta um resultado em cache ao nome digitado nesta requisição"""
+        return {
+            **result,
+            "movie_name": movie.name,
+            "message": f"Análise concluída para '{movie.name}'"
+        }
+    
+    async def calculate_score(self, movie: Movie, max_results: int = MAX_COMMENTS) -> dict:
         """
         Calcula o score de um filme baseado em comentários do YouTube
         
+        Nenhuma etapa bloqueia o event loop: as chamadas ao YouTube são
+        assíncronas e a análise de sentimentos roda no pool de processos
+        (ou em thread).
+        
         Args:
             movie: Objeto Movie com o nome do filme
+            max_results: Número máximo de comentários analisados
             
         Returns:
             dict: Resultado da análise com score e detalhes
@@ -19,11 +397,13 @@ class MovieController:
         if not movie.name or movie.name.strip() == "":
             raise ValueError("Nome do filme não pode estar vazio")
         
-        print(f"\n🔍 Analisando: {movie.name}")
+        if TRAILER_COUNT > 1:
+            return await self.calculate_multi_score(movie, TRAILER_COUNT, max_results)
+        
+        logger.info("Analisando: %s", movie.name, extra={"movie": movie.name})
         
         # 1. Buscar vídeo no YouTube
-        print("📹 Buscando trailer no YouTube...")
-        video_info = search_video(movie.name)
+        video_info = await self._find_video(movie)
         
         if not video_info:
             raise ValueError(f"Nenhum trailer encontrado para '{movie.name}'")
@@ -31,29 +411,172 @@ class MovieController:
         video_id = video_info['video_id']
         video_title = video_info['title']
         
-        # 2. Coletar comentários
-        print("💬 Coletando comentários...")
-        comments = get_comments(video_id, max_results=150)
+        # 2 e 3. Coletar comentários e analisar sentimentos página por página
+        # (cada comentário é analisado uma única vez, enquanto a próxima
+        # página é buscada)
+        accumulator = ScoreAccumulator()
+        selector = SampleSelector()
+        comment_filter = self._comment_filter()
+        latest = None
+        pages = self._comment_pages(video_id, max_results)
+        async for page in self._analyze_pages(pages, accumulator, selector, comment_filter):
+            latest = self._latest_published(page, latest)
         
-        if not comments:
+        if not accumulator.totals['total']:
             raise ValueError("Nenhum comentário encontrado para este vídeo")
         
-        # 3. Analisar sentimentos
-        print("📊 Analisando sentimentos...")
-        analysis = calculate_score_from_comments(comments)
+        # Os totais persistidos são a base do refresh incremental do /score,
+        # então só a análise padrão os grava (jobs com outro limite, não)
+        if max_results == MAX_COMMENTS:
+            await asyncio.to_thread(store.save_aggregate, video_id, {**accumulator.totals, 'last_published_at': latest})
+        analysis = accumulator.result()
         
         # 4. Selecionar comentários de exemplo
-        print("📝 Selecionando comentários de exemplo...")
-        sample_comments = self._select_sample_comments(comments)
+        with STAGE_SECONDS.labels("samples").time():
+            sample_comments = selector.result()
         
-        print(f"✓ {len(sample_comments)} comentários de exemplo selecionados")
-        print(f"✓ Análise concluída!")
-        print(f"  Score: {analysis['score']}/100")
-        print(f"  Positivos: {analysis['positive']}%")
-        print(f"  Negativos: {analysis['negative']}%")
-        print(f"  Video ID: {video_id}\n")
+        logger.info(
+            "Análise concluída: %s, score %s/100", movie.name, analysis['score'],
+            extra={
+                "movie": movie.name,
+                "video_id": video_id,
+                "score": analysis['score'],
+                "positive": analysis['positive'],
+                "negative": analysis['negative'],
+                "comments": analysis['total_comments']
+            }
+        )
         
         # 5. Montar resposta
+        removed = self._removed(comment_filter)
+        return self._build_result(movie, video_id, video_title, analysis, sample_comments, removed)
+    
+    async def calculate_multi_score(self, movie: Movie, count: int, max_results: int = MAX_COMMENTS) -> dict:
+        """
+        Calcula o score de um filme a partir dos seus `count` trailers mais
+        relevantes (oficial, teaser, dublado...)
+        
+        Os vídeos são buscados e analisados em paralelo, então a latência fica
+        próxima à de um único vídeo. Comentários repetidos, inclusive entre
+        vídeos diferentes, são contados uma única vez. O score final soma os
+        comentários de todos os vídeos, o que equivale à média dos scores de
+        cada vídeo ponderada pelo número de comentários analisados.
+        
+        Args:
+            movie: Objeto Movie com o nome do filme
+            count: Número de trailers
+            max_results: Número máximo de comentários analisados por vídeo
+            
+        Returns:
+            dict: Resultado da análise, com o score de cada vídeo em "videos"
+        """
+        logger.info("Analisando %d trailers: %s", count, movie.name, extra={"movie": movie.name})
+        videos = await self._find_videos(movie, count)
+        
+        selector = SampleSelector()
+        comment_filter = self._comment_filter(across_videos=True)
+        
+        async def analyze_video(video: dict) -> ScoreAccumulator:
+            accumulator = ScoreAccumulator()
+            pages = self._comment_pages(video['video_id'], max_results)
+            async for _ in self._analyze_pages(pages, accumulator, selector, comment_filter):
+                pass
+            return accumulator
+        
+        outcomes = await asyncio.gather(*map(analyze_video, videos), return_exceptions=True)
+        
+        analyzed = []
+        for video, outcome in zip(videos, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(
+                    "Trailer %s ignorado: %s", video['video_id'], outcome,
+                    extra={"movie": movie.name, "video_id": video['video_id']}
+                )
+            elif outcome.totals['total']:
+                analyzed.append((video, outcome))
+        
+        if not analyzed:
+            errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+            if errors:
+                raise errors[0]
+            raise ValueError("Nenhum comentário encontrado para este vídeo")
+        
+        pooled = ScoreAccumulator()
+        for _, accumulator in analyzed:
+            pooled.merge(accumulator)
+        analysis = pooled.result()
+        
+        video_scores = [
+            {
+                "video_id": video['video_id'],
+                "video_title": video['title'],
+                "score": accumulator.result()['score'],
+                "total_comments": accumulator.totals['total'],
+                "weight": round(accumulator.totals['total'] / pooled.totals['total'], 3)
+            }
+            for video, accumulator in analyzed
+        ]
+        
+        logger.info(
+            "Análise concluída: %s, score %s/100 (%d trailers)", movie.name, analysis['score'], len(analyzed),
+            extra={"movie": movie.name, "score": analysis['score'], "comments": analysis['total_comments']}
+        )
+        
+        main_video = analyzed[0][0]
+        result = self._build_result(
+            movie, main_video['video_id'], main_video['title'], analysis, selector.result(),
+            self._removed(comment_filter)
+        )
+        result['videos'] = video_scores
+        return result
+    
+    async def refresh_score(self, movie: Movie, previous: dict) -> dict:
+        """
+        Atualiza um resultado anterior analisando apenas os comentários novos
+        
+        Busca os comentários em ordem cronológica até alcançar os já vistos,
+        analisa somente esses e os soma aos totais acumulados do vídeo, de
+        forma que o custo (quota e CPU) é proporcional aos comentários novos.
+        
+        Args:
+            movie: Objeto Movie com o nome do filme
+            previous: Último resultado persistido para o filme
+            
+        Returns:
+            dict: Resultado da análise atualizado
+        """
+        video_id = previous['video_id']
+        aggregate = await asyncio.to_thread(store.get_aggregate, video_id)
+        if aggregate is None:
+            return await self.calculate_score(movie)
+        
+        logger.info("Atualizando: %s", movie.name, extra={"movie": movie.name, "video_id": video_id})
+        accumulator = ScoreAccumulator(aggregate, previous['details'].get('languages'))
+        selector = SampleSelector()
+        comment_filter = self._comment_filter()
+        latest = aggregate['last_published_at']
+        new_pages = self._new_comment_pages(video_id, since=latest)
+        async for page in self._analyze_pages(new_pages, accumulator, selector, comment_filter):
+            latest = self._latest_published(page, latest)
+        
+        new_count = accumulator.totals['total'] - aggregate['total']
+        sample_comments = previous['sample_comments']
+        if new_count:
+            await asyncio.to_thread(store.save_aggregate, video_id, {**accumulator.totals, 'last_published_at': latest})
+            sample_comments = (selector.result() + sample_comments)[:SAMPLE_SIZE]
+        
+        logger.info("%d comentários novos analisados", new_count, extra={"movie": movie.name, "video_id": video_id})
+        removed = previous['details'].get('duplicates_removed', 0) + self._removed(comment_filter)
+        return self._build_result(movie, video_id, previous['video_title'], accumulator.result(), sample_comments, removed)
+    
+    def _latest_published(self, comments: CommentBatch, current: str = None) -> str:
+        """Data de publicação (ISO 8601) mais recente entre `current` e os comentários"""
+        dates = [date for date in (comments.latest_published(), current) if date]
+        return max(dates) if dates else None
+    
+    def _build_result(self, movie: Movie, video_id: str, video_title: str, analysis: dict, sample_comments: list,
+                      duplicates_removed: int = 0) -> dict:
+        """Monta o resultado da análise no formato do modelo Score"""
         return {
             "score": analysis['score'],
             "movie_name": movie.name,
@@ -66,46 +589,16 @@ class MovieController:
                 "positive_percentage": analysis['positive'],
                 "negative_percentage": analysis['negative'],
                 "neutral_percentage": analysis['neutral'],
-                "average_polarity": analysis['avg_polarity']
+                "average_polarity": analysis['avg_polarity'],
+                "languages": analysis.get('languages', {}),
+                "duplicates_removed": duplicates_removed
             },
             "sample_comments": sample_comments
         }
     
-    def _select_sample_comments(self, comments: list) -> list:
+    def _select_sample_comments(self, comments: CommentBatch, labels: list, polarities: list = None) -> list:
         """Seleciona comentários de exemplo para exibição"""
-        analyzed_comments = []
-        
-        # Analisar todos os comentários
-        for comment in comments:
-            sentiment_result = get_sentiment(comment['text'])
-            analyzed_comments.append({
-                'comment': comment,
-                'sentiment': sentiment_result
-            })
-        
-        # Separar por sentimento
-        positive = [c for c in analyzed_comments if c['sentiment'] == 'Positive']
-        negative = [c for c in analyzed_comments if c['sentiment'] == 'Negative']
-        neutral = [c for c in analyzed_comments if c['sentiment'] == 'Neutral']
-        
-        # Selecionar amostras (3 positivos, 2 negativos)
-        selected = []
-        selected.extend(positive[:3])
-        selected.extend(negative[:2])
-        
-        # Se não tiver suficientes, adicionar neutros
-        if len(selected) < 5:
-            selected.extend(neutral[:5-len(selected)])
-        
-        # Formatar para o frontend
-        formatted = []
-        for item in selected[:5]:
-            comment = item['comment']
-            formatted.append({
-                'author': comment['author'],
-                'text': comment['text'][:200] + ('...' if len(comment['text']) > 200 else ''),
-                'likes': comment['likes'],
-                'sentiment': item['sentiment']
-            })
-        
-        return formatted
\ No newline at end of file
+        # Reaproveita os sentimentos (e polaridades) já calculados para o score
+        selector = SampleSelector()
+        selector.add(comments, labels, polarities)
+        return selector.result()
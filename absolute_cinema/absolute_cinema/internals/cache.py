@@ -0,0 +1,98 @@
+import time
+import unicodedata
+from collections import OrderedDict
+
+
+def normalize_movie_name(name: str) -> str:
+    """
+    Normaliza o nome de um filme para uso como chave de cache
+
+    Remove acentos, ignora maiúsculas/minúsculas e colapsa espaços, de forma
+    que "Cidade de Deus", " cidade  de deus" e "CIDADE DE DEUS" coincidam.
+
+    Args:
+        name: Nome do filme como digitado pelo usuário
+
+    Returns:
+        str: Nome normalizado
+    """
+    decomposed = unicodedata.normalize("NFKD", name or "")
+    without_accents = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(without_accents.casefold().split())
+
+
+class TTLCache:
+    """
+    Cache em memória com expiração por tempo (TTL) e descarte LRU
+
+    Não é thread-safe: foi feito para ser usado dentro do event loop.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize: Número máximo de entradas (0 desativa o cache)
+            ttl: Tempo de vida de cada entrada, em segundos (0 desativa o cache)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, key):
+        """
+        Busca uma entrada válida no cache
+
+        Args:
+            key: Chave da entrada
+
+        Returns:
+            O valor armazenado, ou None se ausente ou expirado
+        """
+        entry = self._data.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._data[key]
+        self.misses += 1
+        return None
+
+    def set(self, key, value) -> None:
+        """
+        Armazena uma entrada, descartando as menos usadas se necessário
+
+        Args:
+            key: Chave da entrada
+            value: Valor a armazenar
+        """
+        if not self.enabled:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove todas as entradas"""
+        self._data.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Contadores de acertos/falhas e ocupação do cache
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl
+        }
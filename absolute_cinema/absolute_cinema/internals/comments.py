@@ -0,0 +1,129 @@
+import sys
+from array import array
+from datetime import datetime, timezone
+
+# Formato das datas de publicação da API do YouTube (e do SQLite)
+PUBLISHED_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def parse_published(published_at: str) -> int:
+    """Converte uma data ISO 8601 da API (ex.: 2024-01-01T12:00:00Z) em segundos desde 1970"""
+    return int(datetime.fromisoformat(published_at).timestamp())
+
+
+def format_published(timestamp: int) -> str:
+    """Converte segundos desde 1970 na data ISO 8601 usada pela API"""
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime(PUBLISHED_FORMAT)
+
+
+class CommentBatch:
+    """
+    Lote de comentários em colunas paralelas
+
+    Em vez de um dict de 4 chaves por comentário, guarda uma lista de autores
+    (internados: o mesmo autor ocupa uma única string), uma lista de textos,
+    as curtidas em um array int32 e as datas de publicação em um array int64
+    (segundos desde 1970). O código de análise lê as colunas diretamente;
+    dicts (author, text, likes, published_at) só são montados para os poucos
+    comentários exibidos, via batch[i].
+    """
+
+    __slots__ = ("authors", "texts", "likes", "published")
+
+    def __init__(self, authors: list = None, texts: list = None, likes=None, published=None):
+        """
+        Args:
+            authors: Autor de cada comentário
+            texts: Texto de cada comentário
+            likes: Curtidas de cada comentário (iterável de int)
+            published: Publicação de cada comentário, em segundos desde 1970
+        """
+        self.authors = [sys.intern(author) for author in authors] if authors else []
+        self.texts = list(texts) if texts else []
+        self.likes = array("i", likes or ())
+        self.published = array("q", published or ())
+
+    @classmethod
+    def from_rows(cls, rows) -> "CommentBatch":
+        """
+        Monta um lote a partir de comentários no formato de dict
+
+        Args:
+            rows: Comentários (author, text, likes, published_at)
+
+        Returns:
+            CommentBatch: Lote com os mesmos comentários, na mesma ordem
+        """
+        batch = cls()
+        for row in rows:
+            batch.append(row['author'], row['text'], row['likes'], row['published_at'])
+        return batch
+
+    @classmethod
+    def concat(cls, batches) -> "CommentBatch":
+        """Junta vários lotes (ex.: as páginas de um vídeo) em um só"""
+        batch = cls()
+        for other in batches:
+            batch.extend(other)
+        return batch
+
+    def append(self, author: str, text: str, likes: int, published_at: str) -> None:
+        """Adiciona um comentário (published_at em ISO 8601, como na API)"""
+        published = parse_published(published_at)
+        self.likes.append(likes)
+        self.published.append(published)
+        self.authors.append(sys.intern(author))
+        self.texts.append(text)
+
+    def extend(self, other: "CommentBatch") -> None:
+        self.authors.extend(other.authors)
+        self.texts.extend(other.texts)
+        self.likes.extend(other.likes)
+        self.published.extend(other.published)
+
+    def take(self, indices: list) -> "CommentBatch":
+        """
+        Args:
+            indices: Posições dos comentários mantidos
+
+        Returns:
+            CommentBatch: Novo lote só com esses comentários, na ordem dada
+        """
+        batch = CommentBatch()
+        batch.authors = [self.authors[i] for i in indices]
+        batch.texts = [self.texts[i] for i in indices]
+        batch.likes = array("i", [self.likes[i] for i in indices])
+        batch.published = array("q", [self.published[i] for i in indices])
+        return batch
+
+    def comment(self, index: int) -> dict:
+        """Comentário na posição `index`, no formato de dict (author, text, likes, published_at)"""
+        return {
+            'author': self.authors[index],
+            'text': self.texts[index],
+            'likes': self.likes[index],
+            'published_at': format_published(self.published[index])
+        }
+
+    def rows(self):
+        """Gera (author, text, likes, published_at) de cada comentário, para gravação"""
+        return zip(self.authors, self.texts, self.likes, map(format_published, self.published))
+
+    def latest_published(self) -> str:
+        """Data de publicação (ISO 8601) mais recente do lote, ou None se vazio"""
+        return format_published(max(self.published)) if self.published else None
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(len(self))[index])
+        return self.comment(index)
+
+    def __iter__(self):
+        # Conveniência para lotes pequenos: monta um dict por comentário
+        return map(self.comment, range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"CommentBatch({len(self)} comentários)"
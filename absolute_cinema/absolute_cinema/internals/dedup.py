@@ -0,0 +1,153 @@
+import os
+import re
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from absolute_cinema.internals.cache import normalize_movie_name
+from absolute_cinema.internals.comments import CommentBatch
+
+# Textos normalizados mais curtos que isso só são duplicatas se forem do mesmo
+# autor ("amazing!" repetido por pessoas diferentes é opinião, não spam)
+DEDUP_MIN_LENGTH = int(os.getenv("DEDUP_MIN_LENGTH", "20"))
+# Detecta também quase-duplicatas (spam com pequenas variações) via MinHash
+DEDUP_MINHASH = os.getenv("DEDUP_MINHASH", "false").lower() == "true"
+# Similaridade (Jaccard estimada) a partir da qual um texto é quase-duplicata
+DEDUP_MINHASH_THRESHOLD = float(os.getenv("DEDUP_MINHASH_THRESHOLD", "0.8"))
+
+# Assinatura MinHash: BANDS faixas de ROWS permutações (LSH)
+MINHASH_BANDS = 16
+MINHASH_ROWS = 4
+SHINGLE_SIZE = 5
+# Textos por bloco no cálculo vetorizado das assinaturas (limita a memória)
+MINHASH_CHUNK = 256
+
+# Permutações por hashing multiply-shift: ((a * x + b) mod 2^64) >> 32, com a ímpar
+_random = np.random.default_rng(20240101)
+_A = _random.integers(0, 1 << 63, size=MINHASH_BANDS * MINHASH_ROWS, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_B = _random.integers(0, 1 << 63, size=MINHASH_BANDS * MINHASH_ROWS, dtype=np.uint64)
+_SHIFT = np.uint64(32)
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_comment(text: str) -> str:
+    """
+    Normaliza o texto de um comentário para comparação
+
+    Remove acentos, maiúsculas, pontuação e emojis, e colapsa espaços, de
+    forma que "AMAZING trailer!!! 🔥" e "amazing trailer" coincidam.
+
+    Args:
+        text: Texto do comentário
+
+    Returns:
+        str: Texto normalizado
+    """
+    if not text.isascii():
+        text = normalize_movie_name(text)
+    return " ".join(_NON_WORD.sub(" ", text.casefold()).split())
+
+
+_SHINGLE_WEIGHTS = 256 ** np.arange(SHINGLE_SIZE - 1, -1, -1, dtype=np.uint64)
+
+
+def minhash_signatures(texts: list) -> np.ndarray:
+    """
+    Assinaturas MinHash dos shingles (SHINGLE_SIZE bytes) de vários textos
+
+    Os shingles de um bloco de textos são extraídos de uma vez com uma janela
+    deslizante sobre os bytes concatenados, e as permutações aplicadas a
+    todos juntos; o mínimo de cada texto sai de um único np.minimum.reduceat.
+    Shingles repetidos não alteram o mínimo, então não precisam ser removidos.
+
+    Args:
+        texts: Textos normalizados (normalize_comment)
+
+    Returns:
+        np.ndarray: Matriz (len(texts), MINHASH_BANDS * MINHASH_ROWS)
+    """
+    signatures = np.empty((len(texts), MINHASH_BANDS * MINHASH_ROWS), dtype=np.uint64)
+    for start in range(0, len(texts), MINHASH_CHUNK):
+        encoded = [text.encode("utf-8").ljust(SHINGLE_SIZE) for text in texts[start:start + MINHASH_CHUNK]]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+        shingles = sliding_window_view(data, SHINGLE_SIZE) @ _SHINGLE_WEIGHTS
+
+        # Descarta as janelas que atravessam o fim de um texto
+        counts = lengths - SHINGLE_SIZE + 1
+        ends = np.cumsum(lengths)
+        position = np.arange(len(shingles))
+        owner = np.searchsorted(ends, position, side="right")
+        shingles = shingles[position + SHINGLE_SIZE <= ends[owner]]
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        values = (_A[:, None] * shingles[None, :] + _B[:, None]) >> _SHIFT
+        signatures[start:start + len(encoded)] = np.minimum.reduceat(values, offsets, axis=1).T
+    return signatures
+
+
+class CommentFilter:
+    """
+    Remove comentários duplicados e spam copiado, página por página
+
+    Cada comentário é reduzido a um hash do texto normalizado, então a
+    filtragem é O(n) e guarda apenas os hashes já vistos. Com MinHash, textos
+    quase iguais (mesmo spam com palavras trocadas) também são removidos; os
+    candidatos vêm de buckets LSH, sem comparar todos os pares.
+
+    Sem o filtro de spam, só remove o mesmo comentário (autor e texto) visto
+    de novo, como o mesmo comentário publicado em vários trailers.
+    """
+
+    def __init__(self, spam: bool = True, minhash: bool = DEDUP_MINHASH, threshold: float = DEDUP_MINHASH_THRESHOLD):
+        """
+        Args:
+            spam: Remove também textos longos repetidos por autores diferentes
+            minhash: Detecta também quase-duplicatas (só com o filtro de spam)
+            threshold: Similaridade mínima de uma quase-duplicata (0-1)
+        """
+        self.spam = spam
+        self.minhash = minhash and spam
+        self.threshold = threshold
+        self.removed = 0
+        self._seen = set()
+        self._buckets = {}
+
+    def filter(self, comments: CommentBatch) -> CommentBatch:
+        """
+        Args:
+            comments: Comentários de uma página
+
+        Returns:
+            CommentBatch: Comentários que não repetem nenhum já visto, na mesma ordem
+        """
+        texts = [normalize_comment(text) for text in comments.texts]
+        signatures = minhash_signatures(texts) if self.minhash and texts else None
+
+        unique = []
+        for index, (author, text) in enumerate(zip(comments.authors, texts)):
+            long_text = self.spam and len(text) >= DEDUP_MIN_LENGTH
+            key = hash(text) if long_text else hash((author, text))
+
+            if key in self._seen or (
+                signatures is not None and long_text and self._near_duplicate(signatures[index])
+            ):
+                self.removed += 1
+                continue
+            self._seen.add(key)
+            unique.append(index)
+        return comments if len(unique) == len(comments) else comments.take(unique)
+
+    def _near_duplicate(self, signature: np.ndarray) -> bool:
+        """True se a assinatura for parecida com uma já vista; senão, registra-a nos buckets"""
+        raw = signature.tobytes()
+        width = len(raw) // MINHASH_BANDS
+        keys = [(band, raw[band * width:(band + 1) * width]) for band in range(MINHASH_BANDS)]
+
+        for key in keys:
+            candidate = self._buckets.get(key)
+            if candidate is not None and np.mean(candidate == signature) >= self.threshold:
+                return True
+
+        for key in keys:
+            self._buckets.setdefault(key, signature)
+        return False
@@ -0,0 +1,225 @@
+import os
+import re
+import numpy as np
+
+# Textos com menos letras que isso não têm idioma detectado ("und")
+LANGUAGE_MIN_LETTERS = int(os.getenv("LANGUAGE_MIN_LETTERS", "12"))
+# Vantagem mínima (log-verossimilhança média por trigrama) de outro idioma
+# sobre o inglês para o texto não ser tratado como inglês
+LANGUAGE_MIN_MARGIN = float(os.getenv("LANGUAGE_MIN_MARGIN", "0.1"))
+# Caracteres considerados de cada texto
+LANGUAGE_MAX_CHARS = 300
+
+UNDETERMINED = "und"
+
+# Textos de treino do modelo de trigramas (comentários típicos de trailers)
+SAMPLES = {
+    "en": (
+        "this movie looks amazing and i can't wait to watch it with my friends. "
+        "the trailer gave me chills, the music is perfect and the actors look great. "
+        "honestly this is the worst remake i have ever seen, nobody asked for it. "
+        "who else is here after watching the first one? "
+        "i hope the story is better than what they show in the trailer. "
+        "the visual effects are incredible but the dialogue sounds a little forced. "
+        "take my money already, this will be the movie of the year. "
+        "they ruined the book, why would they change the ending like that. "
+        "that was so good, i watched it three times in a row and still want more. "
+        "what a beautiful shot, the director really knows what he is doing. "
+        "it seems boring to me, just another sequel with the same old jokes. "
+        "my favorite part is when the music drops right at the end"
+    ),
+    "pt": (
+        "esse filme parece incrível e eu não vejo a hora de assistir com os meus amigos. "
+        "o trailer me deu arrepios, a música é perfeita e os atores estão ótimos. "
+        "sinceramente esse é o pior remake que eu já vi, ninguém pediu isso. "
+        "quem mais está aqui depois de assistir o primeiro? "
+        "espero que a história seja melhor do que eles mostram no trailer. "
+        "os efeitos visuais estão incríveis mas os diálogos parecem um pouco forçados. "
+        "já quero ver no cinema, vai ser o filme do ano com certeza. "
+        "eles estragaram o livro, por que mudaram o final desse jeito. "
+        "muito bom, assisti três vezes seguidas e ainda quero mais. "
+        "que cena linda, o diretor sabe muito bem o que está fazendo. "
+        "pra mim parece chato, só mais uma continuação com as mesmas piadas. "
+        "minha parte favorita é quando a música começa no final, ação demais"
+    ),
+    "es": (
+        "esta película se ve increíble y no puedo esperar para verla con mis amigos. "
+        "el tráiler me dio escalofríos, la música es perfecta y los actores se ven geniales. "
+        "sinceramente este es el peor remake que he visto, nadie pidió esto. "
+        "quién más está aquí después de ver la primera? "
+        "espero que la historia sea mejor de lo que muestran en el tráiler. "
+        "los efectos visuales son increíbles pero los diálogos suenan un poco forzados. "
+        "ya quiero verla en el cine, será la película del año sin duda. "
+        "arruinaron el libro, por qué cambiaron el final de esa manera. "
+        "muy bueno, lo vi tres veces seguidas y todavía quiero más. "
+        "qué escena tan hermosa, el director sabe muy bien lo que hace. "
+        "a mí me parece aburrida, solo otra secuela con los mismos chistes. "
+        "mi parte favorita es cuando empieza la música al final, qué emoción"
+    ),
+    "fr": (
+        "ce film a l'air incroyable et j'ai hâte de le voir avec mes amis. "
+        "la bande annonce m'a donné des frissons, la musique est parfaite et les acteurs sont géniaux. "
+        "honnêtement c'est le pire remake que j'ai jamais vu, personne n'a demandé ça. "
+        "qui d'autre est ici après avoir regardé le premier? "
+        "j'espère que l'histoire sera meilleure que ce qu'ils montrent dans la bande annonce. "
+        "les effets visuels sont incroyables mais les dialogues semblent un peu forcés. "
+        "je veux déjà le voir au cinéma, ce sera le film de l'année sans aucun doute. "
+        "ils ont gâché le livre, pourquoi ont ils changé la fin comme ça. "
+        "trop bien, je l'ai regardé trois fois de suite et j'en veux encore. "
+        "quelle belle scène, le réalisateur sait vraiment ce qu'il fait. "
+        "pour moi ça a l'air ennuyeux, encore une suite avec les mêmes blagues. "
+        "mon passage préféré c'est quand la musique commence à la fin"
+    ),
+    "de": (
+        "dieser film sieht unglaublich aus und ich kann es kaum erwarten, ihn mit meinen freunden zu sehen. "
+        "der trailer hat mir gänsehaut gegeben, die musik ist perfekt und die schauspieler sehen toll aus. "
+        "ehrlich gesagt ist das das schlechteste remake, das ich je gesehen habe, niemand wollte das. "
+        "wer ist noch hier, nachdem er den ersten teil gesehen hat? "
+        "ich hoffe, die geschichte ist besser als das, was sie im trailer zeigen. "
+        "die effekte sind unglaublich, aber die dialoge klingen ein bisschen gezwungen. "
+        "ich will ihn schon jetzt im kino sehen, das wird der film des jahres. "
+        "sie haben das buch ruiniert, warum haben sie das ende so geändert. "
+        "richtig gut, ich habe ihn dreimal hintereinander gesehen und will noch mehr. "
+        "was für eine schöne szene, der regisseur weiß genau, was er tut. "
+        "für mich sieht das langweilig aus, nur noch eine fortsetzung mit denselben witzen. "
+        "mein lieblingsteil ist, wenn am ende die musik einsetzt"
+    ),
+    "it": (
+        "questo film sembra incredibile e non vedo l'ora di guardarlo con i miei amici. "
+        "il trailer mi ha fatto venire i brividi, la musica è perfetta e gli attori sono fantastici. "
+        "sinceramente questo è il peggior remake che abbia mai visto, nessuno lo ha chiesto. "
+        "chi altro è qui dopo aver visto il primo? "
+        "spero che la storia sia migliore di quello che mostrano nel trailer. "
+        "gli effetti visivi sono incredibili ma i dialoghi sembrano un po' forzati. "
+        "voglio già vederlo al cinema, sarà il film dell'anno senza dubbio. "
+        "hanno rovinato il libro, perché hanno cambiato il finale in quel modo. "
+        "bellissimo, l'ho visto tre volte di fila e ne voglio ancora. "
+        "che scena stupenda, il regista sa davvero cosa sta facendo. "
+        "per me sembra noioso, solo un altro sequel con le stesse battute. "
+        "la mia parte preferita è quando parte la musica alla fine"
+    ),
+}
+
+# Alfabetos não latinos identificam o idioma diretamente (ordem de prioridade)
+SCRIPTS = (
+    ("ja", re.compile("[\u3040-\u30ff]")),
+    ("ko", re.compile("[\uac00-\ud7af]")),
+    ("zh", re.compile("[\u4e00-\u9fff]")),
+    ("ru", re.compile("[\u0400-\u04ff]")),
+    ("ar", re.compile("[\u0600-\u06ff]")),
+    ("hi", re.compile("[\u0900-\u097f]")),
+    ("th", re.compile("[\u0e00-\u0e7f]")),
+)
+
+_NON_LETTER = re.compile(r"[^\w]+|[\d_]+")
+_LATIN = re.compile("[a-z\u00e0-\u00ff]")
+
+_model = None
+
+
+class TrigramModel:
+    """
+    Modelo Naive Bayes de trigramas de caracteres, compilado em uma matriz
+
+    A linha 0 guarda a probabilidade (suavizada) de um trigrama nunca visto
+    no treino de cada idioma.
+    """
+
+    def __init__(self, samples: dict):
+        """
+        Args:
+            samples: Mapa idioma -> texto de treino
+        """
+        self.languages = list(samples)
+        counts = [self._count(_trigrams(_clean(text))) for text in samples.values()]
+        vocabulary = sorted(set().union(*counts))
+        self.ids = {trigram: index for index, trigram in enumerate(vocabulary, start=1)}
+
+        matrix = np.zeros((len(vocabulary) + 1, len(self.languages)))
+        for column, language_counts in enumerate(counts):
+            total = sum(language_counts.values()) + len(vocabulary)
+            matrix[:, column] = np.log(1 / total)
+            for trigram, count in language_counts.items():
+                matrix[self.ids[trigram], column] = np.log((count + 1) / total)
+        self.log_probs = matrix
+        self.english = self.languages.index("en")
+
+    def _count(self, trigrams: list) -> dict:
+        counts = {}
+        for trigram in trigrams:
+            counts[trigram] = counts.get(trigram, 0) + 1
+        return counts
+
+
+def _clean(text: str) -> str:
+    """Minúsculas, só letras, palavras separadas por um espaço"""
+    return " ".join(_NON_LETTER.sub(" ", text[:LANGUAGE_MAX_CHARS].lower()).split())
+
+
+def _trigrams(cleaned: str) -> list:
+    padded = f" {cleaned} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def _script(text: str) -> str:
+    """Idioma indicado por um alfabeto não latino predominante, ou None"""
+    latin = len(_LATIN.findall(text.lower()))
+    for language, pattern in SCRIPTS:
+        if len(pattern.findall(text)) > latin:
+            return language
+    return None
+
+
+def get_model() -> TrigramModel:
+    """Retorna o modelo de idiomas, treinando-o na primeira chamada"""
+    global _model
+    if _model is None:
+        _model = TrigramModel(SAMPLES)
+    return _model
+
+
+def detect_languages(texts: list) -> list:
+    """
+    Detecta o idioma de vários textos, sem acesso à rede
+
+    Textos latinos são classificados pelo modelo de trigramas (en, pt, es,
+    fr, de, it); alfabetos não latinos pelo próprio alfabeto. Na dúvida entre
+    o inglês e outro idioma, o texto é considerado inglês, pois só textos
+    não ingleses são enviados para tradução.
+
+    Args:
+        texts: Lista de textos
+
+    Returns:
+        list: Código do idioma de cada texto ("und" se curto demais)
+    """
+    model = get_model()
+    languages = [UNDETERMINED] * len(texts)
+    indices, ids, offsets, sizes = [], [], [], []
+
+    for index, text in enumerate(texts):
+        if not text.isascii():
+            script = _script(text)
+            if script:
+                languages[index] = script
+                continue
+        cleaned = _clean(text)
+        if len(cleaned) - cleaned.count(" ") < LANGUAGE_MIN_LETTERS:
+            continue
+        trigram_ids = [model.ids.get(trigram, 0) for trigram in _trigrams(cleaned)]
+        indices.append(index)
+        offsets.append(len(ids))
+        sizes.append(len(trigram_ids))
+        ids.extend(trigram_ids)
+
+    if not indices:
+        return languages
+
+    scores = np.add.reduceat(model.log_probs[np.asarray(ids)], np.asarray(offsets), axis=0)
+    best = scores.argmax(axis=1)
+    margin = (scores.max(axis=1) - scores[:, model.english]) / np.asarray(sizes)
+    best[margin < LANGUAGE_MIN_MARGIN] = model.english
+
+    for index, column in zip(indices, best.tolist()):
+        languages[index] = model.languages[column]
+    return languages
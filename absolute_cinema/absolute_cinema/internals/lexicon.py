@@ -0,0 +1,354 @@
+import re
+import numpy as np
+
+# Palavras que invertem a polaridade da avaliação seguinte (mesmas do TextBlob)
+NEGATIONS = ("no", "not", "n't", "never")
+
+# Fator aplicado a avaliações negadas ("not good" = levemente ruim)
+NEGATION_FACTOR = -0.5
+
+# Reforço aplicado por cada "!" após uma avaliação
+EXCLAMATION_BOOST = 1.25
+
+# Marca de ironia: gera uma avaliação neutra, como um emoticon de polaridade 0
+IRONY = "(!)"
+
+# Tokens que encerram uma frase no tokenizador do TextBlob
+SENTENCE_ENDS = ("...", ".", "!", "?")
+# Pontuação que também fecha a frase quando segue um fim de frase ("good!)")
+SENTENCE_CLOSERS = ("'", '"', "”", "’", "...", ".", "!", "?", ")")
+
+_lexicon = None
+
+
+class Tokenizer:
+    """
+    Reprodução do find_tokens do TextBlob, com um atalho para palavras comuns
+
+    Usa as mesmas tabelas do TextBlob (contrações, abreviações, emoticons):
+    cada trecho entre espaços perde a pontuação das pontas ("good!" vira
+    "good" e "!"), mas a pontuação interna fica ("good,bad" é um token só);
+    "..." é um único token; emoticons separados pela pontuação são
+    remontados, respeitando maiúsculas (":D" é um emoticon, ":d" não).
+    """
+
+    def __init__(self):
+        from textblob import _text
+
+        self.replacements = list(_text.replacements.items())
+        self.abbreviations = _text.ABBREVIATIONS
+        self.abbreviation_patterns = (_text.RE_ABBR1, _text.RE_ABBR2, _text.RE_ABBR3)
+        self.leading = frozenset(_text.PUNCTUATION.replace(".", ""))
+        self.trailing = self.leading | {"."}
+        self.end_of_sentence = _text.EOS
+        self._linebreak_re = re.compile(r"\n{2,}")
+        self._sarcasm_re = _text.RE_SARCASM
+        self._emoticon_re = _text.RE_EMOTICONS
+
+    def __call__(self, text: str) -> list:
+        """
+        Args:
+            text: Texto para tokenizar
+
+        Returns:
+            list: Tokens do texto, ainda sem converter para minúsculas
+        """
+        for old, new in self.replacements:
+            if old in text:
+                text = text.replace(old, new)
+        for quote in ("“", "”", "‘", "’", "'", '"'):
+            if quote in text:
+                text = text.replace(quote, f" {quote} ")
+        if "\n" in text:
+            text = self._linebreak_re.sub(f" {self.end_of_sentence} ", text.replace("\r\n", "\n"))
+
+        tokens = []
+        for chunk in text.split():
+            if chunk[0] in self.leading or chunk[-1] in self.trailing:
+                tokens.extend(self._split_punctuation(chunk))
+            else:
+                tokens.append(chunk)
+        return [token for sentence in self._sentences(tokens) for token in sentence.split()]
+
+    def _split_punctuation(self, chunk: str) -> list:
+        """Separa a pontuação do começo e do fim de um trecho, como o find_tokens"""
+        tokens, tail = [], []
+        while chunk and chunk[0] in self.leading:
+            tokens.append(chunk[0])
+            chunk = chunk[1:]
+        while chunk and chunk[-1] in self.trailing:
+            if chunk[-1] in self.leading:
+                tail.append(chunk[-1])
+                chunk = chunk[:-1]
+            if chunk.endswith("..."):
+                tail.append("...")
+                chunk = chunk[:-3].rstrip(".")
+            if chunk.endswith("."):
+                if chunk in self.abbreviations or any(pattern.match(chunk) for pattern in self.abbreviation_patterns):
+                    break
+                tail.append(".")
+                chunk = chunk[:-1]
+        if chunk:
+            tokens.append(chunk)
+        tokens.extend(reversed(tail))
+        return tokens
+
+    def _sentences(self, tokens: list) -> list:
+        """Agrupa os tokens em frases e remonta ironia "(!)" e emoticons em cada uma"""
+        sentences, start, index = [[]], 0, 0
+        while index < len(tokens):
+            if tokens[index] in SENTENCE_ENDS or tokens[index] == self.end_of_sentence:
+                while index < len(tokens) and (
+                    tokens[index] in SENTENCE_CLOSERS or tokens[index] == self.end_of_sentence
+                ):
+                    # Aspas balanceadas pertencem à próxima frase
+                    if tokens[index] in ("'", '"') and sentences[-1].count(tokens[index]) % 2 == 0:
+                        break
+                    index += 1
+                sentences[-1].extend(token for token in tokens[start:index] if token != self.end_of_sentence)
+                sentences.append([])
+                start = index
+            index += 1
+        sentences[-1].extend(tokens[start:index])
+        joined = (self._sarcasm_re.sub(IRONY, " ".join(sentence)) for sentence in sentences if sentence)
+        return [
+            self._emoticon_re.sub(lambda match: match.group(1).replace(" ", "") + match.group(2), sentence)
+            for sentence in joined
+        ]
+
+
+class CompiledLexicon:
+    """
+    Léxico de sentimentos do TextBlob compilado em arrays indexados por ID
+
+    O ID 0 é reservado para palavras desconhecidas, o penúltimo para
+    palavras desconhecidas de duas letras ("is", "it"), que não interrompem
+    um modificador, e o último para as de uma letra ou pontuação ("a", ","),
+    que também não interrompem uma negação.
+    """
+
+    def __init__(self, entries: dict, emoticons: dict, tokenizer: Tokenizer):
+        """
+        Args:
+            entries: Mapa palavra -> (polaridade, intensidade, é_modificador)
+            emoticons: Mapa emoticon (em minúsculas) -> polaridade
+            tokenizer: Tokenizador equivalente ao do TextBlob
+        """
+        emoticons = {**emoticons, IRONY: 0.0}
+        words = sorted(set(entries) | set(emoticons) | set(NEGATIONS) | {"!"})
+        size = len(words) + 3
+
+        self.ids = {word: index for index, word in enumerate(words, start=1)}
+        self.pair_id = size - 2
+        self.short_id = size - 1
+        self.known = np.zeros(size, dtype=bool)
+        self.polarity = np.zeros(size, dtype=np.float64)
+        self.intensity = np.ones(size, dtype=np.float64)
+        self.modifier = np.zeros(size, dtype=bool)
+        self.adverb = np.zeros(size, dtype=bool)
+        self.negation = np.zeros(size, dtype=bool)
+        self.exclamation = np.zeros(size, dtype=bool)
+        self.emoticon = np.zeros(size, dtype=bool)
+        self.short = np.zeros(size, dtype=bool)
+        self.pair = np.zeros(size, dtype=bool)
+
+        for word, index in self.ids.items():
+            if word in entries:
+                polarity, intensity, modifier = entries[word]
+                self.known[index] = True
+                self.polarity[index] = polarity
+                self.intensity[index] = intensity or 1.0
+                self.modifier[index] = modifier
+                self.adverb[index] = modifier and word.endswith("ly")
+            elif word in emoticons:
+                self.emoticon[index] = True
+                self.polarity[index] = emoticons[word]
+            self.negation[index] = word in NEGATIONS and word not in entries
+            self.exclamation[index] = word == "!"
+            self.short[index] = len(word.strip("'")) <= 1
+            self.pair[index] = len(word) <= 2
+        self.short[self.short_id] = self.pair[self.short_id] = self.pair[self.pair_id] = True
+
+        self.tokenizer = tokenizer
+
+    def tokenize(self, text: str) -> list:
+        """
+        Separa um texto em tokens minúsculos, como o tokenizador do TextBlob
+
+        Args:
+            text: Texto para tokenizar
+
+        Returns:
+            list: Tokens do texto ("don't" vira ["do", "n", "'", "t"]: para o
+            TextBlob, a contração não é uma negação)
+        """
+        return [token.lower() for token in self.tokenizer(text)]
+
+    def encode(self, texts: list) -> tuple:
+        """
+        Converte uma lista de textos em um vetor achatado de IDs
+
+        Args:
+            texts: Lista de textos
+
+        Returns:
+            tuple: (ids, documento de cada token)
+        """
+        ids = self.ids
+        short_id, pair_id = self.short_id, self.pair_id
+        encoded = [
+            [ids.get(token) or (short_id if len(token.strip("'")) <= 1 else pair_id if len(token) <= 2 else 0)
+             for token in self.tokenize(text or "")]
+            for text in texts
+        ]
+        lengths = np.fromiter((len(tokens) for tokens in encoded), dtype=np.int64, count=len(encoded))
+        flat = np.fromiter(
+            (token for tokens in encoded for token in tokens),
+            dtype=np.int32,
+            count=int(lengths.sum())
+        )
+        docs = np.repeat(np.arange(len(encoded)), lengths)
+        return flat, docs
+
+
+def _last_before(mask: np.ndarray, doc_start: np.ndarray) -> np.ndarray:
+    """Posição do último token marcado antes de cada token, no mesmo documento (-1 se nenhum)"""
+    positions = np.where(mask, np.arange(len(mask)), -1)
+    last = np.empty_like(positions)
+    last[0] = -1
+    last[1:] = np.maximum.accumulate(positions)[:-1]
+    return np.where(last >= doc_start, last, -1)
+
+
+def get_lexicon() -> CompiledLexicon:
+    """
+    Retorna o léxico compilado, carregando-o do TextBlob na primeira chamada
+
+    Returns:
+        CompiledLexicon: Léxico compartilhado pelo processo
+    """
+    global _lexicon
+    if _lexicon is None:
+        from textblob.en import sentiment
+        from textblob._text import EMOTICONS, PUNCTUATION
+
+        sentiment.load()
+        entries = {}
+        for word, senses in sentiment.items():
+            if None not in senses:
+                continue
+            polarity, _, intensity = senses[None]
+            entries[word] = (polarity, intensity, any(pos in senses for pos in sentiment.modifiers))
+
+        # O TextBlob compara os emoticons em minúsculas, mas ignora os só de
+        # letras ("xD"), os longos e os que são pontuação
+        emoticons = {}
+        for (_, polarity), symbols in EMOTICONS.items():
+            for symbol in map(str.lower, symbols):
+                if not symbol.isalpha() and len(symbol) <= 5 and symbol not in PUNCTUATION:
+                    emoticons.setdefault(symbol, polarity)
+
+        _lexicon = CompiledLexicon(entries, emoticons, Tokenizer())
+    return _lexicon
+
+
+def score_batch(texts: list, lexicon: CompiledLexicon = None) -> list:
+    """
+    Calcula a polaridade de vários textos de uma vez com operações vetorizadas
+
+    Reproduz as regras do analisador do TextBlob: cada palavra conhecida gera
+    uma avaliação; depois de um modificador ("really", "very"), mesmo
+    separado por palavras de até duas letras ou pontuação, ela se junta à
+    avaliação anterior, multiplicando sua polaridade pela intensidade do
+    modificador ("really, really good" é uma só avaliação); uma negação
+    anterior (mesmo separada por palavras de uma letra) inverte e reduz a
+    avaliação pela metade, assim como uma negação logo após um advérbio em
+    -ly ("absolutely not"); e cada "!" reforça a última avaliação. A
+    polaridade do texto é a média das avaliações.
+
+    Args:
+        texts: Lista de textos para análise
+        lexicon: Léxico compilado (padrão: léxico do TextBlob)
+
+    Returns:
+        list: Polaridade de cada texto (-1 a 1), na mesma ordem
+    """
+    if not texts:
+        return []
+    lexicon = lexicon or get_lexicon()
+    n_docs = len(texts)
+
+    ids, docs = lexicon.encode(texts)
+    if not len(ids):
+        return [0.0] * n_docs
+
+    doc_first_token = np.searchsorted(docs, np.arange(n_docs))
+    doc_start = doc_first_token[docs]
+    positions = np.arange(len(ids))
+
+    known = lexicon.known[ids]
+    unknown = ~known
+    emoticon = lexicon.emoticon[ids]
+    negation = lexicon.negation[ids]
+    polarity = lexicon.polarity[ids]
+    intensity = lexicon.intensity[ids]
+
+    # Último token conhecido antes de cada token: só ele pode ser o modificador ativo
+    owner = _last_before(known, doc_start)
+    has_owner = owner >= 0
+    owner_modifier = has_owner & lexicon.modifier[ids[owner]]
+    owner_adverb = has_owner & lexicon.adverb[ids[owner]]
+
+    # O modificador vale até uma palavra desconhecida de 3+ letras; uma negação
+    # depois de um advérbio em -ly não o interrompe (e nega a avaliação dele)
+    clears_modifier = unknown & ~lexicon.pair[ids] & ~(owner_adverb & negation)
+    modified = owner_modifier & (_last_before(clears_modifier, doc_start) < owner)
+    negates_previous = negation & owner_adverb & modified
+
+    # A negação vale até uma palavra conhecida ou desconhecida de 2+ letras
+    sets_negation = negation & ~negates_previous
+    clears_negation = known | negates_previous | (unknown & ~lexicon.short[ids] & ~negation)
+    last_negation_event = _last_before(sets_negation | clears_negation, doc_start)
+    negated_word = known & (last_negation_event >= 0) & sets_negation[last_negation_event]
+
+    # Emoticons sempre geram uma avaliação própria
+    head = (known & ~modified) | emoticon
+    member = known | emoticon
+
+    # Intensidade efetiva: invertida quando a palavra está negada ("not very good")
+    effective_intensity = np.where(negated_word, 1.0 / intensity, intensity)
+    previous_intensity = effective_intensity[_last_before(member, doc_start)]
+    token_polarity = np.where(head, polarity, np.clip(polarity * previous_intensity, -1.0, 1.0))
+
+    # Cada avaliação recebe o valor da última palavra do seu grupo
+    head_count = np.cumsum(head)
+    assessment = head_count - 1
+    member_index = np.flatnonzero(member)
+    member_assessment = assessment[member_index]
+    is_last = np.ones(len(member_index), dtype=bool)
+    is_last[:-1] = member_assessment[1:] != member_assessment[:-1]
+
+    head_index = np.flatnonzero(head)
+    values = np.zeros(len(head_index), dtype=np.float64)
+    values[member_assessment[is_last]] = token_polarity[member_index[is_last]]
+    last_member = np.full(len(head_index), -1)
+    last_member[member_assessment[is_last]] = member_index[is_last]
+
+    # "!" reforça a última avaliação do mesmo documento, a menos que outra
+    # palavra ainda se junte a ela (o que substitui a polaridade)
+    heads_before_doc = np.concatenate(([0], head_count))[doc_first_token]
+    exclamation_index = np.flatnonzero(lexicon.exclamation[ids])
+    exclamation_index = exclamation_index[head_count[exclamation_index] > heads_before_doc[docs[exclamation_index]]]
+    boosted = exclamation_index[exclamation_index > last_member[assessment[exclamation_index]]]
+    if len(boosted):
+        boosts = np.bincount(assessment[boosted], minlength=len(values))
+        values = np.clip(values * EXCLAMATION_BOOST ** boosts, -1.0, 1.0)
+
+    negated = np.zeros(len(values), dtype=bool)
+    negated[assessment[negated_word | negates_previous]] = True
+    values = np.where(negated, values * NEGATION_FACTOR, values)
+
+    assessment_doc = docs[head_index]
+    totals = np.bincount(assessment_doc, weights=values, minlength=n_docs)
+    counts = np.bincount(assessment_doc, minlength=n_docs)
+    return (totals / np.maximum(counts, 1)).tolist()
@@ -0,0 +1,47 @@
+import os
+import json
+import logging
+
+# Nível dos logs (DEBUG, INFO, WARNING, ERROR); WARNING silencia o dia a dia
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# Formato dos logs: "text" (legível) ou "json" (uma linha JSON por evento)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+
+# Atributos padrão de um LogRecord (o resto veio de `extra`)
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formata cada evento como uma linha JSON, incluindo os campos de `extra`"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        entry.update({key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_logging(level: str = LOG_LEVEL, log_format: str = LOG_FORMAT) -> None:
+    """
+    Configura os logs da aplicação (logger "absolute_cinema")
+
+    Args:
+        level: Nível mínimo dos eventos registrados
+        log_format: "text" ou "json"
+    """
+    handler = logging.StreamHandler()
+    if log_format == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(name)s: %(message)s"))
+
+    logger = logging.getLogger("absolute_cinema")
+    logger.handlers[:] = [handler]
+    logger.setLevel(level)
+    logger.propagate = False
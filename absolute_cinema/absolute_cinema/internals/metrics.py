@@ -0,0 +1,70 @@
+import math
+from prometheus_client import Counter, Histogram, REGISTRY, CONTENT_TYPE_LATEST, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+
+# Duração de cada etapa da análise: search, comment_page, dedup, language,
+# translation, sentiment, samples, analysis (análise completa) e serialization
+STAGE_SECONDS = Histogram(
+    "absolute_cinema_stage_seconds",
+    "Duração de cada etapa da análise, em segundos",
+    ["stage"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+
+YOUTUBE_REQUESTS = Counter(
+    "absolute_cinema_youtube_requests_total",
+    "Chamadas à API do YouTube, por recurso",
+    ["resource"]
+)
+
+YOUTUBE_ERRORS = Counter(
+    "absolute_cinema_youtube_errors_total",
+    "Erros da API do YouTube, por tipo (subclasses de YouTubeAPIError)",
+    ["error"]
+)
+
+# Estatísticas dos componentes (caches, quota, fila de jobs), lidas a cada coleta
+STATS_PREFIX = "absolute_cinema"
+
+
+class StatsCollector:
+    """Expõe como gauges os valores numéricos de funções stats() registradas"""
+
+    def __init__(self):
+        self._sources = {}
+
+    def register(self, name: str, stats) -> None:
+        """
+        Args:
+            name: Nome do componente (prefixo das métricas)
+            stats: Função sem argumentos que retorna um dict de estatísticas
+        """
+        self._sources[name] = stats
+
+    def collect(self):
+        for name, stats in list(self._sources.items()):
+            for key, value in stats().items():
+                if isinstance(value, bool):
+                    value = int(value)
+                if not isinstance(value, (int, float)) or not math.isfinite(value):
+                    continue
+                yield GaugeMetricFamily(f"{STATS_PREFIX}_{name}_{key}", f"{name}: {key}", value=value)
+
+
+stats_collector = StatsCollector()
+REGISTRY.register(stats_collector)
+
+
+def register_stats(name: str, stats) -> None:
+    """Registra a função stats() de um componente para o /metrics"""
+    stats_collector.register(name, stats)
+
+
+def render() -> tuple:
+    """
+    Coleta todas as métricas no formato texto do Prometheus
+
+    Returns:
+        tuple: (corpo da resposta, content type)
+    """
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,120 @@
+import os
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from absolute_cinema.internals.store import store, Store
+
+# Quota diária do projeto na YouTube Data API (unidades)
+QUOTA_DAILY_LIMIT = int(os.getenv("QUOTA_DAILY_LIMIT", "10000"))
+# Abaixo deste saldo a aplicação passa a economizar quota
+QUOTA_LOW_WATERMARK = int(os.getenv("QUOTA_LOW_WATERMARK", "1000"))
+# Máximo de comentários por análise enquanto o saldo estiver baixo
+QUOTA_DEGRADED_MAX_RESULTS = int(os.getenv("QUOTA_DEGRADED_MAX_RESULTS", "100"))
+
+# Custo em unidades de cada chamada (search.list e commentThreads.list)
+QUOTA_COSTS = {
+    "search": 100,
+    "commentThreads": 1
+}
+
+# A quota do YouTube é renovada à meia-noite do horário do Pacífico
+QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+
+def quota_day() -> str:
+    """
+    Returns:
+        str: Dia de contabilização da quota (YYYY-MM-DD, horário do Pacífico)
+    """
+    return datetime.now(QUOTA_TIMEZONE).date().isoformat()
+
+
+class QuotaAccountant:
+    """
+    Contabiliza as unidades gastas da quota diária do YouTube
+
+    O gasto fica no SQLite, compartilhado entre workers e reinícios. Os
+    métodos são síncronos e devem ser chamados com asyncio.to_thread no
+    event loop.
+    """
+
+    def __init__(self, store: Store, daily_limit: int, low_watermark: int):
+        """
+        Args:
+            store: Persistência onde o gasto diário é registrado
+            daily_limit: Quota diária, em unidades (0 desativa o controle)
+            low_watermark: Saldo a partir do qual a quota é considerada baixa
+        """
+        self.store = store
+        self.daily_limit = daily_limit
+        self.low_watermark = low_watermark
+
+    @property
+    def enabled(self) -> bool:
+        return self.daily_limit > 0
+
+    def cost(self, resource: str) -> int:
+        """Custo, em unidades, de uma chamada ao recurso da API"""
+        return QUOTA_COSTS.get(resource, 1)
+
+    def spend(self, resource: str) -> bool:
+        """
+        Reserva as unidades de uma chamada antes de executá-la
+
+        Args:
+            resource: Recurso da API (ex.: "search", "commentThreads")
+
+        Returns:
+            bool: False se a chamada ultrapassaria a quota do dia
+        """
+        if not self.enabled:
+            return True
+        return self.store.spend_quota(quota_day(), self.cost(resource), self.daily_limit)
+
+    def exhaust(self) -> None:
+        """Marca a quota do dia como esgotada (a API respondeu quotaExceeded)"""
+        if self.enabled:
+            self.store.save_quota_usage(quota_day(), self.daily_limit)
+
+    def remaining(self) -> int:
+        """Saldo de unidades do dia"""
+        if not self.enabled:
+            return None
+        return max(self.daily_limit - self.store.get_quota_usage(quota_day()), 0)
+
+    def is_low(self) -> bool:
+        """True se o saldo do dia estiver abaixo do limite de economia"""
+        return self.enabled and self.remaining() < self.low_watermark
+
+    def plan_max_results(self, max_results: int) -> int:
+        """
+        Reduz o número de comentários de uma análise quando o saldo está baixo
+
+        Args:
+            max_results: Número de comentários pedido
+
+        Returns:
+            int: Número de comentários que cabe no saldo atual
+        """
+        if not self.is_low():
+            return max_results
+        return min(max_results, QUOTA_DEGRADED_MAX_RESULTS)
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Quota diária, unidades gastas e saldo do dia
+        """
+        if not self.enabled:
+            return {"enabled": False}
+        remaining = self.remaining()
+        return {
+            "enabled": True,
+            "day": quota_day(),
+            "daily_limit": self.daily_limit,
+            "used": self.daily_limit - remaining,
+            "remaining": remaining,
+            "low": remaining < self.low_watermark
+        }
+
+
+quota = QuotaAccountant(store, daily_limit=QUOTA_DAILY_LIMIT, low_watermark=QUOTA_LOW_WATERMARK)
@@ -0,0 +1,125 @@
+import os
+import heapq
+from absolute_cinema.internals.comments import CommentBatch
+
+# Quantidade de comentários de exemplo e quanto de cada sentimento
+SAMPLE_SIZE = 5
+SAMPLE_QUOTAS = {'Positive': 3, 'Negative': 2, 'Neutral': SAMPLE_SIZE}
+
+# Critério de escolha dos exemplos de cada sentimento: "first" (os primeiros
+# analisados), "likes" (os mais curtidos) ou "strength" (polaridade mais forte)
+SAMPLE_STRATEGY = os.getenv("SAMPLE_STRATEGY", "first").lower()
+SAMPLE_STRATEGIES = ("first", "likes", "strength")
+
+
+def format_sample(comment: dict, sentiment: str) -> dict:
+    """
+    Formata um comentário de exemplo para o frontend
+
+    Args:
+        comment: Comentário (author, text, likes)
+        sentiment: Sentimento do comentário
+
+    Returns:
+        dict: Comentário no formato do modelo CommentSample
+    """
+    return {
+        'author': comment['author'],
+        'text': comment['text'][:200] + ('...' if len(comment['text']) > 200 else ''),
+        'likes': comment['likes'],
+        'sentiment': sentiment
+    }
+
+
+class SampleSelector:
+    """
+    Seleciona comentários de exemplo conforme as páginas são analisadas
+
+    Guarda no máximo a cota de cada sentimento (3 positivos, 2 negativos e
+    neutros para completar), então a memória usada não depende do número de
+    comentários analisados. Com "first", ficam os primeiros de cada
+    sentimento e as páginas seguintes são ignoradas assim que as cotas
+    enchem; com "likes" ou "strength", um heap de mínimo por sentimento
+    mantém os K melhores vistos até agora (empates ficam com o mais antigo).
+    """
+
+    def __init__(self, strategy: str = SAMPLE_STRATEGY):
+        """
+        Args:
+            strategy: "first", "likes" ou "strength"
+
+        Raises:
+            ValueError: Se a estratégia não existir
+        """
+        if strategy not in SAMPLE_STRATEGIES:
+            raise ValueError(f"Estratégia de exemplos inválida: {strategy} (use {', '.join(SAMPLE_STRATEGIES)})")
+        self.strategy = strategy
+        self._picked = {sentiment: [] for sentiment in SAMPLE_QUOTAS}
+        self._open = set(SAMPLE_QUOTAS)
+        self._count = 0
+
+    def add(self, comments: CommentBatch, labels: list, polarities: list = None) -> None:
+        """
+        Considera uma página de comentários já analisada
+
+        Args:
+            comments: Comentários da página
+            labels: Sentimento de cada comentário (saída de analyze_batch)
+            polarities: Polaridade de cada comentário (saída de analyze_batch);
+                obrigatória com a estratégia "strength"
+        """
+        if self.strategy == "first":
+            self._add_first(comments, labels)
+            return
+        if polarities is None:
+            if self.strategy == "strength":
+                raise ValueError("A estratégia 'strength' precisa das polaridades")
+            polarities = [0.0] * len(comments)
+
+        # Só os comentários escolhidos viram dict (o lote da página é descartado)
+        by_likes = self.strategy == "likes"
+        for index, (likes, sentiment, polarity) in enumerate(zip(comments.likes, labels, polarities)):
+            self._count += 1
+            strength = abs(polarity)
+            key = (likes, strength) if by_likes else (strength, likes)
+            heap = self._picked[sentiment]
+            if len(heap) < SAMPLE_QUOTAS[sentiment]:
+                heapq.heappush(heap, (key, -self._count, comments[index]))
+            elif key > heap[0][0]:
+                heapq.heapreplace(heap, (key, -self._count, comments[index]))
+
+    def _add_first(self, comments: CommentBatch, labels: list) -> None:
+        """Estratégia "first": guarda os primeiros de cada sentimento até a cota"""
+        open_sentiments = self._open
+        if not open_sentiments:
+            return
+        for index, sentiment in enumerate(labels):
+            if sentiment not in open_sentiments:
+                continue
+            picked = self._picked[sentiment]
+            picked.append(comments[index])
+            if len(picked) == SAMPLE_QUOTAS[sentiment]:
+                open_sentiments.discard(sentiment)
+                if not open_sentiments:
+                    return
+
+    def _ranked(self, sentiment: str) -> list:
+        """Comentários escolhidos de um sentimento, do melhor para o pior"""
+        if self.strategy == "first":
+            return self._picked[sentiment]
+        return [comment for _, _, comment in sorted(self._picked[sentiment], reverse=True)]
+
+    def result(self) -> list:
+        """
+        Returns:
+            list: Até 5 comentários formatados (positivos, negativos e, se
+            faltarem, neutros)
+        """
+        selected = [('Positive', c) for c in self._ranked('Positive')]
+        selected.extend(('Negative', c) for c in self._ranked('Negative'))
+
+        # Se não tiver suficientes, adicionar neutros
+        if len(selected) < SAMPLE_SIZE:
+            selected.extend(('Neutral', c) for c in self._ranked('Neutral')[:SAMPLE_SIZE - len(selected)])
+
+        return [format_sample(comment, sentiment) for sentiment, comment in selected[:SAMPLE_SIZE]]
@@ -1,55 +1,288 @@
-from textblob import TextBlob
+import os
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from absolute_cinema.internals.comments import CommentBatch
+
+logger = logging.getLogger(__name__)
+
+
+def available_cpus(cgroup_root: str = "/sys/fs/cgroup") -> int:
+    """
+    CPUs que o processo pode realmente usar
+
+    Em um container, os.cpu_count() é o número de CPUs do host; o limite
+    está na afinidade do processo e na quota do cgroup (v2: cpu.max, v1:
+    cpu.cfs_quota_us / cpu.cfs_period_us), arredondada para baixo.
+
+    Args:
+        cgroup_root: Pasta do cgroup montado
+
+    Returns:
+        int: Número de CPUs (pelo menos 1)
+    """
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    try:
+        with open(os.path.join(cgroup_root, "cpu.max")) as file:
+            quota, period = file.read().split()[:2]
+    except (OSError, ValueError):
+        try:
+            with open(os.path.join(cgroup_root, "cpu", "cpu.cfs_quota_us")) as file:
+                quota = file.read().strip()
+            with open(os.path.join(cgroup_root, "cpu", "cpu.cfs_period_us")) as file:
+                period = file.read().strip()
+        except OSError:
+            quota = period = None
+    if quota and quota not in ("max", "-1"):
+        cpus = min(cpus, int(quota) // int(period))
+    return max(cpus, 1)
+
+
+# Backend de polaridade: "textblob" (padrão) ou "lexicon" (vetorizado com NumPy)
+SENTIMENT_BACKEND = os.getenv("SENTIMENT_BACKEND", "textblob").lower()
+
+# Pool de processos para análise em lote (0 ou 1 worker desativa o pool).
+# Por padrão, um worker por CPU disponível ao container (cada um carrega o
+# TextBlob, então com uma CPU ou menos não há pool) e só com o TextBlob: o
+# léxico vetorizado analisa uma página em cerca de 1 ms, menos que a ida e
+# volta até um worker
+SENTIMENT_WORKERS = int(os.getenv(
+    "SENTIMENT_WORKERS", str(available_cpus()) if SENTIMENT_BACKEND == "textblob" else "1"
+))
+# Lotes menores que isso são analisados no próprio processo. As análises
+# chegam página a página (até 100 comentários), então cada página completa
+# vai para um worker e análises simultâneas se dividem entre os processos
+SENTIMENT_POOL_MIN_BATCH = int(os.getenv("SENTIMENT_POOL_MIN_BATCH", "50"))
+# Tamanho mínimo de cada fatia enviada a um worker (amortiza o pickling)
+SENTIMENT_MIN_CHUNK = int(os.getenv("SENTIMENT_MIN_CHUNK", "250"))
+
+_executor = None
+# Classe TextBlob, importada no primeiro uso (o import do TextBlob/NLTK é lento)
+_TextBlob = None
+
+def classify_polarity(polarity: float) -> str:
+    """
+    Classifica uma polaridade já calculada
+
+    Args:
+        polarity: Polaridade do texto (-1 a 1)
+
+    Returns:
+        str: 'Positive', 'Negative' ou 'Neutral'
+    """
+    if polarity > 0.1:
+        return 'Positive'
+    elif polarity < -0.1:
+        return 'Negative'
+    else:
+        return 'Neutral'
 
 def get_sentiment(text: str) -> str:
     """
     Classifica o sentimento de um texto
-    
+
     Args:
         text: Texto para análise
-        
+
     Returns:
         str: 'Positive', 'Negative' ou 'Neutral'
     """
-    try:
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity
-        
-        if polarity > 0.1:
-            return 'Positive'
-        elif polarity < -0.1:
-            return 'Negative'
-        else:
-            return 'Neutral'
-    except:
-        return 'Neutral'
+    return classify_polarity(get_polarity(text))
 
 def get_polarity(text: str) -> float:
     """
     Retorna a polaridade de um texto (-1 a 1)
-    
+
     Args:
         text: Texto para análise
-        
+
     Returns:
         float: Polaridade do texto
     """
     try:
-        blob = TextBlob(text)
+        blob = _textblob()(text)
         return blob.sentiment.polarity
     except:
         return 0.0
 
-def calculate_score_from_comments(comments: list) -> dict:
+def _textblob():
+    """Retorna a classe TextBlob, importando-a na primeira chamada"""
+    global _TextBlob
+    if _TextBlob is None:
+        from textblob import TextBlob
+        _TextBlob = TextBlob
+    return _TextBlob
+
+def warm_up() -> None:
+    """
+    Carrega o backend de sentimentos antes da primeira requisição
+
+    Importa o TextBlob (ou compila o léxico) e analisa um texto, o que
+    carrega também o léxico do analisador. Com o pool ativo, cada worker
+    faz o mesmo. Bloqueante: no event loop, use asyncio.to_thread.
+    """
+    _score_chunk(["warm up the sentiment analyzer"])
+    if _executor is not None:
+        list(_executor.map(_score_chunk, [["warm up"]] * SENTIMENT_WORKERS))
+
+def start_pool() -> None:
+    """
+    Inicia o pool de processos usado para análises grandes
+
+    Chamado no startup da aplicação. Não faz nada se o pool já estiver
+    ativo ou se SENTIMENT_WORKERS for menor que 2.
+    """
+    global _executor
+    if _executor is None and SENTIMENT_WORKERS > 1:
+        _executor = ProcessPoolExecutor(
+            max_workers=SENTIMENT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+def _restart_pool(broken: ProcessPoolExecutor) -> None:
+    """Substitui um pool quebrado (um worker morreu, ex.: falta de memória) por um novo"""
+    global _executor
+    if _executor is broken:
+        logger.warning("Pool de sentimentos quebrado; recriando os workers")
+        broken.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        start_pool()
+
+def shutdown_pool() -> None:
+    """Encerra o pool de processos (chamado no shutdown da aplicação)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+def _score_chunk(texts: list) -> list:
+    """
+    Calcula as polaridades de uma fatia de textos com o backend configurado
+
+    Executada tanto no próprio processo quanto nos workers do pool, por isso
+    precisa ser uma função de módulo (serializável).
+    """
+    if SENTIMENT_BACKEND == "lexicon":
+        from absolute_cinema.internals.lexicon import score_batch
+        return score_batch(texts)
+    return [get_polarity(text) for text in texts]
+
+def _split_chunks(texts: list) -> list:
+    """
+    Divide os textos em fatias para o pool
+
+    Busca duas fatias por worker (para balancear a carga), sem deixar
+    nenhuma menor que SENTIMENT_MIN_CHUNK.
+    """
+    target = -(-len(texts) // (SENTIMENT_WORKERS * 2))
+    size = max(SENTIMENT_MIN_CHUNK, target)
+    return [texts[i:i + size] for i in range(0, len(texts), size)]
+
+def analyze_batch(texts: list) -> tuple:
+    """
+    Analisa uma lista de textos, processando cada um uma única vez
+
+    Lotes grandes são divididos entre os workers do pool de processos,
+    quando ativo; lotes pequenos são analisados no próprio processo, assim
+    como um lote cujo pool quebrou (o pool é recriado para os próximos).
+
+    Args:
+        texts: Lista de textos para análise
+
+    Returns:
+        tuple: (polaridades, sentimentos) na mesma ordem dos textos
+    """
+    executor = _executor
+    polarities = None
+    if executor is not None and len(texts) >= SENTIMENT_POOL_MIN_BATCH:
+        try:
+            polarities = []
+            for chunk in executor.map(_score_chunk, _split_chunks(texts)):
+                polarities.extend(chunk)
+        except BrokenProcessPool:
+            _restart_pool(executor)
+            polarities = None
+    if polarities is None:
+        polarities = _score_chunk(texts)
+    labels = [classify_polarity(polarity) for polarity in polarities]
+    return polarities, labels
+
+async def analyze_batch_async(texts: list) -> tuple:
     """
-    Calcula score baseado em lista de comentários
-    
+    Versão não bloqueante de analyze_batch para uso no event loop
+
+    As fatias vão para o pool de processos quando ativo; caso contrário, a
+    análise roda em uma thread, liberando o event loop para outras requisições.
+
     Args:
-        comments: Lista de comentários (cada um com 'text')
-        
+        texts: Lista de textos para análise
+
+    Returns:
+        tuple: (polaridades, sentimentos) na mesma ordem dos textos
+    """
+    executor = _executor
+    polarities = None
+    if executor is not None and len(texts) >= SENTIMENT_POOL_MIN_BATCH:
+        loop = asyncio.get_running_loop()
+        try:
+            chunks = await asyncio.gather(*(
+                loop.run_in_executor(executor, _score_chunk, chunk)
+                for chunk in _split_chunks(texts)
+            ))
+            polarities = [polarity for chunk in chunks for polarity in chunk]
+        except BrokenProcessPool:
+            _restart_pool(executor)
+    if polarities is None:
+        polarities = await asyncio.to_thread(_score_chunk, texts)
+    labels = [classify_polarity(polarity) for polarity in polarities]
+    return polarities, labels
+
+def summarize_polarities(polarities: list, labels: list) -> dict:
+    """
+    Resume polaridades e sentimentos em totais que podem ser somados
+
+    Args:
+        polarities: Lista de polaridades (saída de analyze_batch)
+        labels: Lista de sentimentos (saída de analyze_batch)
+
+    Returns:
+        dict: Totais (total, positive, negative, neutral, polarity_sum)
+    """
+    return {
+        'total': len(labels),
+        'positive': labels.count('Positive'),
+        'negative': labels.count('Negative'),
+        'neutral': labels.count('Neutral'),
+        'polarity_sum': sum(polarities)
+    }
+
+def merge_totals(current: dict, new: dict) -> dict:
+    """
+    Soma dois resumos gerados por summarize_polarities
+
+    Args:
+        current: Totais acumulados até agora
+        new: Totais dos comentários novos
+
+    Returns:
+        dict: Totais combinados
+    """
+    return {key: current[key] + new[key] for key in ('total', 'positive', 'negative', 'neutral', 'polarity_sum')}
+
+def calculate_score_from_totals(totals: dict) -> dict:
+    """
+    Calcula score a partir de totais acumulados
+
+    Args:
+        totals: Totais (saída de summarize_polarities ou merge_totals)
+
     Returns:
         dict: Estatísticas da análise
     """
-    if not comments:
+    total = totals['total']
+    if not total:
         return {
             'score': 50.0,
             'positive': 0,
@@ -58,33 +291,17 @@ def calculate_score_from_comments(comments: list) -> dict:
             'total_comments': 0,
             'avg_polarity': 0
         }
-    
-    sentiments = []
-    polarities = []
-    
-    for comment in comments:
-        sentiment = get_sentiment(comment['text'])
-        polarity = get_polarity(comment['text'])
-        
-        sentiments.append(sentiment)
-        polarities.append(polarity)
-    
-    # Contar sentimentos
-    total = len(sentiments)
-    positive = sentiments.count('Positive')
-    negative = sentiments.count('Negative')
-    neutral = sentiments.count('Neutral')
-    
+
     # Calcular percentuais
-    positive_pct = (positive / total * 100) if total > 0 else 0
-    negative_pct = (negative / total * 100) if total > 0 else 0
-    neutral_pct = (neutral / total * 100) if total > 0 else 0
-    
+    positive_pct = totals['positive'] / total * 100
+    negative_pct = totals['negative'] / total * 100
+    neutral_pct = totals['neutral'] / total * 100
+
     # Score final (0-100)
-    avg_polarity = sum(polarities) / len(polarities) if polarities else 0
+    avg_polarity = totals['polarity_sum'] / total
     score = ((avg_polarity + 1) / 2) * 100
     score = max(0, min(100, score))
-    
+
     return {
         'score': round(score, 1),
         'positive': round(positive_pct, 1),
@@ -92,4 +309,93 @@ def calculate_score_from_comments(comments: list) -> dict:
         'neutral': round(neutral_pct, 1),
         'total_comments': total,
         'avg_polarity': round(avg_polarity, 2)
-    }
\ No newline at end of file
+    }
+
+class ScoreAccumulator:
+    """
+    Acumula os totais da análise página por página
+
+    Mantém apenas contadores, de forma que a memória não cresce com o número
+    de comentários. A soma das polaridades é feita na mesma ordem que em
+    calculate_score_from_polarities, então o resultado final é idêntico.
+    """
+
+    def __init__(self, totals: dict = None, languages: dict = None):
+        """
+        Args:
+            totals: Totais iniciais (ex.: de uma análise anterior)
+            languages: Contagem inicial de comentários por idioma
+        """
+        self.totals = {
+            'total': 0,
+            'positive': 0,
+            'negative': 0,
+            'neutral': 0,
+            'polarity_sum': 0.0
+        }
+        if totals:
+            self.totals.update({key: totals[key] for key in self.totals})
+        self.languages = dict(languages or {})
+
+    def add(self, polarities: list, labels: list, languages: list = None) -> None:
+        """
+        Soma uma página de polaridades e sentimentos aos totais
+
+        Args:
+            polarities: Polaridades da página (saída de analyze_batch)
+            labels: Sentimentos da página (saída de analyze_batch)
+            languages: Idiomas da página (saída de detect_languages)
+        """
+        totals = self.totals
+        totals['total'] += len(labels)
+        totals['positive'] += labels.count('Positive')
+        totals['negative'] += labels.count('Negative')
+        totals['neutral'] += labels.count('Neutral')
+        totals['polarity_sum'] = sum(polarities, totals['polarity_sum'])
+        for language in languages or ():
+            self.languages[language] = self.languages.get(language, 0) + 1
+
+    def merge(self, other: "ScoreAccumulator") -> None:
+        """
+        Soma os totais de outro acumulador (ex.: de outro vídeo) a este
+
+        Args:
+            other: Acumulador a somar
+        """
+        self.totals = merge_totals(self.totals, other.totals)
+        for language, count in other.languages.items():
+            self.languages[language] = self.languages.get(language, 0) + count
+
+    def result(self) -> dict:
+        """
+        Returns:
+            dict: Estatísticas da análise (como em calculate_score_from_totals)
+            e a contagem de comentários por idioma
+        """
+        return {**calculate_score_from_totals(self.totals), 'languages': dict(self.languages)}
+
+def calculate_score_from_polarities(polarities: list, labels: list) -> dict:
+    """
+    Calcula score a partir de polaridades e sentimentos já calculados
+
+    Args:
+        polarities: Lista de polaridades (saída de analyze_batch)
+        labels: Lista de sentimentos (saída de analyze_batch)
+
+    Returns:
+        dict: Estatísticas da análise
+    """
+    return calculate_score_from_totals(summarize_polarities(polarities, labels))
+
+def calculate_score_from_comments(comments: CommentBatch) -> dict:
+    """
+    Calcula score baseado em lote de comentários
+
+    Args:
+        comments: Lote de comentários
+
+    Returns:
+        dict: Estatísticas da análise
+    """
+    polarities, labels = analyze_batch(comments.texts)
+    return calculate_score_from_polarities(polarities, labels)
@@ -0,0 +1,77 @@
+import asyncio
+
+
+class SingleFlight:
+    """
+    Agrupa chamadas concorrentes com a mesma chave em uma única execução
+
+    Enquanto uma execução para a chave estiver em andamento, novas chamadas
+    aguardam o mesmo resultado (ou a mesma exceção) em vez de repetir o
+    trabalho. Deve ser usado dentro de um único event loop.
+    """
+
+    def __init__(self):
+        self.coalesced = 0
+        self._calls = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def start(self, key, factory) -> tuple:
+        """
+        Inicia factory() para a chave, ou retorna a execução já em andamento
+
+        Diferente de do(), não aguarda o resultado: quem chama pode
+        acompanhar a execução enquanto ela já está visível para as demais.
+
+        Args:
+            key: Chave que identifica o trabalho
+            factory: Função sem argumentos que retorna a corrotina a executar
+
+        Returns:
+            tuple: (task da execução, True se a chamada foi agrupada com outra)
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return task, True
+
+        task = asyncio.ensure_future(factory())
+        self._calls[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return task, False
+
+    async def do(self, key, factory) -> tuple:
+        """
+        Executa factory() uma única vez por chave entre chamadas concorrentes
+
+        A execução é protegida contra cancelamento: se quem a iniciou
+        desistir, as demais chamadas continuam recebendo o resultado.
+
+        Args:
+            key: Chave que identifica o trabalho
+            factory: Função sem argumentos que retorna a corrotina a executar
+
+        Returns:
+            tuple: (resultado, True se a chamada foi agrupada com outra)
+        """
+        task, shared = self.start(key, factory)
+        return await asyncio.shield(task), shared
+
+    def _finish(self, key, task: asyncio.Task) -> None:
+        """Remove a execução concluída e marca sua exceção como consumida"""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Execuções em andamento e total de chamadas agrupadas
+        """
+        return {
+            "in_flight": self.in_flight,
+            "coalesced": self.coalesced
+        }
@@ -0,0 +1,537 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from absolute_cinema.internals.comments import CommentBatch
+
+# Caminho do banco SQLite local
+STORE_PATH = os.getenv("STORE_PATH", "absolute_cinema.db")
+
+# Quantidade de comentários gravados por transação (uma página da API)
+PAGE_SIZE = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS searches (
+    key TEXT PRIMARY KEY,
+    movie_name TEXT NOT NULL,
+    video_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    channel TEXT,
+    description TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS search_results (
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (key, count)
+);
+CREATE TABLE IF NOT EXISTS comments (
+    video_id TEXT NOT NULL,
+    author TEXT NOT NULL,
+    text TEXT NOT NULL,
+    likes INTEGER NOT NULL DEFAULT 0,
+    published_at TEXT NOT NULL,
+    source TEXT NOT NULL DEFAULT 'relevance',
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (video_id, source, author, published_at)
+);
+CREATE INDEX IF NOT EXISTS comments_fetched ON comments (video_id, source, fetched_at);
+CREATE TABLE IF NOT EXISTS comment_fetches (
+    video_id TEXT PRIMARY KEY,
+    max_results INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE TABLE IF NOT EXISTS aggregates (
+    video_id TEXT PRIMARY KEY,
+    total INTEGER NOT NULL,
+    positive INTEGER NOT NULL,
+    negative INTEGER NOT NULL,
+    neutral INTEGER NOT NULL,
+    polarity_sum REAL NOT NULL,
+    last_published_at TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    movie_name TEXT NOT NULL,
+    max_comments INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS quota_usage (
+    day TEXT PRIMARY KEY,
+    units INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS translations (
+    hash TEXT PRIMARY KEY,
+    target TEXT NOT NULL,
+    text TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scores (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    computed_at REAL NOT NULL
+);
+"""
+
+
+class Store:
+    """
+    Persistência local (SQLite) de buscas, comentários e scores calculados
+
+    Cada thread usa sua própria conexão; o banco roda em modo WAL para que
+    leituras concorrentes não sejam bloqueadas pelas escritas. Os métodos são
+    síncronos e devem ser chamados com asyncio.to_thread no event loop.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Caminho do arquivo do banco
+        """
+        self.path = path
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Retorna a conexão da thread atual, criando o schema se necessário"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def close(self) -> None:
+        """Fecha todas as conexões abertas (chamado no shutdown da aplicação)"""
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def get_search(self, key: str, max_age: float) -> dict:
+        """
+        Busca o vídeo encontrado para um filme
+
+        Args:
+            key: Nome normalizado do filme
+            max_age: Idade máxima do registro, em segundos
+
+        Returns:
+            dict: Informações do vídeo (como em search_video), ou None
+        """
+        row = self._connect().execute(
+            "SELECT video_id, title, channel, description FROM searches "
+            "WHERE key = ? AND fetched_at >= ?",
+            (key, time.time() - max_age)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            'video_id': row['video_id'],
+            'title': row['title'],
+            'channel': row['channel'],
+            'description': row['description']
+        }
+
+    def get_searches(self, max_age: float) -> list:
+        """
+        Lista as buscas gravadas ainda válidas
+
+        Args:
+            max_age: Idade máxima dos registros, em segundos
+
+        Returns:
+            list: Tuplas (chave, informações do vídeo, fetched_at)
+        """
+        rows = self._connect().execute(
+            "SELECT key, video_id, title, channel, description, fetched_at FROM searches "
+            "WHERE fetched_at >= ? ORDER BY fetched_at",
+            (time.time() - max_age,)
+        ).fetchall()
+        return [
+            (
+                row['key'],
+                {
+                    'video_id': row['video_id'],
+                    'title': row['title'],
+                    'channel': row['channel'],
+                    'description': row['description']
+                },
+                row['fetched_at']
+            )
+            for row in rows
+        ]
+
+    def save_search(self, key: str, movie_name: str, video_info: dict) -> None:
+        """
+        Grava o vídeo encontrado para um filme
+
+        Args:
+            key: Nome normalizado do filme
+            movie_name: Nome do filme como buscado
+            video_info: Resultado de search_video
+        """
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO searches "
+                "(key, movie_name, video_id, title, channel, description, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key, movie_name, video_info['video_id'], video_info['title'],
+                    video_info.get('channel'), video_info.get('description'), time.time()
+                )
+            )
+
+    def get_search_results(self, key: str, count: int, max_age: float) -> list:
+        """
+        Busca os vídeos encontrados para um filme em uma busca de vários trailers
+
+        Args:
+            key: Nome normalizado do filme
+            count: Número de vídeos pedido na busca
+            max_age: Idade máxima do registro, em segundos
+
+        Returns:
+            list: Vídeos (como em search_videos), ou None
+        """
+        row = self._connect().execute(
+            "SELECT payload FROM search_results WHERE key = ? AND count = ? AND fetched_at >= ?",
+            (key, count, time.time() - max_age)
+        ).fetchone()
+        return json.loads(row['payload']) if row else None
+
+    def save_search_results(self, key: str, count: int, videos: list) -> None:
+        """
+        Grava os vídeos encontrados para um filme em uma busca de vários trailers
+
+        Args:
+            key: Nome normalizado do filme
+            count: Número de vídeos pedido na busca
+            videos: Resultado de search_videos
+        """
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO search_results (key, count, payload, fetched_at) VALUES (?, ?, ?, ?)",
+                (key, count, json.dumps(videos, ensure_ascii=False), time.time())
+            )
+
+    def get_comments(self, video_id: str, max_age: float, limit: int) -> CommentBatch:
+        """
+        Busca os comentários gravados de um vídeo
+
+        Só é usada uma coleta concluída (finish_comment_fetch) com pelo menos
+        `limit` comentários pedidos: uma coleta interrompida no meio (ex.: o
+        cliente abandonou o stream) ou reduzida pela quota não é completa.
+        Os comentários gravados pelo refresh incremental (source="time") não
+        fazem parte dela.
+
+        Args:
+            video_id: ID do vídeo
+            max_age: Idade máxima da coleta, em segundos
+            limit: Número máximo de comentários
+
+        Returns:
+            CommentBatch: Comentários (author, text, likes, published_at) na
+            ordem em que foram coletados (vazio se não houver coleta válida)
+        """
+        connection = self._connect()
+        fetch = connection.execute(
+            "SELECT max_results, started_at FROM comment_fetches "
+            "WHERE video_id = ? AND finished_at >= ?",
+            (video_id, time.time() - max_age)
+        ).fetchone()
+        if fetch is None or fetch['max_results'] < limit:
+            return CommentBatch()
+        rows = connection.execute(
+            "SELECT author, text, likes, published_at FROM comments "
+            "WHERE video_id = ? AND source = 'relevance' AND fetched_at >= ? ORDER BY rowid LIMIT ?",
+            (video_id, fetch['started_at'], limit)
+        ).fetchall()
+        return CommentBatch.from_rows(rows)
+
+    def start_comment_fetch(self, video_id: str) -> None:
+        """
+        Registra o início de uma coleta de comentários de um vídeo
+
+        A coleta anterior deixa de valer até esta ser concluída.
+
+        Args:
+            video_id: ID do vídeo
+        """
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO comment_fetches (video_id, max_results, started_at, finished_at) "
+                "VALUES (?, 0, ?, NULL)",
+                (video_id, time.time())
+            )
+
+    def finish_comment_fetch(self, video_id: str, max_results: int) -> None:
+        """
+        Marca como concluída a coleta iniciada com start_comment_fetch
+
+        Args:
+            video_id: ID do vídeo
+            max_results: Número de comentários pedido à API na coleta
+        """
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "UPDATE comment_fetches SET max_results = ?, finished_at = ? WHERE video_id = ?",
+                (max_results, time.time(), video_id)
+            )
+
+    def save_comments(self, video_id: str, comments: CommentBatch, source: str = "relevance") -> None:
+        """
+        Grava comentários de um vídeo, uma transação por página
+
+        Args:
+            video_id: ID do vídeo
+            comments: Comentários retornados por get_comments
+            source: Ordem da coleta na API ("relevance" na análise completa,
+                "time" no refresh incremental)
+        """
+        connection = self._connect()
+        fetched_at = time.time()
+        rows = [(video_id, *row, source, fetched_at) for row in comments.rows()]
+        for start in range(0, len(rows), PAGE_SIZE):
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO comments "
+                    "(video_id, author, text, likes, published_at, source, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows[start:start + PAGE_SIZE]
+                )
+
+    def get_aggregate(self, video_id: str) -> dict:
+        """
+        Busca os totais acumulados da análise de um vídeo
+
+        Args:
+            video_id: ID do vídeo
+
+        Returns:
+            dict: Totais (como em summarize_polarities) e last_published_at,
+            ou None se o vídeo ainda não foi analisado
+        """
+        row = self._connect().execute(
+            "SELECT total, positive, negative, neutral, polarity_sum, last_published_at "
+            "FROM aggregates WHERE video_id = ?",
+            (video_id,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def save_aggregate(self, video_id: str, aggregate: dict) -> None:
+        """
+        Grava os totais acumulados da análise de um vídeo
+
+        Args:
+            video_id: ID do vídeo
+            aggregate: Totais e last_published_at (data do comentário mais novo)
+        """
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO aggregates "
+                "(video_id, total, positive, negative, neutral, polarity_sum, last_published_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    video_id, aggregate['total'], aggregate['positive'], aggregate['negative'],
+                    aggregate['neutral'], aggregate['polarity_sum'], aggregate['last_published_at'],
+                    time.time()
+                )
+            )
+
+    def get_score(self, key: str, max_age: float) -> dict:
+        """
+        Busca o último resultado calculado para um filme
+
+        Args:
+            key: Nome normalizado do filme
+            max_age: Idade máxima do resultado, em segundos
+
+        Returns:
+            dict: Resultado da análise (como em calculate_score), ou None
+        """
+        row = self._connect().execute(
+            "SELECT payload FROM scores WHERE key = ? AND computed_at >= ?",
+            (key, time.time() - max_age)
+        ).fetchone()
+        return json.loads(row['payload']) if row else None
+
+    def save_score(self, key: str, result: dict) -> None:
+        """
+        Grava o resultado calculado para um filme
+
+        Args:
+            key: Nome normalizado do filme
+            result: Resultado da análise
+        """
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO scores (key, payload, computed_at) VALUES (?, ?, ?)",
+                (key, json.dumps(result, ensure_ascii=False), time.time())
+            )
+
+    def save_job(self, job: dict) -> None:
+        """
+        Grava (ou atualiza) um job de análise
+
+        Args:
+            job: Job no formato do modelo Job
+        """
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO jobs "
+                "(job_id, status, movie_name, max_comments, created_at, started_at, finished_at, result, error) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job['job_id'], job['status'], job['movie_name'], job['max_comments'],
+                    job['created_at'], job.get('started_at'), job.get('finished_at'),
+                    json.dumps(job['result'], ensure_ascii=False) if job.get('result') else None,
+                    json.dumps(job['error'], ensure_ascii=False) if job.get('error') else None
+                )
+            )
+
+    def get_job(self, job_id: str) -> dict:
+        """
+        Busca um job de análise
+
+        Args:
+            job_id: ID do job
+
+        Returns:
+            dict: Job no formato do modelo Job, ou None
+        """
+        row = self._connect().execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._job_from_row(row) if row else None
+
+    def get_unfinished_jobs(self) -> list:
+        """
+        Returns:
+            list: Jobs ainda não concluídos (queued ou running), do mais antigo
+            para o mais novo
+        """
+        rows = self._connect().execute(
+            "SELECT * FROM jobs WHERE status IN ('queued', 'running') ORDER BY created_at"
+        ).fetchall()
+        return [self._job_from_row(row) for row in rows]
+
+    def get_translations(self, hashes: list) -> dict:
+        """
+        Busca traduções gravadas
+
+        Args:
+            hashes: Chaves das traduções (text_hash)
+
+        Returns:
+            dict: Tradução de cada chave encontrada
+        """
+        connection = self._connect()
+        translations = {}
+        for start in range(0, len(hashes), PAGE_SIZE):
+            page = hashes[start:start + PAGE_SIZE]
+            rows = connection.execute(
+                f"SELECT hash, text FROM translations WHERE hash IN ({', '.join('?' * len(page))})",
+                page
+            ).fetchall()
+            translations.update((row['hash'], row['text']) for row in rows)
+        return translations
+
+    def save_translations(self, target: str, translations: list) -> None:
+        """
+        Grava traduções
+
+        Args:
+            target: Idioma de destino
+            translations: Pares (chave, tradução)
+        """
+        connection = self._connect()
+        created_at = time.time()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO translations (hash, target, text, created_at) VALUES (?, ?, ?, ?)",
+                [(key, target, text, created_at) for key, text in translations]
+            )
+
+    def get_quota_usage(self, day: str) -> int:
+        """
+        Args:
+            day: Dia de contabilização (YYYY-MM-DD)
+
+        Returns:
+            int: Unidades de quota gastas no dia
+        """
+        row = self._connect().execute("SELECT units FROM quota_usage WHERE day = ?", (day,)).fetchone()
+        return row['units'] if row else 0
+
+    def spend_quota(self, day: str, units: int, limit: int) -> bool:
+        """
+        Soma unidades ao gasto do dia, se couberem no limite
+
+        A verificação e a soma acontecem na mesma transação, então processos
+        concorrentes não ultrapassam o limite.
+
+        Args:
+            day: Dia de contabilização (YYYY-MM-DD)
+            units: Unidades a gastar
+            limit: Quota diária
+
+        Returns:
+            bool: True se as unidades foram registradas
+        """
+        connection = self._connect()
+        with connection:
+            connection.execute("INSERT OR IGNORE INTO quota_usage (day, units) VALUES (?, 0)", (day,))
+            cursor = connection.execute(
+                "UPDATE quota_usage SET units = units + ? WHERE day = ? AND units + ? <= ?",
+                (units, day, units, limit)
+            )
+        return cursor.rowcount > 0
+
+    def save_quota_usage(self, day: str, units: int) -> None:
+        """
+        Eleva o gasto registrado do dia para pelo menos `units`
+
+        Args:
+            day: Dia de contabilização (YYYY-MM-DD)
+            units: Unidades gastas
+        """
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "INSERT INTO quota_usage (day, units) VALUES (?, ?) "
+                "ON CONFLICT (day) DO UPDATE SET units = MAX(units, excluded.units)",
+                (day, units)
+            )
+
+    def _job_from_row(self, row: sqlite3.Row) -> dict:
+        job = dict(row)
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        job['error'] = json.loads(job['error']) if job['error'] else None
+        return job
+
+
+store = Store(STORE_PATH)
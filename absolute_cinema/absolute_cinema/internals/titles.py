@@ -0,0 +1,229 @@
+import re
+import time
+from collections import OrderedDict, defaultdict
+from absolute_cinema.internals.cache import normalize_movie_name
+
+# Palavras ignoradas no fim do título ("Inception trailer oficial" = "Inception")
+TRAILING_WORDS = {"trailer", "official", "oficial"}
+
+_PUNCTUATION = re.compile(r"[^\w\s]|_")
+_NUMBER = re.compile(r"\d+")
+_ROMAN = re.compile(r"m{0,3}(cm|cd|d?c{0,3})(xc|xl|l?x{0,3})(ix|iv|v?i{0,3})")
+_ROMAN_VALUES = {"m": 1000, "d": 500, "c": 100, "l": 50, "x": 10, "v": 5, "i": 1}
+
+# Números por extenso (em português sem "um"/"uma", que também são artigos)
+SPELLED_NUMBERS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6,
+    "seven": 7, "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12,
+    "dois": 2, "duas": 2, "tres": 3, "quatro": 4, "cinco": 5, "seis": 6,
+    "sete": 7, "oito": 8, "nove": 9, "dez": 10, "onze": 11, "doze": 12
+}
+
+
+def normalize_title(name: str) -> str:
+    """
+    Normaliza o título de um filme para a busca do trailer
+
+    Além de normalize_movie_name, troca pontuação por espaço e remove
+    "trailer"/"official"/"oficial" do fim, de forma que "Spider-Man: Homecoming",
+    "spider man homecoming trailer" e "SPIDER MAN HOMECOMING" coincidam.
+
+    Args:
+        name: Nome do filme como digitado pelo usuário
+
+    Returns:
+        str: Título normalizado
+    """
+    words = _PUNCTUATION.sub(" ", normalize_movie_name(name)).split()
+    while len(words) > 1 and words[-1] in TRAILING_WORDS:
+        words.pop()
+    return " ".join(words)
+
+
+def _roman_value(word: str) -> int:
+    """Valor de um numeral romano ("iv" = 4), ou None se `word` não for um"""
+    if not word or not _ROMAN.fullmatch(word):
+        return None
+    values = [_ROMAN_VALUES[char] for char in word]
+    return sum(-value if value < following else value for value, following in zip(values, values[1:] + [0]))
+
+
+def _numbers(title: str) -> list:
+    """
+    Números de um título normalizado, na ordem em que aparecem
+
+    Algarismos, numerais romanos e números por extenso têm o mesmo valor,
+    então "rocky 2", "rocky ii" e "rocky two" coincidem e "episode iv" e
+    "episode vi", não. A primeira palavra nunca é lida como numeral romano
+    ("x men", "i robot").
+    """
+    numbers = []
+    for position, word in enumerate(title.split()):
+        if word.isdigit():
+            numbers.append(int(word))
+        elif word in SPELLED_NUMBERS:
+            numbers.append(SPELLED_NUMBERS[word])
+        else:
+            value = _roman_value(word) if position else None
+            if value is not None:
+                numbers.append(value)
+            else:
+                numbers.extend(int(number) for number in _NUMBER.findall(word))
+    return numbers
+
+
+def _trigrams(title: str) -> set:
+    """Trigramas de caracteres do título (com bordas marcadas por espaço)"""
+    padded = f"  {title} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TitleIndex:
+    """
+    Cache em memória de título normalizado -> vídeo, com busca aproximada
+
+    Um índice de trigramas encontra títulos conhecidos parecidos com o
+    buscado ("spiderman" ~ "spider man"). Para não confundir filmes
+    diferentes, a busca aproximada rejeita títulos em que um é prefixo do
+    outro ("alien" / "aliens", "matrix" / "matrix reloaded") e títulos com
+    números diferentes ("toy story 2" / "toy story 3", "episode iv" /
+    "episode vi"), escritos com algarismos, em romanos ou por extenso.
+
+    Não é thread-safe: foi feito para ser usado dentro do event loop.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, threshold: float):
+        """
+        Args:
+            maxsize: Número máximo de títulos (0 desativa o índice)
+            ttl: Tempo de vida de cada título, em segundos (0 desativa o índice)
+            threshold: Similaridade mínima (Jaccard dos trigramas, 0-1) da busca aproximada
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        self.hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._postings = defaultdict(set)
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, title: str) -> dict:
+        """
+        Busca o vídeo de um título normalizado, exato ou aproximado
+
+        Args:
+            title: Título normalizado (normalize_title)
+
+        Returns:
+            dict: Informações do vídeo, ou None se nenhum título conhecido servir
+        """
+        value = self._get_exact(title)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        match = self._closest(title)
+        if match is not None:
+            value = self._get_exact(match)
+            if value is not None:
+                self.fuzzy_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    def set(self, title: str, value: dict, expires_at: float = None) -> None:
+        """
+        Registra o vídeo de um título, descartando os menos usados se necessário
+
+        Args:
+            title: Título normalizado
+            value: Informações do vídeo
+            expires_at: Expiração (time.time()); padrão: agora + ttl
+        """
+        if not self.enabled or not title:
+            return
+        if title in self._data:
+            self._remove(title)
+        self._data[title] = (expires_at or time.time() + self.ttl, value)
+        for trigram in _trigrams(title):
+            self._postings[trigram].add(title)
+        while len(self._data) > self.maxsize:
+            self._remove(next(iter(self._data)))
+
+    def load(self, entries: list) -> None:
+        """
+        Preenche o índice com buscas persistidas
+
+        Args:
+            entries: Tuplas (título normalizado, vídeo, fetched_at)
+        """
+        for title, value, fetched_at in entries:
+            self.set(title, value, expires_at=fetched_at + self.ttl)
+
+    def clear(self) -> None:
+        """Remove todos os títulos"""
+        self._data.clear()
+        self._postings.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: Contadores de acertos (exatos e aproximados)/falhas e ocupação
+        """
+        return {
+            "hits": self.hits,
+            "fuzzy_hits": self.fuzzy_hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl
+        }
+
+    def _get_exact(self, title: str) -> dict:
+        """Vídeo de um título conhecido e não expirado, ou None"""
+        entry = self._data.get(title)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.time():
+            self._remove(title)
+            return None
+        self._data.move_to_end(title)
+        return value
+
+    def _closest(self, title: str) -> str:
+        """Título conhecido mais parecido com `title`, se passar do limiar"""
+        query = _trigrams(title)
+        shared = defaultdict(int)
+        for trigram in query:
+            for candidate in self._postings.get(trigram, ()):
+                shared[candidate] += 1
+
+        numbers = _numbers(title)
+        best, best_similarity = None, self.threshold
+        for candidate, count in shared.items():
+            similarity = count / (len(query) + len(_trigrams(candidate)) - count)
+            if similarity < best_similarity:
+                continue
+            if candidate.startswith(title) or title.startswith(candidate):
+                continue
+            if _numbers(candidate) != numbers:
+                continue
+            best, best_similarity = candidate, similarity
+        return best
+
+    def _remove(self, title: str) -> None:
+        """Remove um título do cache e do índice de trigramas"""
+        del self._data[title]
+        for trigram in _trigrams(title):
+            postings = self._postings.get(trigram)
+            if postings is not None:
+                postings.discard(title)
+                if not postings:
+                    del self._postings[trigram]
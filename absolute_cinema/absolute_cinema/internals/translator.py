@@ -1,12 +1,203 @@
-from deep_translator import GoogleTranslator
+import os
+import math
+import asyncio
+import hashlib
+import logging
+import threading
+import weakref
+from absolute_cinema.internals.cache import TTLCache
+from absolute_cinema.internals.store import store
 
-def translate_to_english(text: str) -> str:
-    """Traduz texto para inglês"""
+logger = logging.getLogger(__name__)
+
+# Backend de tradução: "google" (padrão) ou "stub" (devolve o texto original,
+# para testes e ambientes sem rede)
+TRANSLATION_BACKEND = os.getenv("TRANSLATION_BACKEND", "google")
+# Entradas do cache em memória (o cache em disco fica no SQLite)
+TRANSLATION_CACHE_MAXSIZE = int(os.getenv("TRANSLATION_CACHE_MAXSIZE", "10000"))
+# Número máximo de textos por chamada ao backend
+TRANSLATION_BATCH_SIZE = int(os.getenv("TRANSLATION_BATCH_SIZE", "50"))
+# Chamadas simultâneas ao backend
+TRANSLATION_CONCURRENCY = int(os.getenv("TRANSLATION_CONCURRENCY", "4"))
+
+# Limite de caracteres de uma requisição ao Google Tradutor
+GOOGLE_MAX_CHARS = 4500
+
+
+class StubBackend:
+    """Backend local: devolve os textos sem traduzir"""
+
+    def translate(self, texts: list, target: str) -> list:
+        return list(texts)
+
+
+class GoogleBackend:
+    """
+    Backend do Google Tradutor (deep_translator)
+
+    Vários textos curtos vão em uma única requisição, separados por quebra de
+    linha. Se a resposta não preservar as linhas, cada texto é traduzido
+    separadamente.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _translator(self, target: str):
+        """Tradutor da thread atual para o idioma de destino (reaproveitado entre chamadas)"""
+        translators = getattr(self._local, "translators", None)
+        if translators is None:
+            translators = self._local.translators = {}
+        if target not in translators:
+            # Importado só no primeiro uso: o deep_translator pesa no cold start
+            from deep_translator import GoogleTranslator
+            translators[target] = GoogleTranslator(source='auto', target=target)
+        return translators[target]
+
+    def warm_up(self) -> None:
+        self._translator("en")
+
+    def translate(self, texts: list, target: str) -> list:
+        translator = self._translator(target)
+        translated = []
+        for chunk in self._chunks([" ".join(text.split()) for text in texts]):
+            lines = (translator.translate("\n".join(chunk)) or "").split("\n")
+            if len(lines) != len(chunk):
+                lines = translator.translate_batch(chunk)
+            translated.extend(lines)
+        return translated
+
+    def _chunks(self, texts: list):
+        """Agrupa textos em requisições de até GOOGLE_MAX_CHARS caracteres"""
+        chunk, size = [], 0
+        for text in texts:
+            if chunk and size + len(text) + 1 > GOOGLE_MAX_CHARS:
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(text)
+            size += len(text) + 1
+        if chunk:
+            yield chunk
+
+
+BACKENDS = {
+    "google": GoogleBackend,
+    "stub": StubBackend
+}
+
+_backend = BACKENDS[TRANSLATION_BACKEND]()
+_cache = TTLCache(maxsize=TRANSLATION_CACHE_MAXSIZE, ttl=math.inf)
+# Um semáforo por event loop, criado no primeiro uso
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def set_backend(backend) -> None:
+    """
+    Troca o backend de tradução (ex.: um stub nos testes)
+
+    Args:
+        backend: Objeto com translate(texts: list, target: str) -> list
+    """
+    global _backend
+    _backend = backend
+    _cache.clear()
+
+
+def warm_up() -> None:
+    """Carrega o backend de tradução (imports e clientes) antes do primeiro uso"""
+    if hasattr(_backend, "warm_up"):
+        _backend.warm_up()
+
+
+def text_hash(text: str, target: str = "en") -> str:
+    """Chave de cache de uma tradução (SHA-256 do idioma de destino e do texto)"""
+    return hashlib.sha256(f"{target}\0{text}".encode("utf-8")).hexdigest()
+
+
+def _semaphore() -> asyncio.Semaphore:
+    """Limita as chamadas simultâneas ao backend no event loop atual"""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(TRANSLATION_CONCURRENCY)
+    return semaphore
+
+
+async def translate_to_english(text: str) -> str:
+    """Traduz texto para inglês (com os mesmos caches de translate_batch)"""
     if not text:
         return text
-    
-    try:
-        translated = GoogleTranslator(source='auto', target='en').translate(text)
-        return translated
-    except:
-        return text
\ No newline at end of file
+    return (await translate_batch([text]))[0]
+
+
+async def translate_batch(texts: list, target: str = "en") -> list:
+    """
+    Traduz vários textos, consultando antes os caches em memória e em disco
+
+    Textos repetidos são traduzidos uma única vez; os demais são enviados ao
+    backend em lotes de TRANSLATION_BATCH_SIZE, com no máximo
+    TRANSLATION_CONCURRENCY lotes simultâneos. Um lote que falha mantém os
+    textos originais (e não é guardado no cache).
+
+    Args:
+        texts: Textos a traduzir
+        target: Idioma de destino (padrão: "en")
+
+    Returns:
+        list: Traduções, na mesma ordem de `texts`
+    """
+    keys = [text_hash(text, target) for text in texts]
+    translations = {}
+    pending = {}
+    for key, text in zip(keys, texts):
+        if not text or key in translations or key in pending:
+            continue
+        cached = _cache.get(key)
+        if cached is not None:
+            translations[key] = cached
+        else:
+            pending[key] = text
+
+    if pending:
+        stored = await asyncio.to_thread(store.get_translations, list(pending))
+        for key, translated in stored.items():
+            translations[key] = translated
+            _cache.set(key, translated)
+            del pending[key]
+
+    if pending:
+        items = list(pending.items())
+        batches = [items[i:i + TRANSLATION_BATCH_SIZE] for i in range(0, len(items), TRANSLATION_BATCH_SIZE)]
+
+        async def translate_one(batch: list) -> list:
+            async with _semaphore():
+                try:
+                    translated = await asyncio.to_thread(_backend.translate, [text for _, text in batch], target)
+                except Exception as e:
+                    logger.warning("Erro na tradução de %d textos: %s", len(batch), e)
+                    return []
+            return [(key, value) for (key, _), value in zip(batch, translated)]
+
+        new = [pair for pairs in await asyncio.gather(*map(translate_one, batches)) for pair in pairs]
+        for key, translated in new:
+            translations[key] = translated
+            _cache.set(key, translated)
+        if new:
+            await asyncio.to_thread(store.save_translations, target, new)
+
+    return [translations.get(key, text) for key, text in zip(keys, texts)]
+
+
+def stats() -> dict:
+    """
+    Returns:
+        dict: Backend em uso e contadores do cache em memória
+    """
+    cache_stats = _cache.stats()
+    return {
+        "backend": type(_backend).__name__,
+        "hits": cache_stats["hits"],
+        "misses": cache_stats["misses"],
+        "size": cache_stats["size"],
+        "maxsize": cache_stats["maxsize"]
+    }
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from absolute_cinema.models.score import Score
+
+class ScoreJobRequest(BaseModel):
+    """Pedido de análise em segundo plano"""
+    name: str = Field(..., description="Nome do filme")
+    max_comments: int = Field(default=150, ge=1, le=10000, description="Número máximo de comentários analisados")
+
+class Job(BaseModel):
+    """Estado de uma análise em segundo plano"""
+    job_id: str = Field(..., description="ID do job")
+    status: str = Field(..., description="queued, running, done ou failed")
+    movie_name: str = Field(..., description="Nome do filme analisado")
+    max_comments: int = Field(..., description="Número máximo de comentários analisados")
+    created_at: float = Field(..., description="Criação do job (timestamp Unix)")
+    started_at: Optional[float] = Field(default=None, description="Início da execução")
+    finished_at: Optional[float] = Field(default=None, description="Fim da execução")
+    result: Optional[Score] = Field(default=None, description="Resultado, quando concluído")
+    error: Optional[dict] = Field(default=None, description="Erro, quando falhou")
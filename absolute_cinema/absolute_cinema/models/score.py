@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 class CommentSample(BaseModel):
     """Modelo para comentário de exemplo"""
@@ -15,6 +15,16 @@ class ScoreDetails(BaseModel):
     negative_percentage: float
     neutral_percentage: float
     average_polarity: float
+    languages: Dict[str, int] = Field(default_factory=dict, description="Comentários por idioma detectado")
+    duplicates_removed: int = Field(default=0, description="Comentários duplicados/spam ignorados")
+
+class VideoScore(BaseModel):
+    """Score de um dos trailers analisados"""
+    video_id: str = Field(..., description="ID do vídeo no YouTube")
+    video_title: str = Field(..., description="Título do vídeo")
+    score: float = Field(..., description="Score do vídeo (0-100)")
+    total_comments: int = Field(..., description="Comentários analisados do vídeo")
+    weight: float = Field(..., description="Peso do vídeo no score final (0-1)")
 
 class Score(BaseModel):
     """Modelo de resposta completo para análise de filme"""
@@ -25,4 +35,5 @@ class Score(BaseModel):
     status: str = Field(default="success", description="Status da operação")
     message: str = Field(..., description="Mensagem de status")
     details: ScoreDetails = Field(..., description="Detalhes da análise")
-    sample_comments: List[CommentSample] = Field(default_factory=list, description="Comentários de exemplo")
\ No newline at end of file
+    sample_comments: List[CommentSample] = Field(default_factory=list, description="Comentários de exemplo")
+    videos: List[VideoScore] = Field(default_factory=list, description="Trailers analisados, quando mais de um")
\ No newline at end of file
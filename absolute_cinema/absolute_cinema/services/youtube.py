@@ -1,7 +1,13 @@
 import os
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import asyncio
+import logging
+import httpx
 from dotenv import load_dotenv
+from absolute_cinema.internals.quota import quota
+from absolute_cinema.internals.comments import CommentBatch
+from absolute_cinema.internals.metrics import STAGE_SECONDS, YOUTUBE_REQUESTS, YOUTUBE_ERRORS
+
+logger = logging.getLogger(__name__)
 
 
 # Exceções customizadas
@@ -28,9 +34,100 @@ class QuotaExceededError(YouTubeAPIError):
 # Carrega variáveis de ambiente
 load_dotenv()
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
+YOUTUBE_HTTP_TIMEOUT = float(os.getenv("YOUTUBE_HTTP_TIMEOUT", "30"))
+YOUTUBE_API_BASE_URL = os.getenv("YOUTUBE_API_BASE_URL", "https://www.googleapis.com/youtube/v3")
+YOUTUBE_MAX_CONNECTIONS = int(os.getenv("YOUTUBE_MAX_CONNECTIONS", "100"))
+
+# Etapa (métrica de duração) de cada recurso da API
+STAGES = {
+    "search": "search",
+    "commentThreads": "comment_page"
+}
+
+# Cliente HTTP assíncrono compartilhado pelo processo (pool de conexões keep-alive)
+_client = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    Retorna o cliente HTTP da API do YouTube, criando-o na primeira chamada
+
+    Returns:
+        httpx.AsyncClient: Cliente com pool de conexões persistentes
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=YOUTUBE_API_BASE_URL,
+            timeout=YOUTUBE_HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=YOUTUBE_MAX_CONNECTIONS,
+                max_keepalive_connections=YOUTUBE_MAX_CONNECTIONS
+            )
+        )
+    return _client
+
+
+async def warm_up() -> None:
+    """
+    Cria o cliente HTTP e abre uma conexão com a API antes da primeira requisição
+
+    A chamada não usa a chave nem gasta quota; só adianta DNS, TCP e TLS,
+    e a conexão fica no pool (keep-alive). Falhas são ignoradas.
+    """
+    try:
+        await _get_client().head("/")
+    except httpx.HTTPError as e:
+        logger.debug("Falha ao pré-conectar à API do YouTube: %s", e)
+
+
+async def close_client() -> None:
+    """Fecha o cliente HTTP compartilhado (chamado no shutdown da aplicação)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _error(exc: Exception) -> Exception:
+    """Registra (log e métrica) um erro da API e o retorna para ser levantado"""
+    logger.warning("%s", exc, extra={"error": type(exc).__name__})
+    if isinstance(exc, YouTubeAPIError):
+        YOUTUBE_ERRORS.labels(type(exc).__name__).inc()
+    return exc
+
 
+async def _api_get(resource: str, **params) -> dict:
+    """
+    Executa um GET na API do YouTube Data v3
+
+    Args:
+        resource: Recurso da API (ex.: "search", "commentThreads")
+        **params: Parâmetros da consulta (valores None são ignorados)
 
-def search_video(movie_name: str, language: str = "en") -> dict:
+    Returns:
+        dict: Corpo JSON da resposta
+
+    Raises:
+        QuotaExceededError: Se a chamada ultrapassaria a quota do dia
+        httpx.HTTPStatusError: Se a API responder com erro
+    """
+    # A quota é reservada antes da chamada: o YouTube cobra mesmo as que falham
+    if not await asyncio.to_thread(quota.spend, resource):
+        raise _error(QuotaExceededError(f"Quota diária insuficiente para {resource} ({quota.cost(resource)} unidades)"))
+    
+    params = {key: value for key, value in params.items() if value is not None}
+    params["key"] = YOUTUBE_API_KEY
+    YOUTUBE_REQUESTS.labels(resource).inc()
+    with STAGE_SECONDS.labels(STAGES.get(resource, resource)).time():
+        response = await _get_client().get(f"/{resource}", params=params)
+    if response.status_code == 403 and "quotaExceeded" in response.text:
+        await asyncio.to_thread(quota.exhaust)
+    response.raise_for_status()
+    return response.json()
+
+
+async def search_video(movie_name: str, language: str = "en") -> dict:
     """
     Busca vídeo trailer do filme no YouTube
     
@@ -41,6 +138,29 @@ def search_video(movie_name: str, language: str = "en") -> dict:
     Returns:
         dict: Informações do vídeo (video_id, title, channel, description)
         
+    Raises:
+        As mesmas exceções de search_videos
+    """
+    videos = await search_videos(movie_name, language)
+    return videos[0]
+
+
+async def search_videos(movie_name: str, language: str = "en", max_results: int = 1) -> list:
+    """
+    Busca os trailers mais relevantes do filme no YouTube
+    
+    Uma única chamada ao search.list (mesmo custo de quota para 1 ou mais
+    vídeos).
+    
+    Args:
+        movie_name: Nome do filme
+        language: Código do idioma para relevância (padrão: "en")
+        max_results: Número máximo de vídeos (padrão: 1)
+        
+    Returns:
+        list: Vídeos (video_id, title, channel, description), do mais
+        relevante para o menos relevante
+        
     Raises:
         VideoNotFoundError: Se nenhum vídeo for encontrado
         QuotaExceededError: Se a quota da API for excedida
@@ -50,71 +170,67 @@ def search_video(movie_name: str, language: str = "en") -> dict:
         raise YouTubeAPIError("YOUTUBE_API_KEY não configurada nas variáveis de ambiente")
     
     try:
-        youtube = build("youtube", "v3", developerKey=YOUTUBE_API_KEY)
         query = f"{movie_name} trailer oficial"
         
-        print(f"🔍 Buscando: {query}")
+        logger.info("Buscando: %s", query, extra={"movie": movie_name})
         
-        request = youtube.search().list(
+        response = await _api_get(
+            "search",
             part="snippet",
             q=query,
             type="video",
-            maxResults=1,
+            maxResults=max_results,
             relevanceLanguage=language,
             order="relevance"
         )
-        response = request.execute()
         
         items = response.get('items', [])
         
         if not items:
-            raise VideoNotFoundError(f"Nenhum vídeo encontrado para '{movie_name}'")
-        
-        video = items[0]
-        video_id = video['id']['videoId']
-        video_title = video['snippet']['title']
-        
-        print(f"✓ Vídeo encontrado: {video_title}")
-        print(f"  ID: {video_id}")
-        
-        return {
-            'video_id': video_id,
-            'title': video_title,
-            'channel': video['snippet']['channelTitle'],
-            'description': video['snippet']['description']
-        }
-        
-    except HttpError as e:
-        if e.resp.status == 403:
-            error_message = "Quota da API do YouTube excedida"
-            print(f"✗ {error_message}")
-            raise QuotaExceededError(error_message) from e
-        elif e.resp.status == 400:
-            error_message = f"Busca inválida para '{movie_name}'"
-            print(f"✗ {error_message}")
-            raise ValueError(error_message) from e
+            raise _error(VideoNotFoundError(f"Nenhum vídeo encontrado para '{movie_name}'"))
+        
+        videos = []
+        for video in items:
+            video_id = video['id']['videoId']
+            video_title = video['snippet']['title']
+            
+            logger.info("Vídeo encontrado: %s", video_title, extra={"movie": movie_name, "video_id": video_id})
+            
+            videos.append({
+                'video_id': video_id,
+                'title': video_title,
+                'channel': video['snippet']['channelTitle'],
+                'description': video['snippet']['description']
+            })
+        return videos
+        
+    except httpx.HTTPStatusError as e:
+        status_code = e.response.status_code
+        if status_code == 403:
+            raise _error(QuotaExceededError("Quota da API do YouTube excedida")) from e
+        elif status_code == 400:
+            raise _error(ValueError(f"Busca inválida para '{movie_name}'")) from e
         else:
-            error_message = f"Erro de comunicação com a API: {e.resp.status}"
-            print(f"✗ {error_message}")
-            raise YouTubeAPIError(error_message) from e
-    except VideoNotFoundError:
+            raise _error(YouTubeAPIError(f"Erro de comunicação com a API: {status_code}")) from e
+    except YouTubeAPIError:
         raise
     except Exception as e:
-        error_message = f"Erro inesperado ao buscar vídeo: {e}"
-        print(f"✗ {error_message}")
-        raise YouTubeAPIError(error_message) from e
+        raise _error(YouTubeAPIError(f"Erro inesperado ao buscar vídeo: {e}")) from e
 
 
-def get_comments(video_id: str, max_results: int = 150) -> list:
+async def iter_comment_pages(video_id: str, max_results: int = 150, order: str = "relevance", since: str = None):
     """
-    Obtém comentários do vídeo do YouTube
+    Obtém comentários do vídeo do YouTube, página por página
     
     Args:
         video_id: ID do vídeo
         max_results: Número máximo de comentários (padrão: 150)
+        order: Ordem da API, "relevance" (padrão) ou "time" (mais novos primeiro)
+        since: Com order="time", para ao encontrar um comentário publicado
+            nesta data (ISO 8601) ou antes dela
         
-    Returns:
-        list: Lista de dicionários com comentários (author, text, likes, published_at)
+    Yields:
+        CommentBatch: Comentários de cada página (author, text, likes, published_at)
         
     Raises:
         CommentsDisabledError: Se comentários estiverem desativados
@@ -125,89 +241,151 @@ def get_comments(video_id: str, max_results: int = 150) -> list:
     if not YOUTUBE_API_KEY:
         raise YouTubeAPIError("YOUTUBE_API_KEY não configurada nas variáveis de ambiente")
     
-    comments = []
+    collected = 0
     next_page_token = None
+    reached_since = False
     
     try:
-        youtube = build("youtube", "v3", developerKey=YOUTUBE_API_KEY)
-        
-        print(f"💬 Coletando comentários do vídeo {video_id}...")
+        logger.info("Coletando comentários do vídeo %s", video_id, extra={"video_id": video_id})
         
-        while len(comments) < max_results:
-            request = youtube.commentThreads().list(
+        while collected < max_results:
+            response = await _api_get(
+                "commentThreads",
                 part="snippet",
                 videoId=video_id,
-                maxResults=min(100, max_results - len(comments)),
+                maxResults=min(100, max_results - collected),
                 textFormat="plainText",
                 pageToken=next_page_token,
-                order="relevance"
+                order=order
             )
-            response = request.execute()
             
+            page = CommentBatch()
             for item in response.get('items', []):
                 try:
                     snippet = item['snippet']['topLevelComment']['snippet']
+                    
+                    # Comentários já vistos em uma análise anterior
+                    if since and snippet['publishedAt'] <= since:
+                        reached_since = True
+                        break
+                    
                     text = snippet['textDisplay'].strip()
                     
                     # Filtra comentários muito curtos
                     if len(text) > 5:
-                        comments.append({
-                            'author': snippet['authorDisplayName'],
-                            'text': text,
-                            'likes': snippet.get('likeCount', 0),
-                            'published_at': snippet['publishedAt']
-                        })
-                except KeyError:
+                        page.append(snippet['authorDisplayName'], text, snippet.get('likeCount', 0), snippet['publishedAt'])
+                except (KeyError, ValueError):
                     # Ignora comentários mal formatados
                     continue
             
             next_page_token = response.get('nextPageToken')
+            collected += len(page)
             
             # Imprime progresso
-            print(f"  ↳ {len(comments)} comentários coletados até agora...")
+            logger.debug("%d comentários coletados até agora", collected, extra={"video_id": video_id})
+            
+            yield page
             
-            if not next_page_token:
+            if not next_page_token or reached_since:
                 break
         
-        print(f"✓ Total de {len(comments)} comentários coletados")
-        return comments
-        
-    except HttpError as e:
-        error_content = str(e.content) if hasattr(e, 'content') else str(e)
+    except httpx.HTTPStatusError as e:
+        status_code = e.response.status_code
+        error_content = e.response.text
         
         if "commentsDisabled" in error_content:
-            error_message = "Comentários estão desativados para este vídeo"
-            print(f"✗ {error_message}")
-            raise CommentsDisabledError(error_message) from e
-        elif e.resp.status == 403:
-            error_message = "Quota da API do YouTube excedida"
-            print(f"✗ {error_message}")
-            raise QuotaExceededError(error_message) from e
-        elif e.resp.status == 404 or e.resp.status == 400:
-            error_message = f"Vídeo {video_id} não encontrado"
-            print(f"✗ {error_message}")
-            raise VideoNotFoundError(error_message) from e
+            raise _error(CommentsDisabledError("Comentários estão desativados para este vídeo")) from e
+        elif status_code == 403:
+            raise _error(QuotaExceededError("Quota da API do YouTube excedida")) from e
+        elif status_code == 404 or status_code == 400:
+            raise _error(VideoNotFoundError(f"Vídeo {video_id} não encontrado")) from e
         else:
-            error_message = f"Erro ao buscar comentários: {e.resp.status}"
-            print(f"✗ {error_message}")
-            raise YouTubeAPIError(error_message) from e
+            raise _error(YouTubeAPIError(f"Erro ao buscar comentários: {status_code}")) from e
+    except YouTubeAPIError:
+        raise
     except Exception as e:
-        error_message = f"Erro inesperado ao coletar comentários: {e}"
-        print(f"✗ {error_message}")
-        raise YouTubeAPIError(error_message) from e
+        raise _error(YouTubeAPIError(f"Erro inesperado ao coletar comentários: {e}")) from e
+
+
+async def prefetch_pages(pages, depth: int = 1):
+    """
+    Busca as próximas páginas em segundo plano enquanto a atual é processada
+    
+    No máximo `depth` páginas ficam aguardando processamento, então a memória
+    continua limitada mesmo para muitos comentários.
+    
+    Args:
+        pages: Iterador assíncrono de páginas (ex.: iter_comment_pages)
+        depth: Número de páginas buscadas antecipadamente
+        
+    Yields:
+        list: As mesmas páginas de `pages`, na mesma ordem
+    """
+    queue = asyncio.Queue(maxsize=depth)
+    finished = object()
+    
+    async def produce():
+        try:
+            async for page in pages:
+                await queue.put(page)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(finished)
+    
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is finished:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+        try:
+            await producer
+        except asyncio.CancelledError:
+            pass
+
+
+async def get_comments(video_id: str, max_results: int = 150, order: str = "relevance", since: str = None) -> CommentBatch:
+    """
+    Obtém comentários do vídeo do YouTube
+    
+    Args:
+        video_id: ID do vídeo
+        max_results: Número máximo de comentários (padrão: 150)
+        order: Ordem da API, "relevance" (padrão) ou "time" (mais novos primeiro)
+        since: Com order="time", para ao encontrar um comentário publicado
+            nesta data (ISO 8601) ou antes dela
+        
+    Returns:
+        CommentBatch: Comentários (author, text, likes, published_at)
+        
+    Raises:
+        As mesmas exceções de iter_comment_pages
+    """
+    comments = CommentBatch()
+    async for page in iter_comment_pages(video_id, max_results, order, since):
+        comments.extend(page)
+    
+    logger.info("Total de %d comentários coletados", len(comments), extra={"video_id": video_id})
+    return comments
 
 
 # Exemplo de uso
-if __name__ == "__main__":
+async def _example():
     try:
         # Buscar vídeo
         movie = "Inception"
-        video_info = search_video(movie)
+        video_info = await search_video(movie)
         print(f"\n📹 Vídeo: {video_info['title']}")
         print(f"📺 Canal: {video_info['channel']}")
         
         # Obter comentários
-        comments = get_comments(video_info['video_id'], max_results=50)
+        comments = await get_comments(video_info['video_id'], max_results=50)
         
         print(f"\n💭 Primeiros 5 comentários:")
         for i, comment in enumerate(comments[:5], 1):
@@ -222,4 +400,9 @@ if __name__ == "__main__":
         print(f"❌ Quota excedida: {e}")
     except YouTubeAPIError as e:
         print(f"❌ Erro na API: {e}")
-        
\ No newline at end of file
+    finally:
+        await close_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(_example())
@@ -1,8 +1,28 @@
 import os
+import asyncio
+import logging
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from absolute_cinema.views.score import router as score_router
+from absolute_cinema.views.jobs import router as jobs_router
+from absolute_cinema.views.metrics import router as metrics_router
+from absolute_cinema.internals.logs import configure_logging
+from absolute_cinema.internals import sentimeter, translator
+from absolute_cinema.internals.sentimeter import start_pool, shutdown_pool, SENTIMENT_WORKERS
+from absolute_cinema.internals.language import get_model
+from absolute_cinema.services import youtube
+from absolute_cinema.services.youtube import close_client
+from absolute_cinema.internals.store import store
+from absolute_cinema.controllers.job import job_scheduler
+from absolute_cinema.controllers.movie import search_index, STORE_SEARCH_TTL, TRANSLATE_COMMENTS
+
+configure_logging()
+logger = logging.getLogger("absolute_cinema.views.app")
+
+# Pré-carrega modelos e clientes em segundo plano logo após o startup, para
+# que a primeira requisição depois de um cold start não pague esse custo
+WARMUP = os.getenv("WARMUP", "true").lower() == "true"
 
 # Cria a aplicação FastAPI
 app = FastAPI(
@@ -22,8 +42,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Inclui as rotas de score
+# Inclui as rotas de score, de jobs e de métricas
 app.include_router(score_router)
+app.include_router(jobs_router)
+app.include_router(metrics_router)
 
 
 # Exception handler global (deve estar no app, não no router)
@@ -35,9 +57,10 @@ async def global_exception_handler(request: Request, exc: Exception):
     Captura qualquer exceção que não foi tratada especificamente
     e retorna uma resposta JSON padronizada
     """
-    print(f"❌ Exceção não tratada: {type(exc).__name__}: {str(exc)}")
-    print(f"   Path: {request.url.path}")
-    print(f"   Method: {request.method}")
+    logger.error(
+        "Exceção não tratada: %s: %s", type(exc).__name__, exc, exc_info=exc,
+        extra={"path": request.url.path, "method": request.method}
+    )
     
     # Em modo debug, mostra detalhes do erro
     debug_mode = os.getenv("DEBUG", "False").lower() == "true"
@@ -71,27 +94,56 @@ async def root():
     }
 
 
+async def warm_up() -> None:
+    """
+    Carrega o que a primeira análise usaria: backend de sentimentos (também
+    nos workers do pool), modelo de idiomas, tradutor e conexão com o YouTube
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    try:
+        await asyncio.gather(
+            asyncio.to_thread(sentimeter.warm_up),
+            asyncio.to_thread(get_model),
+            asyncio.to_thread(translator.warm_up) if TRANSLATE_COMMENTS else asyncio.sleep(0),
+            youtube.warm_up()
+        )
+    except Exception as e:
+        logger.warning("Falha no warm-up: %s", e)
+        return
+    logger.info("Warm-up concluído em %.2fs", loop.time() - start)
+
+
 # Startup event
 @app.on_event("startup")
 async def startup_event():
     """
     Executado quando a aplicação inicia
     """
-    print("\n" + "="*50)
-    print("🎬 Absolute Cinema API")
-    print("="*50)
-    print(f"✓ Servidor iniciado")
-    print(f"✓ Documentação disponível em: /docs")
+    logger.info("Absolute Cinema API iniciada (documentação em /docs, métricas em /metrics)")
     
     # Verifica configurações
     youtube_api = os.getenv("YOUTUBE_API_KEY")
     if youtube_api:
-        print(f"✓ YouTube API configurada")
+        logger.info("YouTube API configurada")
     else:
-        print(f"⚠️  YouTube API NÃO configurada!")
-        print(f"   Configure YOUTUBE_API_KEY no arquivo .env")
+        logger.warning("YouTube API NÃO configurada! Configure YOUTUBE_API_KEY no arquivo .env")
+    
+    # Pool de processos para análise de sentimentos
+    start_pool()
+    if SENTIMENT_WORKERS > 1:
+        logger.info("Pool de sentimentos com %d processos", SENTIMENT_WORKERS)
+    
+    # Trailers já conhecidos, para resolver buscas sem gastar quota
+    search_index.load(await asyncio.to_thread(store.get_searches, STORE_SEARCH_TTL))
+    logger.info("%d trailers no cache de buscas", search_index.stats()['size'])
+    
+    # Workers das análises em segundo plano
+    await job_scheduler.start()
+    logger.info("%d workers de jobs ativos", job_scheduler.concurrency)
     
-    print("="*50 + "\n")
+    # Warm-up em segundo plano: o servidor já aceita requisições
+    app.state.warmup = asyncio.create_task(warm_up()) if WARMUP else None
 
 
 # Shutdown event
@@ -100,7 +152,14 @@ async def shutdown_event():
     """
     Executado quando a aplicação é encerrada
     """
-    print("\n🛑 Servidor encerrado\n")
+    warmup = getattr(app.state, "warmup", None)
+    if warmup is not None and not warmup.done():
+        warmup.cancel()
+    await job_scheduler.stop()
+    shutdown_pool()
+    await close_client()
+    store.close()
+    logger.info("Servidor encerrado")
 
 
 if __name__ == "__main__":
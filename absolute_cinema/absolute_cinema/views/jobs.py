@@ -0,0 +1,64 @@
+import logging
+from fastapi import APIRouter, HTTPException, status
+from absolute_cinema.models.job import ScoreJobRequest, Job
+from absolute_cinema.controllers.job import job_scheduler, JobQueueFullError
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    tags=["jobs"],
+    responses={
+        404: {"description": "Job não encontrado"},
+        503: {"description": "Fila de análises cheia"}
+    }
+)
+
+
+@router.post(
+    "/jobs/score",
+    response_model=Job,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Agendar análise do filme",
+    description="Enfileira uma análise (que pode ser profunda) e retorna o ID do job"
+)
+async def create_score_job(request: ScoreJobRequest) -> Job:
+    """Endpoint para agendar uma análise em segundo plano"""
+    try:
+        job = await job_scheduler.submit(request)
+    except JobQueueFullError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "Fila cheia",
+                "message": str(e),
+                "suggestion": "Tente novamente em alguns instantes"
+            }
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "error": "Dados inválidos",
+                "message": str(e),
+                "suggestion": "Verifique os dados enviados"
+            }
+        )
+    
+    logger.info("Job %s enfileirado: %s", job['job_id'], request.name, extra={"job_id": job['job_id'], "movie": request.name})
+    return Job(**job)
+
+
+@router.get("/jobs/{job_id}", response_model=Job)
+async def get_score_job(job_id: str) -> Job:
+    """Endpoint para consultar o estado e o resultado de um job"""
+    job = await job_scheduler.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "Job não encontrado",
+                "message": f"Nenhum job com ID '{job_id}'",
+                "suggestion": "Verifique o ID retornado pelo POST /jobs/score"
+            }
+        )
+    return Job(**job)
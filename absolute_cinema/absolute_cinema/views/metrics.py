@@ -0,0 +1,29 @@
+import asyncio
+from fastapi import APIRouter, Response
+from absolute_cinema.controllers.movie import score_cache, score_flight, search_index
+from absolute_cinema.controllers.job import job_scheduler
+from absolute_cinema.internals.quota import quota
+from absolute_cinema.internals.metrics import register_stats, render
+from absolute_cinema.internals import translator
+
+router = APIRouter(tags=["metrics"])
+
+# Mesmos componentes do /health, expostos como gauges
+register_stats("score_cache", score_cache.stats)
+register_stats("score_singleflight", score_flight.stats)
+register_stats("search_cache", search_index.stats)
+register_stats("jobs", job_scheduler.stats)
+register_stats("youtube_quota", quota.stats)
+register_stats("translation_cache", translator.stats)
+
+
+@router.get(
+    "/metrics",
+    summary="Métricas no formato do Prometheus",
+    description="Latência por etapa da análise, chamadas à API do YouTube e estatísticas dos caches"
+)
+async def metrics() -> Response:
+    """Endpoint de coleta do Prometheus"""
+    # A quota é lida do SQLite, então a coleta sai do event loop
+    body, content_type = await asyncio.to_thread(render)
+    return Response(content=body, media_type=content_type)
@@ -1,8 +1,17 @@
 import os
-from fastapi import APIRouter, HTTPException, status
+import json
+import asyncio
+import logging
+from typing import List
+from fastapi import APIRouter, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from absolute_cinema.models.movie import Movie
 from absolute_cinema.models.score import Score
-from absolute_cinema.controllers.movie import MovieController
+from absolute_cinema.controllers.movie import MovieController, score_cache, score_flight, search_index
+from absolute_cinema.controllers.job import job_scheduler
+from absolute_cinema.internals.cache import normalize_movie_name
+from absolute_cinema.internals.quota import quota
+from absolute_cinema.internals.metrics import STAGE_SECONDS
 from absolute_cinema.services.youtube import (
     VideoNotFoundError,
     CommentsDisabledError,
@@ -10,6 +19,12 @@ from absolute_cinema.services.youtube import (
     YouTubeAPIError
 )
 
+logger = logging.getLogger(__name__)
+
+# Limites do POST /score/batch
+BATCH_MAX_SIZE = int(os.getenv("BATCH_MAX_SIZE", "200"))
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "5"))
+
 router = APIRouter(
     tags=["movies"],
     responses={
@@ -22,114 +37,201 @@ router = APIRouter(
 )
 
 
-@router.post(
-    "/score",
-    response_model=Score,
-    status_code=status.HTTP_200_OK,
-    summary="Calcular score do filme",
-    description="Calcula o score de um filme baseado em análise de sentimentos"
-)
-async def calculate_score(movie: Movie) -> Score:
-    """Endpoint para calcular o score de um filme"""
-    
-    YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
-    if not YOUTUBE_API_KEY:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail={
-                "error": "API não configurada",
-                "message": "YouTube API não está configurada",
-                "solution": "Configure YOUTUBE_API_KEY no arquivo .env"
-            }
-        )
+def _http_exception(exc: Exception, movie: Movie) -> HTTPException:
+    """
+    Converte uma exceção da análise na resposta HTTP correspondente
     
-    try:
-        print(f"\n🎬 Processando filme: {movie.name}")
-        
-        controller = MovieController()
-        result = controller.calculate_score(movie)
+    Args:
+        exc: Exceção levantada pelo controller
+        movie: Filme sendo analisado
         
-        # Debug: imprime o resultado antes de converter
-        print(f"📋 DEBUG - Tipo do resultado: {type(result)}")
-        print(f"📋 DEBUG - Keys do resultado: {result.keys() if isinstance(result, dict) else 'não é dict'}")
-        
-        # Converte dict para Score
-        score_response = Score(**result)
-        
-        print(f"✓ Score calculado: {score_response.score}/100\n")
-        return score_response
-        
-    except VideoNotFoundError as e:
-        print(f"✗ Vídeo não encontrado: {movie.name}\n")
-        raise HTTPException(
+    Returns:
+        HTTPException: Erro com status e detalhes para o cliente
+    """
+    if isinstance(exc, YouTubeAPIError):
+        logger.warning("%s: %s", type(exc).__name__, exc, extra={"movie": movie.name})
+    
+    if isinstance(exc, VideoNotFoundError):
+        return HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={
                 "error": "Vídeo não encontrado",
-                "message": str(e),
+                "message": str(exc),
                 "movie": movie.name,
                 "suggestion": "Verifique o nome do filme ou tente em inglês"
             }
         )
     
-    except CommentsDisabledError as e:
-        print(f"✗ Comentários desativados: {movie.name}\n")
-        raise HTTPException(
+    if isinstance(exc, CommentsDisabledError):
+        return HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail={
                 "error": "Comentários desativados",
-                "message": str(e),
+                "message": str(exc),
                 "movie": movie.name,
                 "suggestion": "Este vídeo não permite comentários"
             }
         )
     
-    except QuotaExceededError as e:
-        print(f"✗ Quota excedida\n")
-        raise HTTPException(
+    if isinstance(exc, QuotaExceededError):
+        return HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail={
                 "error": "Quota excedida",
-                "message": str(e),
+                "message": str(exc),
                 "suggestion": "Quota diária excedida. Tente amanhã"
             }
         )
     
-    except YouTubeAPIError as e:
-        print(f"✗ Erro da API: {str(e)}\n")
-        raise HTTPException(
+    if isinstance(exc, YouTubeAPIError):
+        return HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
                 "error": "Erro na API do YouTube",
-                "message": str(e),
+                "message": str(exc),
                 "suggestion": "Tente novamente em alguns instantes"
             }
         )
     
-    except ValueError as e:
-        print(f"✗ Erro de validação: {str(e)}\n")
-        raise HTTPException(
+    if isinstance(exc, ValueError):
+        logger.info("Erro de validação: %s", exc, extra={"movie": movie.name})
+        return HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail={
                 "error": "Dados inválidos",
-                "message": str(e),
+                "message": str(exc),
                 "suggestion": "Verifique os dados enviados"
             }
         )
     
-    except Exception as e:
-        print(f"✗ Erro inesperado: {str(e)}\n")
-        import traceback
-        traceback.print_exc()
+    # Erro inesperado
+    logger.error("Erro inesperado: %s", exc, exc_info=exc, extra={"movie": movie.name})
+    
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail={
+            "error": "Erro interno",
+            "message": f"Erro inesperado: {str(exc)}",
+            "movie": movie.name,
+            "type": type(exc).__name__
+        }
+    )
+
+
+def _require_api_key() -> None:
+    """Levanta 503 se a YouTube API não estiver configurada"""
+    YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
+    if not YOUTUBE_API_KEY:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "API não configurada",
+                "message": "YouTube API não está configurada",
+                "solution": "Configure YOUTUBE_API_KEY no arquivo .env"
+            }
+        )
+
+
+def _sse(event: str, data: dict) -> str:
+    """Formata um evento Server-Sent Events"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post(
+    "/score",
+    response_model=Score,
+    status_code=status.HTTP_200_OK,
+    summary="Calcular score do filme",
+    description="Calcula o score de um filme baseado em análise de sentimentos"
+)
+async def calculate_score(movie: Movie, response: Response) -> Score:
+    """Endpoint para calcular o score de um filme"""
+    
+    _require_api_key()
+    
+    try:
+        logger.info("Processando filme: %s", movie.name, extra={"movie": movie.name})
+        
+        controller = MovieController()
+        result, cache_hit = await controller.get_score(movie)
+        response.headers["X-Cache"] = "HIT" if cache_hit else "MISS"
+        
+        logger.debug("Resultado: %s", list(result))
+        
+        # Converte dict para Score
+        with STAGE_SECONDS.labels("serialization").time():
+            score_response = Score(**result)
+        
+        logger.info(
+            "Score calculado: %s/100", score_response.score,
+            extra={"movie": movie.name, "score": score_response.score, "cache": cache_hit}
+        )
+        return score_response
         
+    except Exception as e:
+        raise _http_exception(e, movie) from e
+
+
+@router.post(
+    "/score/batch",
+    summary="Calcular score de vários filmes",
+    description="Calcula o score de uma lista de filmes, emitindo cada resultado (NDJSON) assim que fica pronto"
+)
+async def calculate_score_batch(movies: List[Movie]) -> StreamingResponse:
+    """
+    Endpoint para calcular o score de vários filmes em uma requisição
+    
+    Títulos repetidos (mesmo nome normalizado) são analisados uma única vez
+    e no máximo BATCH_CONCURRENCY análises rodam ao mesmo tempo. Cada linha
+    da resposta é um JSON com o resultado de um filme:
+        {"movie": ..., "status": "success", "result": {...Score}}
+        {"movie": ..., "status": "error", "status_code": ..., "detail": {...}}
+    """
+    _require_api_key()
+    
+    if len(movies) > BATCH_MAX_SIZE:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail={
-                "error": "Erro interno",
-                "message": f"Erro inesperado: {str(e)}",
-                "movie": movie.name,
-                "type": type(e)._name_
+                "error": "Dados inválidos",
+                "message": f"Máximo de {BATCH_MAX_SIZE} filmes por requisição",
+                "suggestion": "Divida a lista em requisições menores"
             }
         )
+    
+    unique = {}
+    for movie in movies:
+        unique.setdefault(normalize_movie_name(movie.name), movie)
+    
+    logger.info("Processando lote: %d filmes (%d pedidos)", len(unique), len(movies))
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    
+    async def score_one(movie: Movie) -> dict:
+        async with semaphore:
+            try:
+                result, _ = await MovieController().get_score(movie)
+                with STAGE_SECONDS.labels("serialization").time():
+                    result = Score(**result).model_dump()
+                return {"movie": movie.name, "status": "success", "result": result}
+            except Exception as e:
+                error = _http_exception(e, movie)
+                return {
+                    "movie": movie.name,
+                    "status": "error",
+                    "status_code": error.status_code,
+                    "detail": error.detail
+                }
+    
+    async def lines():
+        tasks = [asyncio.create_task(score_one(movie)) for movie in unique.values()]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield json.dumps(await finished, ensure_ascii=False) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.get("/health")
@@ -140,13 +242,56 @@ async def health_check() -> dict:
     return {
         "status": "healthy",
         "youtube_api_configured": bool(YOUTUBE_API_KEY),
+        "score_cache": score_cache.stats(),
+        "score_singleflight": score_flight.stats(),
+        "search_cache": search_index.stats(),
+        "jobs": job_scheduler.stats(),
+        "youtube_quota": await asyncio.to_thread(quota.stats),
         "service": "Absolute Cinema API",
         "version": "1.0.0"
     }
 
 
 @router.get("/score/{movie_name}", response_model=Score)
-async def calculate_score_get(movie_name: str) -> Score:
+async def calculate_score_get(movie_name: str, response: Response) -> Score:
     """Endpoint GET alternativo para calcular score"""
     movie = Movie(name=movie_name)
-    return await calculate_score(movie)
\ No newline at end of file
+    return await calculate_score(movie, response)
+
+
+@router.get(
+    "/score/{movie_name}/stream",
+    summary="Calcular score do filme com progresso",
+    description="Emite o progresso da análise e scores parciais via Server-Sent Events"
+)
+async def calculate_score_stream(movie_name: str) -> StreamingResponse:
+    """
+    Endpoint SSE para calcular o score de um filme
+    
+    Eventos emitidos:
+        stage: início de cada etapa (search, comments, samples)
+        video: trailer encontrado
+        partial: score parcial após cada página de comentários
+        result: resultado final (mesmo formato do POST /score)
+        error: erro com o mesmo status e detalhes do POST /score
+    """
+    _require_api_key()
+    movie = Movie(name=movie_name)
+    
+    async def events():
+        logger.info("Processando filme (stream): %s", movie.name, extra={"movie": movie.name})
+        try:
+            async for event, data in MovieController().stream_score(movie):
+                if event == "result":
+                    with STAGE_SECONDS.labels("serialization").time():
+                        data = Score(**data).model_dump()
+                yield _sse(event, data)
+        except Exception as e:
+            error = _http_exception(e, movie)
+            yield _sse("error", {"status_code": error.status_code, "detail": error.detail})
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
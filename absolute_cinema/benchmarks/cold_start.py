@@ -0,0 +1,99 @@
+"""
+Benchmark do cold start: tempo de import da aplicação e da primeira requisição
+
+Cada medição roda em um processo Python novo (como um serviço que acabou de
+acordar no Render), com e sem o warm-up do startup (WARMUP). As chamadas ao
+YouTube vão para benchmarks.fake_youtube, sem latência simulada.
+
+Uso (a partir da pasta do projeto):
+    python -m benchmarks.cold_start
+    python -m benchmarks.cold_start --runs 10
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+METRICS = ("import_ms", "startup_ms", "warmup_ms", "first_request_ms", "second_request_ms")
+
+
+def child() -> None:
+    """Executado no processo novo: mede e imprime uma linha JSON"""
+    start = time.perf_counter()
+    import asyncio
+    import httpx
+    from absolute_cinema.views.app import app
+    from absolute_cinema.services import youtube
+    from benchmarks.fake_youtube import FakeYouTube
+    imported = time.perf_counter()
+
+    async def requests() -> dict:
+        timings = {"import_ms": (imported - start) * 1000}
+        # Instalado antes do startup, para o warm-up também usar o YouTube simulado
+        youtube._client = FakeYouTube(latency=0).client()
+        async with app.router.lifespan_context(app):
+            timings["startup_ms"] = (time.perf_counter() - imported) * 1000
+
+            # O servidor fica ocioso até o warm-up terminar (a primeira
+            # requisição costuma chegar depois disso)
+            began = time.perf_counter()
+            warmup = getattr(app.state, "warmup", None)
+            if warmup is not None:
+                await warmup
+            timings["warmup_ms"] = (time.perf_counter() - began) * 1000
+
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as client:
+                for key, name in (("first_request_ms", "Cold Start"), ("second_request_ms", "Warm Start")):
+                    began = time.perf_counter()
+                    response = await client.post("/score", json={"name": name})
+                    response.raise_for_status()
+                    timings[key] = (time.perf_counter() - began) * 1000
+        return timings
+
+    print(json.dumps(asyncio.run(requests())))
+
+
+def run(warmup: bool) -> dict:
+    """Executa uma medição em um processo novo"""
+    directory = tempfile.mkdtemp(prefix="absolute-cinema-")
+    env = {
+        **os.environ,
+        "WARMUP": str(warmup).lower(),
+        "YOUTUBE_API_KEY": "benchmark",
+        "STORE_PATH": os.path.join(directory, "benchmark.db"),
+        "QUOTA_DAILY_LIMIT": "0",
+        "LOG_LEVEL": "WARNING"
+    }
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.cold_start", "--child"],
+        env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def benchmark(runs: int) -> None:
+    """Mediana de cada etapa em `runs` processos, com e sem warm-up"""
+    print(f"✓ Cold start (mediana de {runs} processos)")
+    for warmup in (False, True):
+        results = [run(warmup) for _ in range(runs)]
+        medians = {key: statistics.median(result[key] for result in results) for key in METRICS}
+        print(
+            f"  WARMUP={str(warmup).lower():<5}  import {medians['import_ms']:.0f} ms  "
+            f"startup {medians['startup_ms']:.0f} ms  warm-up {medians['warmup_ms']:.0f} ms  "
+            f"1ª requisição {medians['first_request_ms']:.0f} ms  2ª {medians['second_request_ms']:.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark do cold start da aplicação")
+    parser.add_argument("--runs", type=int, default=5, help="Processos medidos em cada configuração")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child()
+    else:
+        benchmark(args.runs)
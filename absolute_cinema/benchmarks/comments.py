@@ -0,0 +1,105 @@
+"""
+Benchmark de memória: comentários como dicts versus CommentBatch (colunas)
+
+Os comentários vêm das respostas da API do YouTube simulada e são
+convertidos das duas formas; a memória de cada uma é medida com
+tracemalloc depois de descartar as respostas.
+
+Uso (a partir da pasta do projeto):
+    python -m benchmarks.comments
+"""
+import gc
+import time
+import tracemalloc
+from benchmarks.fake_youtube import FakeYouTube
+from absolute_cinema.internals.comments import CommentBatch
+
+SIZE = 100_000
+# Autores distintos: comentaristas frequentes repetem o nome
+AUTHORS = SIZE // 4
+ROUNDS = 3
+
+
+def api_pages(size: int) -> list:
+    """Respostas do commentThreads.list com `size` comentários, em páginas de 100"""
+    fake = FakeYouTube(comments_per_video=size, latency=0)
+    pages, token = [], None
+    while True:
+        response = fake.comment_threads({"videoId": "benchmark", "maxResults": 100, "pageToken": token})
+        for item in response["items"]:
+            snippet = item["snippet"]["topLevelComment"]["snippet"]
+            # Strings novas a cada resposta, como no JSON decodificado
+            author = int(snippet["authorDisplayName"][4:]) % AUTHORS
+            snippet["authorDisplayName"] = f"user{author}"
+        pages.append(response)
+        token = response.get("nextPageToken")
+        if not token:
+            return pages
+
+
+def as_dicts(pages: list) -> list:
+    """Formato anterior: um dict de 4 chaves por comentário"""
+    comments = []
+    for response in pages:
+        for item in response["items"]:
+            snippet = item["snippet"]["topLevelComment"]["snippet"]
+            comments.append({
+                'author': snippet['authorDisplayName'],
+                'text': snippet['textDisplay'].strip(),
+                'likes': snippet.get('likeCount', 0),
+                'published_at': snippet['publishedAt']
+            })
+    return comments
+
+
+def as_batch(pages: list) -> CommentBatch:
+    """Formato em colunas, como produzido por services.youtube"""
+    comments = CommentBatch()
+    for response in pages:
+        for item in response["items"]:
+            snippet = item["snippet"]["topLevelComment"]["snippet"]
+            comments.append(
+                snippet['authorDisplayName'], snippet['textDisplay'].strip(),
+                snippet.get('likeCount', 0), snippet['publishedAt']
+            )
+    return comments
+
+
+def measure(convert) -> tuple:
+    """Memória retida (bytes) e tempo de conversão de `convert`"""
+    # Tempo (melhor de ROUNDS) medido sem o tracemalloc, que deixa as alocações mais lentas
+    pages = api_pages(SIZE)
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        convert(pages)
+        timings.append(time.perf_counter() - start)
+    elapsed = min(timings)
+    del pages
+
+    gc.collect()
+    tracemalloc.start()
+    pages = api_pages(SIZE)
+    comments = convert(pages)
+    del pages
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(comments) == SIZE
+    return retained, elapsed
+
+
+def benchmark() -> None:
+    """Compara memória por comentário e custo de conversão dos dois formatos"""
+    print(f"✓ {SIZE:,} comentários ({AUTHORS:,} autores distintos)")
+    results = {name: measure(convert) for name, convert in (("dicts", as_dicts), ("CommentBatch", as_batch))}
+    baseline = results["dicts"][0]
+    for name, (retained, elapsed) in results.items():
+        print(
+            f"  {name:<13} {retained / 2 ** 20:6.1f} MiB ({retained / SIZE:5.0f} bytes/comentário), "
+            f"conversão {elapsed * 1000:.0f} ms, {baseline / retained:.1f}x menos memória"
+        )
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,80 @@
+"""
+Benchmark do filtro de duplicatas/spam em comentários com muito spam
+
+Uso (a partir da pasta do projeto):
+    python -m benchmarks.dedup
+"""
+import time
+import random
+from absolute_cinema.internals.dedup import CommentFilter
+from absolute_cinema.internals.comments import CommentBatch
+from absolute_cinema.internals.sentimeter import analyze_batch
+from benchmarks.sentiment import CORPUS
+
+# Spam copiado típico de seções de comentários de trailers
+SPAM = [
+    "Check out my channel for the best movie reviews, link in bio",
+    "I made 5000 dollars this week working from home, ask me how",
+    "Who is watching this in 2024? Like if you are here",
+    "FREE MOVIE DOWNLOAD full HD link in my profile",
+    "Sub to me and I will sub back, lets grow together",
+    "This comment section is full of bots, change my mind",
+    "Click here to watch the full movie online for free",
+    "Anyone else think this was way better than the original?",
+]
+
+# Variações que o spam usa para escapar de filtros exatos
+DECORATIONS = ["", "!!!", " 🔥🔥", "...", " :)"]
+
+SIZE = 10000
+SPAM_RATIO = 0.6
+
+
+def build_fixture(size: int, spam_ratio: float) -> CommentBatch:
+    """Comentários legítimos misturados com spam copiado (com pequenas variações)"""
+    spam_count = int(size * spam_ratio)
+    # Comentários legítimos distintos: frases aleatórias com as palavras do corpus
+    generator = random.Random(42)
+    vocabulary = sorted({word for text in CORPUS for word in text.split()})
+    authors = [f"user{i}" for i in range(size - spam_count)]
+    texts = [" ".join(generator.choices(vocabulary, k=generator.randint(4, 16))) for _ in authors]
+    for i in range(spam_count):
+        text = SPAM[i % len(SPAM)] + DECORATIONS[i % len(DECORATIONS)]
+        if i % 3 == 0:
+            text = text.upper()
+        if i % 7 == 0:
+            # Quase-duplicata: uma palavra a mais
+            text = f"guys {text}"
+        authors.append(f"bot{i}")
+        texts.append(text)
+    comments = CommentBatch(authors, texts, likes=[0] * size, published=[0] * size)
+    # Intercala spam e comentários legítimos
+    return comments.take(sorted(range(size), key=lambda i: (i * 7919) % size))
+
+
+def benchmark() -> None:
+    """Compara o tempo de análise com e sem o filtro (exato e com MinHash)"""
+    comments = build_fixture(SIZE, SPAM_RATIO)
+    analyze_batch(comments.texts[:100])  # Aquece o backend
+
+    start = time.perf_counter()
+    analyze_batch(comments.texts)
+    baseline = time.perf_counter() - start
+    print(f"✓ {SIZE} comentários ({SPAM_RATIO:.0%} spam)")
+    print(f"  Sem filtro: {baseline * 1000:.1f} ms")
+
+    for name, minhash in (("hash exato", False), ("hash + MinHash", True)):
+        start = time.perf_counter()
+        comment_filter = CommentFilter(minhash=minhash)
+        kept = comment_filter.filter(comments)
+        filtered = time.perf_counter() - start
+        analyze_batch(kept.texts)
+        elapsed = time.perf_counter() - start
+        print(
+            f"  {name}: {elapsed * 1000:.1f} ms (filtro {filtered * 1000:.1f} ms), "
+            f"{comment_filter.removed} removidos, {baseline / elapsed:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    benchmark()
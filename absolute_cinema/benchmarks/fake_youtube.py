@@ -0,0 +1,109 @@
+"""
+Substituto local e determinístico da YouTube Data API para os benchmarks
+
+Responde search.list e commentThreads.list (paginado) com dados gerados a
+partir de uma semente, com latência e quantidade de comentários
+configuráveis, sem rede e sem gastar quota.
+"""
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+import httpx
+from benchmarks.sentiment import CORPUS
+
+BASE_URL = "http://youtube.fake/youtube/v3"
+# Data do comentário mais novo de cada vídeo
+NEWEST = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Trechos combinados com o corpus para que os comentários não se repitam
+SUFFIXES = [
+    "the director", "this cast", "that soundtrack", "the first movie",
+    "the book", "these effects", "the ending", "this trailer"
+]
+
+
+class FakeYouTube:
+    """
+    API do YouTube simulada sobre um httpx.MockTransport
+
+    Cada vídeo tem `comments_per_video` comentários, servidos em páginas de
+    até 100 (ou `maxResults`). O conteúdo depende só do ID do vídeo e da
+    posição, então duas execuções recebem exatamente os mesmos dados.
+    """
+
+    def __init__(self, comments_per_video: int = 150, latency: float = 0.05, videos_per_search: int = 5):
+        """
+        Args:
+            comments_per_video: Total de comentários de cada vídeo
+            latency: Atraso de cada resposta, em segundos
+            videos_per_search: Vídeos retornados por busca (limitado a maxResults)
+        """
+        self.comments_per_video = comments_per_video
+        self.latency = latency
+        self.videos_per_search = videos_per_search
+        self.requests = {"search": 0, "commentThreads": 0}
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def client(self) -> httpx.AsyncClient:
+        """Cliente HTTP que substitui o da aplicação (services.youtube._client)"""
+        return httpx.AsyncClient(transport=self.transport(), base_url=BASE_URL)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        resource = request.url.path.rsplit("/", 1)[-1]
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if resource == "search":
+            self.requests[resource] += 1
+            return httpx.Response(200, json=self.search(request.url.params))
+        if resource == "commentThreads":
+            self.requests[resource] += 1
+            return httpx.Response(200, json=self.comment_threads(request.url.params))
+        return httpx.Response(404, json={"error": {"message": f"Recurso desconhecido: {resource}"}})
+
+    def search(self, params) -> dict:
+        query = params["q"]
+        count = min(self.videos_per_search, int(params.get("maxResults", 1)))
+        slug = "".join(char for char in query.lower() if char.isalnum())[:24]
+        return {
+            "items": [
+                {
+                    "id": {"videoId": f"{slug}-{index}"},
+                    "snippet": {
+                        "title": f"{query} #{index + 1}",
+                        "channelTitle": "Fake Studios",
+                        "description": f"Trailer de {query}"
+                    }
+                }
+                for index in range(count)
+            ]
+        }
+
+    def comment_threads(self, params) -> dict:
+        video_id = params["videoId"]
+        # O token da próxima página é a posição do seu primeiro comentário
+        start = int(params.get("pageToken") or 0)
+        end = min(start + min(int(params.get("maxResults", 20)), 100), self.comments_per_video)
+
+        generator = random.Random(f"{video_id}:{start}")
+        items = [
+            {
+                "snippet": {
+                    "topLevelComment": {
+                        "snippet": {
+                            "textDisplay": f"{generator.choice(CORPUS)} ({generator.choice(SUFFIXES)} #{index})",
+                            "authorDisplayName": f"user{generator.randrange(10 * self.comments_per_video)}",
+                            "likeCount": int(generator.paretovariate(1.2)) - 1,
+                            # Mais novos primeiro, como order="time"
+                            "publishedAt": (NEWEST - timedelta(minutes=index)).strftime("%Y-%m-%dT%H:%M:%SZ")
+                        }
+                    }
+                }
+            }
+            for index in range(start, end)
+        ]
+        response = {"items": items}
+        if end < self.comments_per_video:
+            response["nextPageToken"] = str(end)
+        return response
@@ -0,0 +1,73 @@
+"""
+Benchmark da detecção de idioma em comentários de vários idiomas
+
+Uso (a partir da pasta do projeto):
+    python -m benchmarks.language
+"""
+import time
+from absolute_cinema.internals.language import detect_languages, get_model, UNDETERMINED
+
+# Comentários rotulados (diferentes dos textos de treino do modelo)
+CORPUS = [
+    ("en", "This looks like the best movie of the decade, pure cinema"),
+    ("en", "I don't know why but the CGI looks really cheap here"),
+    ("en", "Can't believe they finally made a sequel after all these years"),
+    ("en", "The soundtrack alone is worth the ticket price"),
+    ("en", "Who decided this was a good idea? Terrible casting"),
+    ("en", "Honestly the teaser was better than this trailer"),
+    ("pt", "Mal posso esperar para ver isso no cinema, parece muito bom"),
+    ("pt", "Que trilha sonora linda, fiquei arrepiado do começo ao fim"),
+    ("pt", "Achei o trailer fraco, espero que o filme seja melhor"),
+    ("pt", "Alguém assistindo em português? Deixa o like aí"),
+    ("es", "No puedo creer que por fin hagan una segunda parte"),
+    ("es", "La banda sonora es preciosa, me puso la piel de gallina"),
+    ("es", "Me parece que los efectos especiales se ven muy baratos"),
+    ("fr", "Je n'arrive pas à croire qu'ils fassent enfin une suite"),
+    ("fr", "La musique est magnifique, j'ai eu des frissons du début à la fin"),
+    ("fr", "Franchement la bande annonce ne donne pas envie"),
+    ("de", "Ich kann nicht glauben, dass es endlich eine Fortsetzung gibt"),
+    ("de", "Die Musik ist wunderschön, ich hatte die ganze Zeit Gänsehaut"),
+    ("it", "Non posso credere che finalmente facciano un seguito"),
+    ("it", "La colonna sonora è bellissima, mi sono venuti i brividi"),
+    ("ru", "Не могу поверить, что наконец сняли продолжение"),
+    ("ja", "やっと続編が出るなんて信じられない"),
+    ("ko", "드디어 속편이 나온다니 믿을 수가 없어요"),
+    (UNDETERMINED, "wow!!! 🔥🔥🔥"),
+]
+
+SIZE = 10000
+
+
+def build_corpus(size: int) -> list:
+    """Repete o corpus rotulado até o tamanho pedido"""
+    return [CORPUS[i % len(CORPUS)] for i in range(size)]
+
+
+def benchmark() -> None:
+    """Mede vazão e acerto da detecção e quantos comentários iriam para tradução"""
+    get_model()  # Treina o modelo fora da medição
+
+    labeled = build_corpus(SIZE)
+    texts = [text for _, text in labeled]
+
+    start = time.perf_counter()
+    languages = detect_languages(texts)
+    elapsed = time.perf_counter() - start
+
+    correct = sum(expected == actual for (expected, _), actual in zip(labeled, languages))
+    # O que importa para a tradução é separar inglês (ou indeterminado) do resto
+    english = ("en", UNDETERMINED)
+    routed = sum((expected in english) == (actual in english) for (expected, _), actual in zip(labeled, languages))
+    translated = sum(language not in english for language in languages)
+
+    print(f"✓ {SIZE} comentários em {elapsed * 1000:.1f} ms ({SIZE / elapsed:,.0f} comentários/s)")
+    print(f"  Acerto: {correct / SIZE * 100:.1f}% (inglês x outros: {routed / SIZE * 100:.1f}%)")
+    print(f"  Enviados para tradução: {translated} ({translated / SIZE * 100:.1f}%)")
+
+    for (expected, text), actual in zip(CORPUS, detect_languages([text for _, text in CORPUS])):
+        if expected != actual:
+            print(f"  ↳ Divergente ({expected} → {actual}): {text}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,237 @@
+"""
+Benchmark de ponta a ponta do /score contra uma API do YouTube simulada
+
+A aplicação roda no próprio processo (httpx.ASGITransport) e as chamadas ao
+YouTube vão para benchmarks.fake_youtube, então os resultados dependem só do
+código. Mede latência (p50/p95/p99) e requisições por segundo em vários
+níveis de concorrência, mais microbenchmarks do cálculo do score e da
+seleção de comentários de exemplo, e salva tudo em JSON para comparar
+execuções.
+
+Uso (a partir da pasta do projeto):
+    python -m benchmarks.score
+    python -m benchmarks.score --concurrency 1 8 32 --latency 0.1 --comments 500
+    python -m benchmarks.score --baseline benchmarks/results/score-anterior.json
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import subprocess
+from datetime import datetime
+
+# As configurações são lidas na importação da aplicação: banco temporário,
+# sem controle de quota e sem logs por requisição
+os.environ.setdefault("YOUTUBE_API_KEY", "benchmark")
+os.environ.setdefault("STORE_PATH", os.path.join(tempfile.mkdtemp(prefix="absolute-cinema-"), "benchmark.db"))
+os.environ.setdefault("QUOTA_DAILY_LIMIT", "0")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import numpy as np
+import httpx
+from benchmarks.fake_youtube import FakeYouTube
+from benchmarks.sentiment import CORPUS
+from absolute_cinema.services import youtube
+from absolute_cinema.views.app import app
+from absolute_cinema.controllers.movie import MovieController
+from absolute_cinema.internals.sentimeter import analyze_batch, calculate_score_from_comments
+from absolute_cinema.internals.comments import CommentBatch
+from absolute_cinema.internals.samples import SampleSelector, SAMPLE_STRATEGIES
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def percentiles(latencies: list) -> dict:
+    """p50/p95/p99, média e máximo de uma lista de latências (segundos), em ms"""
+    values = np.asarray(latencies) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "p50_ms": round(float(p50), 2),
+        "p95_ms": round(float(p95), 2),
+        "p99_ms": round(float(p99), 2),
+        "mean_ms": round(float(values.mean()), 2),
+        "max_ms": round(float(values.max()), 2)
+    }
+
+
+async def run_level(client: httpx.AsyncClient, concurrency: int, requests: int, names: list) -> dict:
+    """
+    Dispara `requests` chamadas ao POST /score com `concurrency` clientes simultâneos
+
+    Args:
+        client: Cliente ligado à aplicação
+        concurrency: Requisições em andamento ao mesmo tempo
+        requests: Total de requisições
+        names: Nome do filme de cada requisição
+
+    Returns:
+        dict: Vazão, latências e erros do nível
+    """
+    latencies, errors = [], 0
+    pending = iter(names[:requests])
+
+    async def worker():
+        nonlocal errors
+        for name in pending:
+            start = time.perf_counter()
+            response = await client.post("/score", json={"name": name})
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 2),
+        **percentiles(latencies)
+    }
+
+
+async def load_test(args) -> list:
+    """Executa os níveis de concorrência contra a aplicação com o YouTube simulado"""
+    fake = FakeYouTube(comments_per_video=args.comments, latency=args.latency)
+    results = []
+
+    async with app.router.lifespan_context(app):
+        youtube._client = fake.client()
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as client:
+            # Aquece o backend de sentimentos e as conexões fora da medição
+            await client.post("/score", json={"name": "Warmup"})
+
+            for level, concurrency in enumerate(args.concurrency):
+                if args.scenario == "hit":
+                    # Mesmos filmes de novo: mede o caminho do cache
+                    names = [f"Cached Movie {i % concurrency}" for i in range(args.requests)]
+                    await asyncio.gather(*(client.post("/score", json={"name": name}) for name in set(names)))
+                else:
+                    # Um filme diferente por requisição: análise completa
+                    names = [f"Benchmark Movie {level} {i}" for i in range(args.requests)]
+                results.append(await run_level(client, concurrency, args.requests, names))
+                print(_format_level(results[-1]))
+
+    print(f"  Chamadas ao YouTube simulado: {fake.requests}")
+    return results
+
+
+def _format_level(result: dict) -> str:
+    return (
+        f"  c={result['concurrency']:<3} {result['rps']:>8.1f} req/s  "
+        f"p50 {result['p50_ms']:>8.1f} ms  p95 {result['p95_ms']:>8.1f} ms  "
+        f"p99 {result['p99_ms']:>8.1f} ms  erros {result['errors']}"
+    )
+
+
+def measure(function, rounds: int) -> dict:
+    """Tempo por chamada de `function` (mediana e mínimo de `rounds` execuções), em ms"""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return {"median_ms": round(float(np.median(timings)) * 1000, 3), "min_ms": round(min(timings) * 1000, 3)}
+
+
+def microbenchmarks(size: int, rounds: int) -> dict:
+    """Cálculo do score e seleção de exemplos sobre `size` comentários"""
+    comments = CommentBatch(
+        authors=[f"user{i}" for i in range(size)],
+        texts=[f"{CORPUS[i % len(CORPUS)]} #{i}" for i in range(size)],
+        likes=[i % 50 for i in range(size)],
+        published=[1704067200 - i for i in range(size)]
+    )
+    polarities, labels = analyze_batch(comments.texts)
+    controller = MovieController()
+
+    def select(strategy: str) -> list:
+        selector = SampleSelector(strategy)
+        selector.add(comments, labels, polarities)
+        return selector.result()
+
+    results = {
+        "comments": size,
+        "calculate_score_from_comments": measure(lambda: calculate_score_from_comments(comments), rounds),
+        "select_sample_comments": measure(lambda: controller._select_sample_comments(comments, labels, polarities), rounds)
+    }
+    for strategy in SAMPLE_STRATEGIES:
+        results[f"select_samples_{strategy}"] = measure(lambda: select(strategy), rounds)
+    for name, timing in results.items():
+        if name != "comments":
+            print(f"  {name}: {timing['median_ms']:.3f} ms (mín. {timing['min_ms']:.3f} ms)")
+    return results
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict, baseline: dict) -> None:
+    """Imprime a variação de cada nível de concorrência em relação a uma execução anterior"""
+    previous = {level["concurrency"]: level for level in baseline.get("load", [])}
+    print(f"\n📊 Comparação com {baseline.get('revision') or 'execução anterior'} ({baseline.get('timestamp')})")
+    for level in current["load"]:
+        before = previous.get(level["concurrency"])
+        if not before:
+            continue
+        changes = "  ".join(
+            f"{key} {(level[key] - before[key]) / before[key] * 100:+.1f}%"
+            for key in ("rps", "p50_ms", "p95_ms", "p99_ms") if before[key]
+        )
+        print(f"  c={level['concurrency']:<3} {changes}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark do /score com a API do YouTube simulada")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16], help="Níveis de concorrência")
+    parser.add_argument("--requests", type=int, default=64, help="Requisições por nível")
+    parser.add_argument("--comments", type=int, default=150, help="Comentários por vídeo simulado")
+    parser.add_argument("--latency", type=float, default=0.05, help="Latência de cada chamada ao YouTube (s)")
+    parser.add_argument("--scenario", choices=["miss", "hit"], default="miss",
+                        help="miss: um filme novo por requisição; hit: filmes já em cache")
+    parser.add_argument("--micro-size", type=int, default=1000, help="Comentários dos microbenchmarks")
+    parser.add_argument("--micro-rounds", type=int, default=20, help="Execuções de cada microbenchmark")
+    parser.add_argument("--output", help="Arquivo JSON de saída (padrão: benchmarks/results/score-<data>.json)")
+    parser.add_argument("--baseline", help="Resultado anterior (JSON) para comparação")
+    args = parser.parse_args()
+
+    print(f"✓ /score ({args.scenario}): {args.requests} requisições por nível, "
+          f"{args.comments} comentários por vídeo, latência simulada de {args.latency * 1000:.0f} ms")
+    load = asyncio.run(load_test(args))
+    print(f"✓ Microbenchmarks ({args.micro_size} comentários)")
+    micro = microbenchmarks(args.micro_size, args.micro_rounds)
+
+    timestamp = datetime.now()
+    report = {
+        "timestamp": timestamp.isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "python": sys.version.split()[0],
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "baseline")},
+        "load": load,
+        "micro": micro
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"score-{timestamp:%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2, ensure_ascii=False)
+    print(f"✓ Resultados salvos em {output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            compare(report, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
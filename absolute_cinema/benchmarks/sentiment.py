@@ -0,0 +1,83 @@
+"""
+Benchmark dos backends de sentimento
+
+A paridade entre os dois backends é verificada em tests/test_lexicon.py.
+
+Uso (a partir da pasta do projeto):
+    python -m benchmarks.sentiment
+"""
+import time
+from absolute_cinema.internals.lexicon import get_lexicon, score_batch
+
+# Corpus de comentários típicos de trailers usado na comparação
+CORPUS = [
+    "This movie looks really good!",
+    "not a good trailer",
+    "I don't like it",
+    "Amazing!!! can't wait :)",
+    "very very bad",
+    "I'm not sure, it's not bad",
+    "The best trailer ever, absolutely stunning visuals",
+    "This is not very good",
+    "worst movie ever. boring and stupid",
+    "Wow!! this looks incredible, cannot wait",
+    "never seen such a terrible CGI",
+    "The soundtrack gave me chills, beautiful work",
+    "Another pointless remake nobody asked for",
+    "Who else is here after the teaser?",
+    "The plot seems predictable but the cast is great",
+    "Hope it's better than the last one",
+    "Honestly the effects look cheap and ugly",
+    "Take my money already!",
+    "I love this director so much <3",
+    "This looks like a masterpiece, pure cinema",
+    "meh, kinda average",
+    "The dialogue sounds awkward and forced",
+    "Can't believe they cast him, perfect choice",
+    "Not interested at all",
+    "so so so excited for this!!!",
+    "It looks dark and gritty, exactly what the story needed",
+    "Really disappointed with the trailer :(",
+    "Nobody: absolutely nobody: me watching this 50 times",
+    "Great acting, weak script",
+    "This will be the movie of the year",
+    # Contrações e cadeias de modificadores, em que o TextBlob tem regras próprias
+    "This isn't good",
+    "It wasn't great",
+    "I don't love it",
+    "I didn't hate it",
+    "Really, really, really good",
+    "absolutely not",
+]
+
+SIZES = (150, 1000, 10000)
+
+
+def build_corpus(size: int) -> list:
+    """Repete o corpus até o tamanho pedido, variando levemente os textos"""
+    return [f"{CORPUS[i % len(CORPUS)]} #{i // len(CORPUS)}" for i in range(size)]
+
+
+def benchmark() -> None:
+    """Mede o custo por comentário de cada backend"""
+    from textblob import TextBlob
+    get_lexicon()  # Compila o léxico fora da medição
+
+    print(f"\n{'comentários':>12} {'textblob (µs)':>15} {'lexicon (µs)':>14} {'ganho':>8}")
+    for size in SIZES:
+        texts = build_corpus(size)
+
+        start = time.perf_counter()
+        for text in texts:
+            TextBlob(text).sentiment.polarity
+        textblob_cost = (time.perf_counter() - start) / size * 1e6
+
+        start = time.perf_counter()
+        score_batch(texts)
+        lexicon_cost = (time.perf_counter() - start) / size * 1e6
+
+        print(f"{size:>12} {textblob_cost:>15.1f} {lexicon_cost:>14.1f} {textblob_cost / lexicon_cost:>7.1f}x")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,43 @@
+"""
+Mede o custo de abrir um cliente HTTP novo a cada requisição à API do
+YouTube versus reutilizar o cliente (e as conexões) compartilhado
+
+Uso (a partir da pasta do projeto, com YOUTUBE_API_KEY configurada):
+    python -m benchmarks.youtube_client
+"""
+import asyncio
+import time
+import httpx
+from absolute_cinema.services import youtube
+
+ROUNDS = 10
+PARAMS = {"part": "snippet", "q": "Inception trailer oficial", "type": "video", "maxResults": 1}
+
+
+async def measure() -> None:
+    if not youtube.YOUTUBE_API_KEY:
+        print("⚠️  Configure YOUTUBE_API_KEY no arquivo .env")
+        return
+
+    # Antes: cliente e conexão novos a cada chamada
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        async with httpx.AsyncClient(base_url=youtube.YOUTUBE_API_BASE_URL) as client:
+            await client.get("/search", params={**PARAMS, "key": youtube.YOUTUBE_API_KEY})
+    cold = (time.perf_counter() - start) / ROUNDS * 1000
+
+    # Depois: cliente compartilhado com conexões keep-alive
+    await youtube._api_get("search", **PARAMS)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await youtube._api_get("search", **PARAMS)
+    warm = (time.perf_counter() - start) / ROUNDS * 1000
+    await youtube.close_client()
+
+    print(f"✓ search.list com cliente novo: {cold:.1f} ms")
+    print(f"✓ search.list com cliente reutilizado: {warm:.1f} ms")
+    print(f"  Economia por chamada: {cold - warm:.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(measure())
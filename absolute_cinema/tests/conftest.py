@@ -0,0 +1,8 @@
+import os
+import tempfile
+
+# As configurações são lidas na importação da aplicação: chave fictícia,
+# banco temporário e sem controle de quota
+os.environ.setdefault("YOUTUBE_API_KEY", "test")
+os.environ.setdefault("STORE_PATH", os.path.join(tempfile.mkdtemp(prefix="absolute-cinema-"), "test.db"))
+os.environ.setdefault("QUOTA_DAILY_LIMIT", "0")
@@ -0,0 +1,60 @@
+"""
+Testes da remoção de duplicatas (internals.dedup) e do seu uso na análise
+de vários trailers
+"""
+import asyncio
+import pytest
+from benchmarks.fake_youtube import FakeYouTube
+from absolute_cinema.services import youtube
+from absolute_cinema.controllers import movie as movie_controller
+from absolute_cinema.internals.comments import CommentBatch
+from absolute_cinema.internals.dedup import CommentFilter
+from absolute_cinema.models.movie import Movie
+
+SPAM = "Check out my channel for the full movie free download"
+
+
+def batch(*comments) -> CommentBatch:
+    return CommentBatch.from_rows(
+        {'author': author, 'text': text, 'likes': 0, 'published_at': "2024-01-01T00:00:00Z"}
+        for author, text in comments
+    )
+
+
+def test_spam_filter():
+    comment_filter = CommentFilter(minhash=False)
+    page = comment_filter.filter(batch(("a", SPAM), ("b", SPAM.upper() + "!!"), ("a", "amazing!"), ("b", "Amazing")))
+
+    assert page.authors == ["a", "a", "b"]
+    assert comment_filter.removed == 1
+
+
+def test_same_comment_only():
+    comment_filter = CommentFilter(spam=False)
+    first = comment_filter.filter(batch(("a", SPAM), ("b", SPAM)))
+    second = comment_filter.filter(batch(("a", SPAM.lower()), ("c", SPAM)))
+
+    assert first.authors == ["a", "b"]
+    assert second.authors == ["c"]
+    assert comment_filter.removed == 1
+
+
+class SameCommentsYouTube(FakeYouTube):
+    """Todos os trailers têm os mesmos comentários"""
+
+    def comment_threads(self, params) -> dict:
+        return super().comment_threads({**params, "videoId": "same"})
+
+
+@pytest.mark.parametrize("dedup_comments", [True, False])
+def test_multi_score_counts_repeated_comments_once(monkeypatch, dedup_comments):
+    monkeypatch.setattr(movie_controller, "DEDUP_COMMENTS", dedup_comments)
+    monkeypatch.setattr(youtube, "_client", SameCommentsYouTube(comments_per_video=150, latency=0).client())
+
+    result = asyncio.run(movie_controller.MovieController().calculate_multi_score(
+        Movie(name=f"Repeated Comments {dedup_comments}"), count=3
+    ))
+
+    # Cada comentário conta uma vez, no trailer em que foi visto primeiro
+    assert result['details']['total_comments'] == 150
+    assert sum(video['total_comments'] for video in result['videos']) == 150
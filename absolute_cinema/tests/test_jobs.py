@@ -0,0 +1,57 @@
+"""
+Testes do agendador de análises em segundo plano (controllers.job)
+"""
+import asyncio
+import sqlite3
+from absolute_cinema.controllers import job as job_controller
+from absolute_cinema.controllers.job import JobScheduler
+from absolute_cinema.controllers.movie import MovieController
+from absolute_cinema.internals.store import store
+from absolute_cinema.models.job import ScoreJobRequest
+
+
+def run_jobs(scheduler: JobScheduler, names: list) -> list:
+    """Enfileira um job por filme, espera a fila esvaziar e retorna os jobs gravados"""
+    async def main():
+        await scheduler.start()
+        try:
+            jobs = [await scheduler.submit(ScoreJobRequest(name=name)) for name in names]
+            await asyncio.wait_for(scheduler._queue.join(), timeout=10)
+            workers = scheduler.stats()['workers'], sum(not worker.done() for worker in scheduler._workers)
+            return [await scheduler.get(job['job_id']) for job in jobs], workers
+        finally:
+            await scheduler.stop()
+    return asyncio.run(main())
+
+
+async def fake_score(self, movie):
+    return {"movie": movie.name}, False
+
+
+def test_jobs_run(monkeypatch):
+    monkeypatch.setattr(MovieController, "get_score", fake_score)
+    jobs, _ = run_jobs(JobScheduler(concurrency=1, max_queue=10), ["Dune", "Alien"])
+
+    assert [job['status'] for job in jobs] == ['done', 'done']
+    assert jobs[1]['result'] == {"movie": "Alien"}
+
+
+def test_store_error_does_not_kill_worker(monkeypatch):
+    monkeypatch.setattr(MovieController, "get_score", fake_score)
+    get_job = store.get_job
+    calls = []
+
+    def flaky_get_job(job_id):
+        # A primeira leitura do primeiro job falha, como com o banco travado
+        calls.append(job_id)
+        if len(calls) == 1:
+            raise sqlite3.OperationalError("database is locked")
+        return get_job(job_id)
+
+    monkeypatch.setattr(job_controller.store, "get_job", flaky_get_job)
+    jobs, (workers, alive) = run_jobs(JobScheduler(concurrency=1, max_queue=10), ["Dune", "Alien"])
+
+    assert alive == workers == 1
+    assert jobs[0]['status'] == 'failed'
+    assert jobs[0]['error']['error'] == 'OperationalError'
+    assert jobs[1]['status'] == 'done'
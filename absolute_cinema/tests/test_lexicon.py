@@ -0,0 +1,97 @@
+"""
+Paridade do backend vetorizado (internals.lexicon) com o TextBlob
+
+O léxico só substitui o TextBlob se der exatamente as mesmas polaridades,
+inclusive nas regras de tokenização (contrações, reticências, emoticons).
+"""
+import random
+import pytest
+from textblob import TextBlob
+from benchmarks.sentiment import CORPUS
+from absolute_cinema.internals.lexicon import get_lexicon, score_batch
+
+# Casos em que as regras do TextBlob não são as óbvias
+EDGE_CASES = [
+    "not... good",
+    "not.... good",
+    "not.. good",
+    "not. good",
+    "xD",
+    "XD good",
+    "very xD",
+    "lol xD",
+    "good :D",
+    "good :d",
+    ":)good",
+    "good:)",
+    "good,bad",
+    "well-made movie",
+    "Mr. Good",
+    "U.S. good",
+    "not?! good",
+    "it's (!) great",
+    "\"not\" good",
+    "not\n\ngood",
+]
+
+WORDS = [
+    "really", "very", "absolutely", "so", "not", "never", "no", "isn't", "don't", "can't",
+    "good", "bad", "great", "terrible", "love", "hate", "boring", "amazing", "a", "i", "is",
+    "the", "movie", "pretty", "too", "best", "worst", "it's", "I'm", "nobody", "lol",
+    "Good", "NOT", "Really", "Mr.", "U.S.", "e.g.", "A."
+]
+PUNCTUATION = [
+    "...", "..", "....", ".", "!", "!!", "?", ",", ":)", ":(", "<3", ":-)", ":D", ":d",
+    "xD", "XD", "x-D", "o.O", ":P", ";)", ":'(", "(!)", "( ! )", "(", ")", "-", "\"", "'",
+    "“", "’", ":", "\n\n", "#", "=)", ">:(", "♥"
+]
+
+
+def random_texts(size: int, seed: int = 0) -> list:
+    """Textos aleatórios com palavras do léxico e pontuação, colada ou não às palavras"""
+    generator = random.Random(seed)
+
+    def piece() -> str:
+        chance = generator.random()
+        if chance < 0.55:
+            return generator.choice(WORDS)
+        if chance < 0.8:
+            return generator.choice(PUNCTUATION)
+        return generator.choice(WORDS) + generator.choice(PUNCTUATION)
+
+    return [
+        "".join(piece() + (" " if generator.random() < 0.8 else "") for _ in range(generator.randint(1, 14)))
+        for _ in range(size)
+    ]
+
+
+def assert_parity(texts: list) -> None:
+    expected = [TextBlob(text).sentiment.polarity for text in texts]
+    mismatches = [
+        (text, wanted, actual)
+        for text, wanted, actual in zip(texts, expected, score_batch(texts))
+        if actual != pytest.approx(wanted, abs=1e-9)
+    ]
+    assert not mismatches, mismatches[:10]
+
+
+def test_corpus():
+    assert_parity(CORPUS)
+
+
+def test_edge_cases():
+    assert_parity(EDGE_CASES)
+
+
+def test_random_texts():
+    assert_parity(random_texts(3000))
+
+
+def test_tokenize():
+    lexicon = get_lexicon()
+    assert lexicon.tokenize("I don't... xD :D") == ["i", "do", "n", "'", "t", "...", "xd", ":d"]
+
+
+def test_empty():
+    assert score_batch([]) == []
+    assert score_batch(["", "movie"]) == [0.0, 0.0]
@@ -0,0 +1,67 @@
+"""
+Testes do pool de processos da análise de sentimentos (internals.sentimeter)
+"""
+import os
+import asyncio
+import pytest
+from absolute_cinema.internals import sentimeter
+from absolute_cinema.internals.sentimeter import analyze_batch, analyze_batch_async, available_cpus
+
+
+@pytest.fixture
+def affinity(monkeypatch):
+    """Processo com 8 CPUs disponíveis"""
+    monkeypatch.setattr(os, "sched_getaffinity", lambda pid: set(range(8)), raising=False)
+
+
+@pytest.mark.parametrize("cpu_max, expected", [
+    ("max 100000", 8),
+    ("10000 100000", 1),
+    ("150000 100000", 1),
+    ("400000 100000", 4),
+])
+def test_available_cpus_cgroup_v2(tmp_path, affinity, cpu_max, expected):
+    (tmp_path / "cpu.max").write_text(cpu_max + "\n")
+    assert available_cpus(str(tmp_path)) == expected
+
+
+def test_available_cpus_cgroup_v1(tmp_path, affinity):
+    (tmp_path / "cpu").mkdir()
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("200000\n")
+    (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+    assert available_cpus(str(tmp_path)) == 2
+
+
+def test_available_cpus_without_cgroup(tmp_path, affinity):
+    assert available_cpus(str(tmp_path)) == 8
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """Pool de 2 workers, analisando qualquer lote nele"""
+    monkeypatch.setattr(sentimeter, "SENTIMENT_WORKERS", 2)
+    monkeypatch.setattr(sentimeter, "SENTIMENT_POOL_MIN_BATCH", 1)
+    sentimeter.start_pool()
+    yield
+    sentimeter.shutdown_pool()
+
+
+def break_pool() -> None:
+    """Derruba um worker, como o OOM killer faria"""
+    with pytest.raises(Exception):
+        sentimeter._executor.submit(os._exit, 1).result()
+
+
+def test_broken_pool_is_recreated(pool):
+    texts = ["This movie looks really good!", "worst movie ever"]
+    expected = analyze_batch(texts)
+    broken = sentimeter._executor
+    break_pool()
+
+    assert asyncio.run(analyze_batch_async(texts)) == expected
+    assert sentimeter._executor is not None and sentimeter._executor is not broken
+    # O novo pool atende as próximas análises
+    assert analyze_batch(texts) == expected
+
+    break_pool()
+    assert analyze_batch(texts) == expected
@@ -0,0 +1,73 @@
+"""
+Testes do score em streaming (MovieController.stream_score): caches,
+fallbacks de quota e análises compartilhadas com o /score
+"""
+import asyncio
+import pytest
+from benchmarks.fake_youtube import FakeYouTube
+from absolute_cinema.services import youtube
+from absolute_cinema.controllers import movie as movie_controller
+from absolute_cinema.internals.quota import quota
+from absolute_cinema.internals.store import store
+from absolute_cinema.models.movie import Movie
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    fake = FakeYouTube(comments_per_video=150, latency=0.01)
+    monkeypatch.setattr(youtube, "_client", fake.client())
+    return fake
+
+
+async def collect(name: str) -> list:
+    return [event async for event in movie_controller.MovieController().stream_score(Movie(name=name))]
+
+
+def test_stream_emits_progress(fake):
+    events = asyncio.run(collect("Stream Progress"))
+
+    names = [event for event, _ in events]
+    assert names[0] == "stage" and names[-1] == "result"
+    assert "partial" in names
+    assert events[-1][1]['details']['total_comments'] == 150
+
+
+def test_stream_uses_persisted_score(fake):
+    first = asyncio.run(collect("Stream Persisted"))
+    movie_controller.score_cache.clear()
+    requests = dict(fake.requests)
+
+    events = asyncio.run(collect("Stream Persisted"))
+
+    assert events == [("result", first[-1][1])]
+    assert fake.requests == requests
+
+
+def test_stream_serves_stale_score_with_low_quota(fake, monkeypatch):
+    previous = {'movie': "Stream Stale", 'score': 7.5}
+    store.save_score("stream stale", previous)
+    monkeypatch.setattr(movie_controller, "STORE_SCORE_TTL", -1)
+    monkeypatch.setattr(quota, "is_low", lambda: True)
+
+    events = asyncio.run(collect("Stream Stale"))
+
+    assert [event for event, _ in events] == ["result"]
+    assert events[0][1]['score'] == 7.5
+    assert fake.requests == {"search": 0, "commentThreads": 0}
+
+
+def test_concurrent_streams_share_analysis(fake):
+    async def run():
+        return await asyncio.gather(
+            collect("Stream Shared"),
+            collect("Stream Shared"),
+            movie_controller.MovieController().get_score(Movie(name="Stream Shared"))
+        )
+
+    first, second, (score, _) = asyncio.run(run())
+
+    assert "partial" in [event for event, _ in first]
+    assert second == [("result", first[-1][1])]
+    assert score == first[-1][1]
+    assert fake.requests["search"] == 1
+    assert fake.requests["commentThreads"] == 2
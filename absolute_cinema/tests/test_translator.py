@@ -0,0 +1,81 @@
+"""
+Testes da tradução em lote (internals.translator) e da seleção dos textos
+traduzidos na análise
+"""
+import asyncio
+import pytest
+from absolute_cinema.internals import translator
+from absolute_cinema.internals.translator import StubBackend, set_backend, translate_batch, translate_to_english
+from absolute_cinema.controllers.movie import MovieController
+
+
+class UpperBackend(StubBackend):
+    """Traduz para maiúsculas, registrando os textos enviados"""
+
+    def __init__(self):
+        self.calls = []
+
+    def translate(self, texts: list, target: str) -> list:
+        self.calls.append(list(texts))
+        return [text.upper() for text in texts]
+
+
+class FailingBackend(StubBackend):
+    def translate(self, texts: list, target: str) -> list:
+        raise RuntimeError("backend fora do ar")
+
+
+@pytest.fixture
+def backend():
+    original = translator._backend
+    backend = UpperBackend()
+    set_backend(backend)
+    yield backend
+    set_backend(original)
+
+
+def test_only_foreign_texts_are_translated(backend):
+    texts = ["this is english", "isto é português", "ok"]
+    translated = asyncio.run(MovieController()._translate_foreign(texts, ["en", "pt", "und"]))
+
+    assert translated == ["this is english", "ISTO É PORTUGUÊS", "ok"]
+    assert backend.calls == [["isto é português"]]
+
+
+def test_repeated_and_cached_texts(backend):
+    texts = ["memória um", "memória dois", "memória um"]
+
+    assert asyncio.run(translate_batch(texts)) == ["MEMÓRIA UM", "MEMÓRIA DOIS", "MEMÓRIA UM"]
+    assert asyncio.run(translate_batch(texts[:2])) == ["MEMÓRIA UM", "MEMÓRIA DOIS"]
+    assert backend.calls == [["memória um", "memória dois"]]
+    assert translator.stats()["hits"] == 2
+
+
+def test_disk_cache_survives_backend_change(backend):
+    asyncio.run(translate_batch(["disco um", "disco dois"]))
+
+    # Trocar o backend limpa o cache em memória; o SQLite continua valendo
+    other = UpperBackend()
+    set_backend(other)
+
+    assert asyncio.run(translate_batch(["disco um", "disco três"])) == ["DISCO UM", "DISCO TRÊS"]
+    assert asyncio.run(translate_to_english("disco dois")) == "DISCO DOIS"
+    assert other.calls == [["disco três"]]
+
+
+def test_failed_batch_keeps_original_text(backend):
+    set_backend(FailingBackend())
+    assert asyncio.run(translate_batch(["falha"])) == ["falha"]
+
+    set_backend(backend)
+    assert asyncio.run(translate_to_english("falha")) == "FALHA"
+
+
+def test_concurrency_limit_across_event_loops(backend, monkeypatch):
+    monkeypatch.setattr(translator, "TRANSLATION_BATCH_SIZE", 1)
+    monkeypatch.setattr(translator, "TRANSLATION_CONCURRENCY", 1)
+
+    for run in range(2):
+        texts = [f"loop {run} texto {i}" for i in range(3)]
+        assert asyncio.run(translate_batch(texts)) == [text.upper() for text in texts]
+    assert len(backend.calls) == 6
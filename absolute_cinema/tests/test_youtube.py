@@ -0,0 +1,142 @@
+"""
+Testes do cliente da API do YouTube (services.youtube)
+
+As chamadas vão para um httpx.MockTransport: respostas de erro montadas
+em cada teste ou a API simulada de benchmarks.fake_youtube.
+"""
+import asyncio
+import httpx
+import pytest
+from benchmarks.fake_youtube import FakeYouTube, NEWEST, BASE_URL
+from absolute_cinema.services import youtube
+from absolute_cinema.services.youtube import (
+    CommentsDisabledError, QuotaExceededError, VideoNotFoundError, YouTubeAPIError,
+    get_comments, search_video
+)
+from absolute_cinema.internals.comments import format_published
+from absolute_cinema.internals.quota import quota
+from absolute_cinema.controllers.movie import MovieController
+
+
+def error_response(status_code: int, reason: str) -> httpx.Response:
+    """Resposta de erro no formato da YouTube Data API"""
+    return httpx.Response(status_code, json={
+        "error": {"code": status_code, "message": reason, "errors": [{"reason": reason}]}
+    })
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Instala um handler (request -> response) como API do YouTube"""
+    def install(handler):
+        monkeypatch.setattr(youtube, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url=BASE_URL))
+    return install
+
+
+@pytest.fixture
+def fake(api):
+    """API do YouTube simulada, com 250 comentários por vídeo"""
+    fake = FakeYouTube(comments_per_video=250, latency=0)
+    calls = []
+
+    def handle(request):
+        calls.append(dict(request.url.params))
+        return fake.handle(request)
+
+    api(handle)
+    fake.calls = calls
+    return fake
+
+
+def test_quota_exceeded(api):
+    api(lambda request: error_response(403, "quotaExceeded"))
+    with pytest.raises(QuotaExceededError):
+        asyncio.run(get_comments("video"))
+
+
+def test_comments_disabled(api):
+    # O YouTube também responde 403, mas não é falta de quota
+    api(lambda request: error_response(403, "commentsDisabled"))
+    with pytest.raises(CommentsDisabledError):
+        asyncio.run(get_comments("video"))
+
+
+@pytest.mark.parametrize("status_code", [400, 404])
+def test_video_not_found(api, status_code):
+    api(lambda request: error_response(status_code, "videoNotFound"))
+    with pytest.raises(VideoNotFoundError):
+        asyncio.run(get_comments("video"))
+
+
+def test_other_errors(api):
+    api(lambda request: error_response(500, "backendError"))
+    with pytest.raises(YouTubeAPIError) as error:
+        asyncio.run(get_comments("video"))
+    assert type(error.value) is YouTubeAPIError
+
+
+def test_search_quota_exceeded(api):
+    api(lambda request: error_response(403, "quotaExceeded"))
+    with pytest.raises(QuotaExceededError):
+        asyncio.run(search_video("Inception"))
+
+
+def test_search_without_results(api):
+    api(lambda request: httpx.Response(200, json={"items": []}))
+    with pytest.raises(VideoNotFoundError):
+        asyncio.run(search_video("Inception"))
+
+
+def test_pagination(fake):
+    comments = asyncio.run(get_comments("video", max_results=250))
+
+    assert len(comments) == 250
+    assert [call.get("pageToken") for call in fake.calls] == [None, "100", "200"]
+    assert [call["maxResults"] for call in fake.calls] == ["100", "100", "50"]
+
+
+def test_pagination_stops_at_max_results(fake):
+    comments = asyncio.run(get_comments("video", max_results=150))
+
+    assert len(comments) == 150
+    assert [call["maxResults"] for call in fake.calls] == ["100", "50"]
+
+
+def test_pagination_stops_without_next_page(fake):
+    fake.comments_per_video = 30
+    comments = asyncio.run(get_comments("video", max_results=150))
+
+    assert len(comments) == 30
+    assert len(fake.calls) == 1
+
+
+def test_since_cutoff(fake):
+    # O comentário de posição i foi publicado i minutos antes de NEWEST
+    since = format_published(int(NEWEST.timestamp()) - 120 * 60)
+    comments = asyncio.run(get_comments("video", max_results=250, order="time", since=since))
+
+    assert len(comments) == 120
+    assert min(comments.published) > int(NEWEST.timestamp()) - 120 * 60
+    # A segunda página já alcança `since`: a terceira não é buscada
+    assert len(fake.calls) == 2
+    assert all(call["order"] == "time" for call in fake.calls)
+
+
+def test_quota_planned_once_per_fetch(fake, monkeypatch):
+    planned = []
+
+    def plan_max_results(max_results):
+        planned.append(max_results)
+        return 100
+
+    monkeypatch.setattr(quota, "plan_max_results", plan_max_results)
+
+    async def run():
+        return [page async for page in MovieController()._comment_pages("planned", max_results=250)]
+
+    pages = asyncio.run(run())
+
+    # A redução fica no controller; o cliente só busca o que foi pedido
+    assert planned == [250]
+    assert sum(len(page) for page in pages) == 100
+    assert [call["maxResults"] for call in fake.calls] == ["100"]